@@ -0,0 +1,78 @@
+# benchmarks/bench_async_database.py
+"""
+Throughput and latency of AsyncDatabase under many simultaneous clients.
+Each client loops over a mix of history reads, stats reads and session commits.
+
+Usage: python benchmarks/bench_async_database.py [--clients 1,8,32,128] [--readers 1,4] [--write-share F]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bench_storage_profiles import build_database
+from core.connection import configure_database, close_database
+from core.async_database import AsyncDatabase
+
+async def client(db, rng, deadline, latencies, counter, write_share):
+    """Issue requests until the deadline, recording each latency"""
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        roll = rng.random()
+        if roll < write_share:
+            start_time = time.time() + counter[0]
+            counter[0] += 1
+            await db.commit_session({
+                'subject': 'Guitar', 'start_time': start_time, 'end_time': start_time + 600,
+                'duration_seconds': 600, 'base_exp': 6000, 'bonus_exp': 0, 'total_exp': 6000, 'streak_days': 1,
+            })
+        elif roll < write_share + (1 - write_share) / 2:
+            await db.get_session_page("Guitar", page_size=50)
+        else:
+            await db.get_total_stats()
+        latencies.append(time.perf_counter() - started)
+
+
+async def measure(clients, readers, seconds, write_share):
+    """Return (requests per second, p50 ms, p95 ms)"""
+    latencies = []
+    counter = [0]
+    async with AsyncDatabase(readers=readers) as db:
+        deadline = time.perf_counter() + seconds
+        await asyncio.gather(*(client(db, random.Random(n), deadline, latencies, counter, write_share)
+                               for n in range(clients)))
+    latencies.sort()
+    return (len(latencies) / seconds,
+            latencies[len(latencies) // 2] * 1000,
+            latencies[int(len(latencies) * 0.95)] * 1000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", default="1,8,32,128")
+    parser.add_argument("--readers", default="1,4")
+    parser.add_argument("--sessions", type=int, default=200_000, help="Sessions in the test database")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Duration of each run")
+    parser.add_argument("--write-share", type=float, default=0.1, help="Fraction of requests that commit a session")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "bench.db")
+        build_database(db_path, args.sessions)
+        configure_database(db_path)
+
+        print(f"{'readers':>7} {'clients':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8}")
+        for readers in (int(value) for value in args.readers.split(",")):
+            for clients in (int(value) for value in args.clients.split(",")):
+                rate, p50, p95 = asyncio.run(measure(clients, readers, args.seconds, args.write_share))
+                print(f"{readers:>7} {clients:>7} {rate:>9,.0f} {p50:>8.2f} {p95:>8.2f}")
+        close_database()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# benchmarks/bench_cli.py
+"""
+Wall time of CLI commands, each in a fresh interpreter as a script or cron
+job would run them, against just importing the GUI.
+
+Usage: python benchmarks/bench_cli.py [--runs 10] [--sessions 100000]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bench_storage_profiles import build_database, SUBJECTS
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+CLI = os.path.join(ROOT, "cli.py")
+
+
+def median_wall_time(command, cwd, runs):
+    """Median seconds to run command to completion"""
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, cwd=cwd, check=True, stdout=subprocess.DEVNULL,
+                       env=dict(os.environ, QT_QPA_PLATFORM="offscreen"))
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--sessions", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # The CLI and the GUI use data/exp_farm.db under the working directory
+        os.mkdir(os.path.join(temp_dir, "data"))
+        build_database(os.path.join(temp_dir, "data", "exp_farm.db"), args.sessions)
+
+        commands = {
+            "python (empty)": [sys.executable, "-c", "pass"],
+            "cli list": [sys.executable, CLI, "list"],
+            "cli stats": [sys.executable, CLI, "stats"],
+            "cli history": [sys.executable, CLI, "history", SUBJECTS[0], "--limit", "20"],
+            "cli log": [sys.executable, CLI, "log", SUBJECTS[0], "--minutes", "1", "--start", "0"],
+            "GUI imports": [sys.executable, "-c", f"import sys; sys.path.insert(0, {ROOT!r}); "
+                                                  "import PyQt6.QtWidgets, ui.main_window"],
+        }
+        print(f"median of {args.runs} runs, {args.sessions:,} sessions")
+        for label, command in commands.items():
+            print(f"{label:<16} {median_wall_time(command, temp_dir, args.runs) * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
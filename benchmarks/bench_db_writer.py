@@ -0,0 +1,112 @@
+# benchmarks/bench_db_writer.py
+"""
+Measure how long the GUI thread stalls while sessions are committed, with the
+commit run inline versus on the background DatabaseWriter. Another connection
+holds the write lock for a while to simulate a slow or busy disk.
+
+Usage: python benchmarks/bench_db_writer.py [--sessions N] [--lock-ms N]
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from core.connection import configure_database, close_database
+from core.database import init_database, save_subject, commit_session
+from data.models import Subject
+from ui.db_writer import DatabaseWriter
+
+FRAME_MS = 16
+
+
+def session_result(index):
+    start_time = 1_700_000_000.0 + index * 1000
+    return {'subject': 'Bench', 'start_time': start_time, 'end_time': start_time + 600,
+            'duration_seconds': 600, 'base_exp': 6000, 'bonus_exp': 0, 'total_exp': 6000, 'streak_days': 1}
+
+
+def hold_write_lock(db_path, seconds):
+    """Keep the database write-locked from another connection for a while"""
+    connection = sqlite3.connect(db_path, isolation_level=None)
+    connection.execute("BEGIN IMMEDIATE")
+    time.sleep(seconds)
+    connection.execute("COMMIT")
+    connection.close()
+
+
+def run(db_path, sessions, lock_seconds, use_writer):
+    """Commit sessions once per frame while a frame timer records the gaps between ticks"""
+    gaps = []
+    last_tick = [time.perf_counter()]
+    done = [0]
+    writer = DatabaseWriter()
+    writer.start()
+    loop = QEventLoop()
+
+    def on_frame():
+        now = time.perf_counter()
+        gaps.append(now - last_tick[0])
+        last_tick[0] = now
+
+    def on_committed(_):
+        done[0] += 1
+        if done[0] == sessions:
+            loop.quit()
+
+    def commit_next(index=[0]):
+        if index[0] >= sessions:
+            return
+        result = session_result(index[0] + (sessions if use_writer else 0))
+        index[0] += 1
+        if use_writer:
+            writer.submit(commit_session, result, on_done=on_committed)
+        else:
+            commit_session(result)
+            on_committed(None)
+
+    frame_timer = QTimer()
+    frame_timer.timeout.connect(on_frame)
+    frame_timer.start(FRAME_MS)
+    commit_timer = QTimer()
+    commit_timer.timeout.connect(commit_next)
+    commit_timer.start(FRAME_MS)
+
+    locker = threading.Thread(target=hold_write_lock, args=(db_path, lock_seconds))
+    locker.start()
+    loop.exec()
+    locker.join()
+    frame_timer.stop()
+    commit_timer.stop()
+    writer.stop()
+    return max(gaps) * 1000, sum(gaps) / len(gaps) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--lock-ms", type=int, default=500)
+    args = parser.parse_args()
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "bench.db")
+        configure_database(db_path, profile="durable")
+        init_database()
+        save_subject(Subject("Bench"))
+
+        for label, use_writer in (("inline commit", False), ("DatabaseWriter", True)):
+            worst, average = run(db_path, args.sessions, args.lock_ms / 1000, use_writer)
+            print(f"{label:<15} worst frame {worst:7.1f} ms   average frame {average:6.1f} ms")
+        close_database()
+
+
+if __name__ == "__main__":
+    main()
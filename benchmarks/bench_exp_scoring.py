@@ -0,0 +1,53 @@
+# benchmarks/bench_exp_scoring.py
+"""
+Compare scoring throughput of the scalar EXP functions against the numpy batch API,
+and check both give identical results.
+
+Usage: python benchmarks/bench_exp_scoring.py [--sessions N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from core.exp_engine import calculate_base_exp, apply_streak_bonus, score_sessions_batch
+
+
+def score_scalar(durations, streaks):
+    """Score sessions one at a time, the way the app does"""
+    totals = []
+    for seconds, streak_days in zip(durations, streaks):
+        totals.append(apply_streak_bonus(calculate_base_exp(seconds), streak_days))
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    durations = rng.integers(1, 4 * 3600, args.sessions)
+    streaks = rng.integers(0, 100, args.sessions)
+    duration_list, streak_list = durations.tolist(), streaks.tolist()
+
+    started = time.perf_counter()
+    expected = score_scalar(duration_list, streak_list)
+    scalar_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    _, _, totals = score_sessions_batch(durations, streaks)
+    batch_seconds = time.perf_counter() - started
+
+    assert totals.tolist() == expected, "batch scoring differs from the scalar functions"
+    print(f"scalar loop: {args.sessions / scalar_seconds:>14,.0f} sessions/s")
+    print(f"numpy batch: {args.sessions / batch_seconds:>14,.0f} sessions/s")
+    print(f"speed-up:    {scalar_seconds / batch_seconds:>14.1f}x (results identical)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# benchmarks/bench_export.py
+"""
+Time the streaming exporter on a synthetic database and report peak memory.
+
+Usage: python benchmarks/bench_export.py [--sessions N] [--format csv|jsonl] [--gzip]
+"""
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bench_storage_profiles import build_database
+from core.connection import configure_database, close_database
+from core.exporter import export_sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "bench.db")
+        build_database(db_path, args.sessions)
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+        # The durable profile does not mmap, so RSS reflects the exporter itself
+        configure_database(db_path, profile="durable")
+        out_path = os.path.join(temp_dir, f"sessions.{args.format}" + (".gz" if args.gzip else ""))
+        report = export_sessions(out_path, args.format, compress=args.gzip, chunk_size=args.chunk_size)
+        size_mib = os.path.getsize(out_path) / 1024 / 1024
+        close_database()
+
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"exported {report['rows']:,} rows in {report['seconds']:.2f}s "
+          f"({report['rows_per_second']:,} rows/s, {size_mib:.1f} MiB)")
+    print(f"peak RSS before export: {rss_before:.0f} MiB, after: {rss_after:.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# benchmarks/bench_heatmap.py
+"""
+Offscreen timing of the activity heatmap over ten years of days: one QFrame
+per cell against ActivityHeatmap painting from an array, for building and
+painting the whole calendar and for recolouring one day after a session.
+
+Usage: python benchmarks/bench_heatmap.py [--years 10]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtGui import QImage, QPainter
+from PyQt6.QtWidgets import QApplication, QFrame, QGridLayout, QWidget
+
+from ui.components.activity_heatmap import ActivityHeatmap, build_day_values
+
+
+def render(widget):
+    """Paint the whole widget into an image, as a first show would"""
+    image = QImage(widget.size(), QImage.Format.Format_ARGB32)
+    painter = QPainter(image)
+    widget.render(painter)
+    painter.end()
+
+
+def bench_frame_grid(app, start_day, values):
+    """One styled QFrame per day in a grid layout"""
+    heatmap = ActivityHeatmap()
+    started = time.perf_counter()
+    grid = QWidget()
+    layout = QGridLayout(grid)
+    layout.setSpacing(heatmap.CELL_GAP)
+    cells = []
+    for index, seconds in enumerate(values):
+        cell = QFrame()
+        cell.setFixedSize(heatmap.CELL_SIZE, heatmap.CELL_SIZE)
+        cell.setStyleSheet(f"background: {heatmap.LEVEL_COLORS[heatmap.level(seconds)]};")
+        layout.addWidget(cell, index % 7, index // 7)
+        cells.append(cell)
+    grid.adjustSize()
+    render(grid)
+    build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    cells[-1].setStyleSheet(f"background: {heatmap.LEVEL_COLORS[4]};")
+    app.processEvents()
+    update = time.perf_counter() - started
+    return build, update
+
+
+def bench_heatmap(app, start_day, values):
+    """ActivityHeatmap: one widget painting the cells in colour batches"""
+    started = time.perf_counter()
+    heatmap = ActivityHeatmap()
+    heatmap.set_days(start_day, values)
+    heatmap.adjustSize()
+    render(heatmap)
+    build = time.perf_counter() - started
+
+    heatmap.show()
+    app.processEvents()
+    started = time.perf_counter()
+    heatmap.add_seconds(start_day + len(values) - 1, 4 * 3600)
+    app.processEvents()
+    update = time.perf_counter() - started
+    heatmap.close()
+    return build, update
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--years", type=int, default=10)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    rng = random.Random(3)
+    today = date.today().toordinal()
+    stats = [(day, 1, rng.choice((0, 0, 600, 2400, 5400, 9000)), 0, 0, 0)
+             for day in range(today - args.years * 365, today)]
+    start_day, values = build_day_values(stats, today)
+    # The last day starts empty so the update changes its colour
+    values[-1] = 0
+
+    print(f"{len(values)} days")
+    print(f"{'approach':<16} {'build + paint':>14} {'recolour one day':>17}")
+    for label, bench in (("QFrame per cell", bench_frame_grid), ("QPainter", bench_heatmap)):
+        build, update = bench(app, start_day, values)
+        print(f"{label:<16} {build * 1000:>11.1f} ms {update * 1000:>14.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# benchmarks/bench_import.py
+"""
+Generate a synthetic session history file and time the bulk importer on it.
+
+Usage: python benchmarks/bench_import.py [--rows N] [--format csv|jsonl] [--batch-size N]
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.connection import configure_database, close_database
+from core.database import init_database
+from core.importer import import_sessions, DEFAULT_BATCH_SIZE
+
+SUBJECTS = ["Study", "Drawing", "Guitar", "Reading", "Blender", "Theory"]
+
+
+def write_history(path, fmt, rows):
+    """Write rows of chronological random sessions"""
+    rng = random.Random(7)
+    start = time.time() - 10 * 365 * 86400
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle) if fmt == "csv" else None
+        if writer:
+            writer.writerow(["subject", "start_time", "duration_seconds", "notes"])
+        for index in range(rows):
+            record = (rng.choice(SUBJECTS), start + index * 300, rng.randint(60, 3 * 3600), "")
+            if writer:
+                writer.writerow(record)
+            else:
+                handle.write(json.dumps(dict(zip(("subject", "start_time", "duration_seconds", "notes"), record))) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--profile", default="fast", help="Storage profile for the target database")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source = os.path.join(temp_dir, f"history.{args.format}")
+        write_history(source, args.format, args.rows)
+
+        configure_database(os.path.join(temp_dir, "bench.db"), profile=args.profile)
+        init_database()
+        report = import_sessions(source, batch_size=args.batch_size)
+        close_database()
+
+    peak_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps(report))
+    print(f"peak RSS: {peak_mib:.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
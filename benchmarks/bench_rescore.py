@@ -0,0 +1,44 @@
+# benchmarks/bench_rescore.py
+"""
+Measure rescoring throughput after a change to the EXP rules, on a temporary
+database of random sessions.
+
+Usage: python benchmarks/bench_rescore.py [--sessions N] [--chunk-size N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bench_storage_profiles import build_database
+from core.connection import configure_database, close_database
+from core.exp_engine import TierTable
+from core.rescoring import rescore_sessions, DEFAULT_CHUNK_SIZE
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=1_000_000)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "bench.db")
+        build_database(db_path, args.sessions)
+        configure_database(db_path)
+
+        # New rates change every session's score
+        changed = rescore_sessions(args.chunk_size, tier_table=TierTable([1800, 3600], [12, 24, 36]))
+        # Scores already current: only reads, no writes
+        unchanged = rescore_sessions(args.chunk_size, tier_table=TierTable([1800, 3600], [12, 24, 36]))
+        close_database()
+
+    for label, report in (("rules changed", changed), ("already current", unchanged)):
+        print(f"{label:<16} {report['rows_updated']:>9} updated  {report['seconds']:7.2f} s  "
+              f"{report['rows_per_second']:>10,} sessions/s")
+
+
+if __name__ == "__main__":
+    main()
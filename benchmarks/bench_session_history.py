@@ -0,0 +1,115 @@
+# benchmarks/bench_session_history.py
+"""
+Offscreen timing of the session history table on a large synthetic history:
+loading every row into a QTableWidget against the paged SessionHistoryView,
+for the first fill, the slowest scroll step and the Python memory held.
+
+Usage: python benchmarks/bench_session_history.py [--sessions 1000000] [--steps 2000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QTableWidget, QTableWidgetItem
+
+from bench_storage_profiles import build_database
+from core.connection import configure_database, close_database
+from core.database import get_session_history
+from ui.views.session_history_view import SessionHistoryView
+from utils.time_helpers import seconds_to_human_readable
+
+
+def timed(action, app):
+    """Seconds taken by action plus the event processing it triggers"""
+    started = time.perf_counter()
+    action()
+    app.processEvents()
+    return time.perf_counter() - started
+
+
+def scroll(app, table, steps):
+    """Slowest of `steps` scroll moves: mostly down a screen, sometimes a jump back up"""
+    rng = random.Random(7)
+    scroll_bar = table.verticalScrollBar()
+    worst = 0.0
+    for _ in range(steps):
+        if rng.random() < 0.1:
+            target = rng.randint(0, scroll_bar.maximum())
+        else:
+            target = min(scroll_bar.value() + scroll_bar.pageStep(), scroll_bar.maximum())
+        worst = max(worst, timed(lambda: scroll_bar.setValue(target), app))
+    return worst
+
+
+def bench_table_widget(app, sessions, steps):
+    """Every row read and formatted up front"""
+    table = QTableWidget()
+    table.resize(750, 400)
+    table.show()
+
+    def populate():
+        rows = get_session_history(limit=sessions)
+        table.setColumnCount(6)
+        table.setRowCount(len(rows))
+        for row, session in enumerate(rows):
+            values = (time.strftime("%Y-%m-%d %H:%M", time.localtime(session[2])), session[1],
+                      seconds_to_human_readable(session[4]), f"{session[7]:,}", str(session[8]), session[9])
+            for column, value in enumerate(values):
+                table.setItem(row, column, QTableWidgetItem(value))
+
+    tracemalloc.start()
+    fill = timed(populate, app)
+    worst = scroll(app, table, steps)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    table.close()
+    return fill, worst, memory
+
+
+def bench_history_view(app, sessions, steps):
+    """SessionHistoryView backed by SessionHistoryModel"""
+    view = SessionHistoryView()
+    view.resize(750, 400)
+    view.show()
+
+    tracemalloc.start()
+    fill = timed(lambda: view.populate_subjects([]), app)
+    worst = scroll(app, view.history_table, steps)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    view.close()
+    return fill, worst, memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=1_000_000)
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--skip-widget", action="store_true", help="only run the paged view")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "bench.db")
+        build_database(db_path, args.sessions)
+        configure_database(db_path)
+
+        benches = [("model/view", bench_history_view)]
+        if not args.skip_widget:
+            benches.insert(0, ("QTableWidget", bench_table_widget))
+        print(f"{'approach':<14} {'first fill':>11} {'worst scroll':>13} {'memory':>10}")
+        for label, bench in benches:
+            fill, worst, memory = bench(app, args.sessions, args.steps)
+            print(f"{label:<14} {fill * 1000:>8.1f} ms {worst * 1000:>10.1f} ms {memory / 2**20:>7.1f} MB")
+        close_database()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# benchmarks/bench_session_start.py
+"""
+Measure SessionManager.start_session latency as the number of subjects grows,
+against the old path that loaded every subject to find one.
+
+Usage: python benchmarks/bench_session_start.py [--iterations N] [--sizes 10,1000,10000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.connection import configure_database, close_database
+from core.database import init_database, get_connection, load_all_subjects, calculate_current_streak
+from core.session_manager import SessionManager
+
+
+def fill_subjects(count):
+    """Insert count subjects named 'Subject 0' .. 'Subject N-1'"""
+    conn = get_connection()
+    conn.execute("BEGIN")
+    conn.executemany("INSERT INTO subjects (name, last_session_date, current_streak) VALUES (?, ?, ?)",
+                     ((f"Subject {n}", time.time() - 86400, n % 30) for n in range(count)))
+    conn.execute("COMMIT")
+
+
+def time_old_start(name, iterations):
+    """Average cost of the old lookup: load every subject, then query the streak separately"""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        subject = next((s for s in load_all_subjects() if s.name == name), None)
+        assert subject is not None
+        calculate_current_streak(name)
+    return (time.perf_counter() - started) / iterations
+
+
+def time_start_session(name, iterations):
+    """Average start_session latency"""
+    manager = SessionManager()
+    elapsed = 0.0
+    for _ in range(iterations):
+        started = time.perf_counter()
+        manager.start_session(name)
+        elapsed += time.perf_counter() - started
+        # Drop the session without saving it
+        manager.current_session = None
+        manager.is_running = False
+    return elapsed / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--sizes", default="10,1000,10000")
+    args = parser.parse_args()
+
+    print(f"{'subjects':>9} {'old lookup':>14} {'start_session':>14}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            configure_database(os.path.join(temp_dir, "bench.db"))
+            init_database()
+            fill_subjects(size)
+            name = f"Subject {size - 1}"
+
+            old_cost = time_old_start(name, args.iterations)
+            new_cost = time_start_session(name, args.iterations)
+            close_database()
+
+        print(f"{size:>9} {old_cost * 1e6:>11.1f} us {new_cost * 1e6:>11.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# benchmarks/bench_startup.py
+"""
+Cold-start timings of the GUI: each run is a fresh interpreter that reports
+how long the imports, building the window, the first paint, the subject data
+and the secondary views took, all measured from the start of the imports.
+
+Usage: python benchmarks/bench_startup.py [--runs 5] [--sessions 100000] [--subjects 1000]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+PHASES = ("import", "construct", "first_paint", "data_ready", "secondary_views")
+
+
+def run_child(db_path):
+    """Start the GUI offscreen, print the phase timings as JSON and exit"""
+    started = time.perf_counter()
+    timings = {}
+
+    def mark(phase):
+        if phase not in timings:
+            timings[phase] = time.perf_counter() - started
+
+    from PyQt6.QtCore import QEvent, QObject, QTimer
+    from PyQt6.QtWidgets import QApplication
+    from core.connection import configure_database
+    from ui.main_window import MainWindow
+    from ui.styles.steam_theme import apply_steam_theme
+    mark("import")
+
+    configure_database(db_path)
+    app = QApplication([])
+    apply_steam_theme(app)
+    window = MainWindow()
+    mark("construct")
+
+    class PaintWatcher(QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Type.Paint:
+                mark("first_paint")
+            return False
+
+    watcher = PaintWatcher()
+    app.installEventFilter(watcher)
+
+    def check_done():
+        if len(timings) == len(PHASES):
+            app.quit()
+
+    window.app_logic.dataReady.connect(lambda: mark("data_ready"))
+    window.secondaryViewsReady.connect(lambda: mark("secondary_views"))
+    poll = QTimer()
+    poll.timeout.connect(check_done)
+    poll.start(1)
+    QTimer.singleShot(10000, app.quit)
+
+    window.show()
+    app.exec()
+    window.app_logic.shutdown()
+    print(json.dumps(timings))
+
+
+def build_startup_database(db_path, sessions, subjects):
+    """A database with a synthetic history and many extra subjects"""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from bench_storage_profiles import build_database
+    from core.connection import ConnectionManager
+
+    build_database(db_path, sessions)
+    manager = ConnectionManager(db_path)
+    with manager.transaction() as conn:
+        conn.executemany("INSERT INTO subjects (name) VALUES (?)",
+                         [(f"Subject {index}",) for index in range(subjects)])
+    manager.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--sessions", type=int, default=100_000)
+    parser.add_argument("--subjects", type=int, default=1000)
+    parser.add_argument("--child", metavar="DB", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    if args.child:
+        run_child(args.child)
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "bench.db")
+        build_startup_database(db_path, args.sessions, args.subjects)
+
+        runs = []
+        for _ in range(args.runs):
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", db_path],
+                                    cwd=temp_dir, capture_output=True, text=True, check=True).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(f"median of {args.runs} cold starts, ms since the imports began")
+    for phase in PHASES:
+        values = [run[phase] for run in runs if phase in run]
+        if values:
+            print(f"{phase:<16} {statistics.median(values) * 1000:>8.1f} ms")
+        else:
+            print(f"{phase:<16} {'n/a':>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# benchmarks/bench_stop_session.py
+"""
+Measure the cost of SessionManager.stop_session against a temporary database,
+and check that no new SQLite connections are opened on the stop path.
+
+Usage: python benchmarks/bench_stop_session.py [--iterations N]
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.connection import configure_database, close_database
+from core.database import init_database, save_subject
+from core.session_manager import SessionManager
+from data.models import Subject
+
+
+def time_raw_connect(db_path, iterations):
+    """Average cost of one connect + PRAGMA + close cycle (the old per-call pattern)"""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        connection = sqlite3.connect(db_path)
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.close()
+    return (time.perf_counter() - started) / iterations
+
+
+def time_stop_sessions(iterations):
+    """Average stop_session latency and number of connections opened while stopping"""
+    manager = SessionManager()
+    connects = 0
+    real_connect = sqlite3.connect
+
+    def counting_connect(*args, **kwargs):
+        nonlocal connects
+        connects += 1
+        return real_connect(*args, **kwargs)
+
+    elapsed = 0.0
+    with patch('sqlite3.connect', counting_connect):
+        for _ in range(iterations):
+            manager.start_session("Bench")
+            started = time.perf_counter()
+            manager.stop_session()
+            elapsed += time.perf_counter() - started
+    return elapsed / iterations, connects
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "bench.db")
+        configure_database(db_path)
+        init_database()
+        save_subject(Subject("Bench"))
+
+        connect_cost = time_raw_connect(db_path, args.iterations)
+        stop_cost, connects = time_stop_sessions(args.iterations)
+        close_database()
+
+    print(f"connect + pragma + close:  {connect_cost * 1e6:9.1f} us")
+    print(f"stop_session:              {stop_cost * 1e6:9.1f} us")
+    print(f"connections opened while stopping {args.iterations} sessions: {connects}")
+
+
+if __name__ == "__main__":
+    main()
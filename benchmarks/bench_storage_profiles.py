@@ -0,0 +1,115 @@
+# benchmarks/bench_storage_profiles.py
+"""
+Compare write throughput and read latency of each storage profile on a
+synthetic database.
+
+Usage: python benchmarks/bench_storage_profiles.py [--sessions N] [--writes N] [--reads N]
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.connection import STORAGE_PROFILES, ConnectionManager, configure_database, close_database
+from core.database import (init_database, commit_session, get_session_history, get_total_stats,
+                           rebuild_daily_rollups)
+from core.exp_engine import calculate_base_exp, apply_streak_bonus
+from utils.time_helpers import local_day_and_offset
+
+SUBJECTS = ["Study", "Drawing", "Guitar", "Reading", "Blender", "Theory"]
+
+
+def build_database(db_path, session_count):
+    """Create a database with the given number of random sessions"""
+    configure_database(db_path, profile="fast")
+    init_database()
+    close_database()
+
+    manager = ConnectionManager(db_path, profile="fast")
+    connection = manager.connection()
+    rng = random.Random(42)
+    start = time.time() - 10 * 365 * 86400
+
+    def rows(subject_ids):
+        for index in range(session_count):
+            duration = rng.randint(60, 3 * 3600)
+            streak = rng.randint(0, 30)
+            base_exp = calculate_base_exp(duration)
+            total_exp = apply_streak_bonus(base_exp, streak)
+            start_time = start + index * 300
+            yield (rng.choice(subject_ids), start_time, start_time + duration, duration,
+                   base_exp, total_exp - base_exp, total_exp, streak, "", *local_day_and_offset(start_time))
+
+    with manager.transaction() as conn:
+        conn.executemany("INSERT INTO subjects (name) VALUES (?)", [(name,) for name in SUBJECTS])
+        subject_ids = [subject_id for (subject_id,) in conn.execute("SELECT id FROM subjects")]
+        conn.executemany("""
+            INSERT INTO sessions
+            (subject_id, start_time, end_time, duration_seconds, base_exp, bonus_exp, total_exp, streak_days, notes,
+             local_day, utc_offset)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows(subject_ids))
+    manager.close()
+
+    # Bring the daily rollups in step with the generated history
+    configure_database(db_path, profile="fast")
+    rebuild_daily_rollups()
+    close_database()
+
+
+def measure_profile(db_path, profile, writes, reads):
+    """Return (commits per second, history latency, stats latency) for one profile"""
+    configure_database(db_path, profile=profile)
+
+    started = time.perf_counter()
+    for index in range(writes):
+        now = time.time()
+        commit_session({
+            'subject': SUBJECTS[index % len(SUBJECTS)], 'start_time': now - 1500, 'end_time': now,
+            'duration_seconds': 1500, 'base_exp': 15000, 'bonus_exp': 0,
+            'total_exp': 15000, 'streak_days': 0, 'notes': '',
+        })
+    commits_per_second = writes / (time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for index in range(reads):
+        get_session_history(SUBJECTS[index % len(SUBJECTS)], limit=20)
+    history_latency = (time.perf_counter() - started) / reads
+
+    started = time.perf_counter()
+    for _ in range(reads):
+        get_total_stats()
+    stats_latency = (time.perf_counter() - started) / reads
+
+    close_database()
+    return commits_per_second, history_latency, stats_latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=1_000_000)
+    parser.add_argument("--writes", type=int, default=500)
+    parser.add_argument("--reads", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        template = os.path.join(temp_dir, "template.db")
+        started = time.perf_counter()
+        build_database(template, args.sessions)
+        print(f"built {args.sessions:,} sessions in {time.perf_counter() - started:.1f}s")
+        print(f"{'profile':<10} {'commits/s':>10} {'history ms':>11} {'stats ms':>9}")
+
+        for profile in STORAGE_PROFILES:
+            db_path = os.path.join(temp_dir, f"{profile}.db")
+            shutil.copyfile(template, db_path)
+            commits, history, stats = measure_profile(db_path, profile, args.writes, args.reads)
+            print(f"{profile:<10} {commits:>10.0f} {history * 1000:>11.2f} {stats * 1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# benchmarks/bench_subject_list.py
+"""
+Offscreen timing of the subject list at 10k and 100k subjects: the old
+QListWidget rebuild against the lazily fetched SubjectListModel, for the
+first fill and for adding one subject afterwards.
+
+Usage: python benchmarks/bench_subject_list.py [--sizes 10000,100000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QListWidget
+
+from data.models import Subject
+from ui.views.subject_list_view import SubjectListView
+
+
+def timed(action, app):
+    """Seconds taken by action plus the event processing it triggers"""
+    started = time.perf_counter()
+    action()
+    app.processEvents()
+    return time.perf_counter() - started
+
+
+def bench_list_widget(app, subjects):
+    """The previous approach: clear and re-add every name on each change"""
+    widget = QListWidget()
+    widget.resize(250, 700)
+    widget.show()
+
+    def populate(items):
+        widget.clear()
+        widget.addItems([subject.name for subject in items])
+
+    fill = timed(lambda: populate(subjects), app)
+    add = timed(lambda: populate(subjects + [Subject("New subject")]), app)
+    widget.close()
+    return fill, add
+
+
+def bench_model_view(app, subjects):
+    """SubjectListView backed by SubjectListModel"""
+    view = SubjectListView()
+    view.resize(250, 700)
+    view.show()
+
+    fill = timed(lambda: view.populate_subjects(subjects), app)
+    add = timed(lambda: view.add_subject(Subject("New subject")), app)
+    view.close()
+    return fill, add
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    print(f"{'subjects':>9} {'approach':<14} {'first fill':>11} {'add one':>10}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        subjects = [Subject(f"Subject {n}", "📚") for n in range(size)]
+        for label, bench in (("QListWidget", bench_list_widget), ("model/view", bench_model_view)):
+            fill, add = bench(app, subjects)
+            print(f"{size:>9} {label:<14} {fill * 1000:>8.1f} ms {add * 1000:>7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# benchmarks/bench_subject_model.py
+"""
+Memory and CPU cost of holding many Subject objects and rendering their level
+and progress, compared with the previous __dict__-based model that recomputed
+levels with a loop on every call.
+
+Usage: python benchmarks/bench_subject_model.py [--subjects N] [--refreshes N]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data.models import Subject, calculate_exp_for_level
+
+
+class LegacySubject:
+    """The previous model: a plain object with uncached, loop-based level maths"""
+
+    def __init__(self, name, icon=None, image_path=None):
+        self.id = None
+        self.name = name
+        self.icon = icon
+        self.image_path = image_path
+        self.total_exp = 0
+        self.total_hours = 0
+        self.last_session_date = None
+        self.current_streak = 0
+
+    def get_current_level(self):
+        if self.total_exp == 0:
+            return 1
+        level = 1
+        while self.total_exp >= calculate_exp_for_level(level + 1):
+            level += 1
+        return level
+
+    def get_exp_for_next_level(self):
+        return calculate_exp_for_level(self.get_current_level() + 1) - self.total_exp
+
+    def get_progress_percentage(self):
+        current_level = self.get_current_level()
+        current_level_exp = calculate_exp_for_level(current_level)
+        next_level_exp = calculate_exp_for_level(current_level + 1)
+        return (self.total_exp - current_level_exp) / (next_level_exp - current_level_exp) * 100
+
+
+def load(cls, totals):
+    """Build one subject per total, the way load_all_subjects does"""
+    subjects = []
+    for index, total in enumerate(totals):
+        subject = cls(f"Subject {index}", "📚")
+        subject.id = index
+        subject.total_exp = total
+        subject.total_hours = total / 36000
+        subject.last_session_date = 1_700_000_000.0
+        subject.current_streak = index % 30
+        subjects.append(subject)
+    return subjects
+
+
+def measure(cls, totals, refreshes):
+    """Return (bytes allocated to hold the subjects, seconds per full UI refresh)"""
+    gc.collect()
+    tracemalloc.start()
+    subjects = load(cls, totals)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    for _ in range(refreshes):
+        for subject in subjects:
+            subject.get_current_level()
+            subject.get_exp_for_next_level()
+            subject.get_progress_percentage()
+    return memory, (time.perf_counter() - started) / refreshes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--subjects", type=int, default=100_000)
+    parser.add_argument("--refreshes", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    totals = [rng.randrange(0, 50_000_000) for _ in range(args.subjects)]
+
+    for label, cls in (("dict + loop", LegacySubject), ("slots + cache", Subject)):
+        memory, refresh = measure(cls, totals, args.refreshes)
+        print(f"{label:<14} {memory / args.subjects:7.0f} B/subject "
+              f"{memory / 2 ** 20:7.1f} MiB total   {refresh * 1000:8.1f} ms per refresh")
+
+
+if __name__ == "__main__":
+    main()
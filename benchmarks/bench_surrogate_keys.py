@@ -0,0 +1,111 @@
+# benchmarks/bench_surrogate_keys.py
+"""
+Compare the old TEXT-keyed schema (schema version 3) with integer subject ids
+(current schema): database file size and common query times.
+
+Usage: python benchmarks/bench_surrogate_keys.py [--sessions N] [--repeat N]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.connection import configure_database, close_database, get_connection_manager
+from core.migrations import MIGRATIONS, run_migrations
+
+SUBJECTS = [
+    "Python Programming", "Blender Sculpting & Retopology", "Classical Guitar Technique",
+    "Music Theory and Ear Training", "Japanese Reading Practice", "Linear Algebra Review",
+]
+
+
+def build(db_path, session_count, text_keys):
+    """Create a database in either layout with the same random sessions"""
+    configure_database(db_path, profile="fast")
+    run_migrations(MIGRATIONS[:3] if text_keys else MIGRATIONS)
+    manager = get_connection_manager()
+    rng = random.Random(3)
+    start = time.time() - 10 * 365 * 86400
+
+    with manager.transaction() as conn:
+        conn.executemany("INSERT INTO subjects (name) VALUES (?)", [(name,) for name in SUBJECTS])
+        if text_keys:
+            keys = SUBJECTS
+            column = "subject_name"
+        else:
+            keys = [subject_id for (subject_id,) in conn.execute("SELECT id FROM subjects ORDER BY id")]
+            column = "subject_id"
+        conn.executemany(f"""
+            INSERT INTO sessions
+            ({column}, start_time, end_time, duration_seconds, base_exp, bonus_exp, total_exp, streak_days, notes)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, '')
+        """, (
+            (rng.choice(keys), start + index * 300, start + index * 300 + 1500, 1500, 15000, 750, 15750, 1)
+            for index in range(session_count)
+        ))
+    conn = manager.connection()
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.execute("VACUUM")
+
+
+def time_query(conn, sql, params_list, repeat):
+    """Average seconds per query over repeat runs of each parameter set"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for params in params_list:
+            conn.execute(sql, params).fetchall()
+    return (time.perf_counter() - started) / (repeat * len(params_list))
+
+
+def measure(text_keys, repeat):
+    """Time history paging, per-subject sums and a rename on the current database"""
+    conn = get_connection_manager().connection()
+    if text_keys:
+        filter_sql = "subject_name = ?"
+        select = "SELECT * FROM sessions"
+    else:
+        filter_sql = "subject_id = (SELECT id FROM subjects WHERE name = ?)"
+        select = ("SELECT sessions.*, subjects.name FROM sessions "
+                  "JOIN subjects ON subjects.id = sessions.subject_id")
+    names = [(name,) for name in SUBJECTS]
+
+    history = time_query(conn, f"{select} WHERE {filter_sql} ORDER BY start_time DESC LIMIT 50", names, repeat)
+    totals = time_query(conn, f"SELECT SUM(total_exp) FROM sessions WHERE {filter_sql}", names, 1)
+
+    started = time.perf_counter()
+    with get_connection_manager().transaction() as tx:
+        if text_keys:
+            # Sessions and rollups repeat the name, so every one of them has to be rewritten
+            tx.execute("INSERT INTO subjects (name) VALUES ('Renamed')")
+            tx.execute("UPDATE sessions SET subject_name = 'Renamed' WHERE subject_name = ?", (SUBJECTS[0],))
+            tx.execute("UPDATE daily_rollups SET subject_name = 'Renamed' WHERE subject_name = ?", (SUBJECTS[0],))
+            tx.execute("DELETE FROM subjects WHERE name = ?", (SUBJECTS[0],))
+        else:
+            tx.execute("UPDATE subjects SET name = 'Renamed' WHERE name = ?", (SUBJECTS[0],))
+    rename = time.perf_counter() - started
+    return history, totals, rename
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'layout':<12} {'file MiB':>9} {'history ms':>11} {'subject sum ms':>15} {'rename ms':>10}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for label, text_keys in (("text keys", True), ("integer ids", False)):
+            db_path = os.path.join(temp_dir, f"{label.replace(' ', '_')}.db")
+            build(db_path, args.sessions, text_keys)
+            size = os.path.getsize(db_path) / 1024 / 1024
+            history, totals, rename = measure(text_keys, args.repeat)
+            close_database()
+            print(f"{label:<12} {size:>9.1f} {history * 1000:>11.3f} {totals * 1000:>15.1f} {rename * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Command-line interface to EXP FARM, for scripts and cron jobs.
+
+Works on the same database as the GUI, through SessionManager, SubjectManager
+and core.database, and never imports PyQt6, so each command starts quickly.
+Every command prints one JSON document on stdout; errors print
+{"error": "..."} and exit with status 1.
+
+A session started with `start` is kept in the database (app_state), so a later
+`stop` from another process finishes it.
+
+Usage:
+    python cli.py start Guitar
+    python cli.py stop [--notes "Scales"]
+    python cli.py log Guitar --minutes 45 [--start 2024-03-01T18:00] [--notes ...]
+    python cli.py list
+    python cli.py stats [Guitar]
+    python cli.py history [Guitar] [--limit 10] [--since ...] [--until ...]
+"""
+import argparse
+import json
+import sys
+import time
+
+from core.database import (init_database, transaction, get_app_state, set_app_state, delete_app_state,
+                           get_total_stats, get_session_page, get_subject_id, count_sessions,
+                           SESSION_COLUMNS)
+from core.session_manager import SessionManager
+from core.subject_manager import SubjectManager
+from utils.time_helpers import minutes_to_seconds, parse_timestamp, seconds_to_human_readable
+
+# app_state key of the session started by `start`
+ACTIVE_SESSION_KEY = "active_session"
+
+
+def subject_to_json(subject):
+    """A subject's stored fields plus its level"""
+    data = subject.to_dict()
+    data['level'] = subject.get_current_level()
+    data['exp_to_next_level'] = subject.get_exp_for_next_level()
+    return data
+
+
+def results_to_json(results):
+    """Session results with the subject's new state as plain data"""
+    data = dict(results)
+    data['subject_state'] = subject_to_json(results['subject_state'])
+    return data
+
+
+def start(args):
+    """Start a session and remember it for `stop`"""
+    manager = SessionManager()
+    # One write transaction, so two concurrent starts cannot both succeed
+    with transaction():
+        active = get_app_state(ACTIVE_SESSION_KEY)
+        if active:
+            raise RuntimeError(f"A session for '{active['subject']}' is already running")
+        started = manager.start_session(args.subject)
+        set_app_state(ACTIVE_SESSION_KEY, manager.current_session)
+    return started
+
+
+def stop(args):
+    """Finish the session started by `start` and save it"""
+    manager = SessionManager()
+    with transaction():
+        active = get_app_state(ACTIVE_SESSION_KEY)
+        if not active:
+            raise RuntimeError("No session is currently running")
+        manager.resume_session(active)
+        # Joins this transaction, so the session is saved and forgotten together
+        results = manager.stop_session(args.notes)
+        delete_app_state(ACTIVE_SESSION_KEY)
+    return results_to_json(results)
+
+
+def log(args):
+    """Save a session that already happened"""
+    duration_seconds = int(minutes_to_seconds(args.minutes))
+    start_time = parse_timestamp(args.start)
+    if start_time is None:
+        # Default: it just ended
+        start_time = time.time() - duration_seconds
+    results = SessionManager().log_past_session(args.subject, start_time, duration_seconds, args.notes)
+    return results_to_json(results)
+
+
+def list_subjects(args):
+    """Every subject with its totals"""
+    return [subject_to_json(subject) for subject in SubjectManager().get_all_subjects()]
+
+
+def stats(args):
+    """Totals of one subject, or of all subjects plus the running session"""
+    if args.subject:
+        subject = SubjectManager().get_subject_by_name(args.subject)
+        if subject is None:
+            raise ValueError(f"Subject '{args.subject}' does not exist")
+        data = subject_to_json(subject)
+        data['total_sessions'] = count_sessions(args.subject)
+        return data
+
+    data = get_total_stats()
+    active = get_app_state(ACTIVE_SESSION_KEY)
+    if active:
+        elapsed = int(time.time() - active['start_time'])
+        active = {'subject': active['subject'], 'start_time': active['start_time'],
+                  'duration_seconds': elapsed, 'duration_human': seconds_to_human_readable(elapsed)}
+    data['active_session'] = active
+    return data
+
+
+def history(args):
+    """Most recent sessions, newest first"""
+    if args.subject and get_subject_id(args.subject) is None:
+        raise ValueError(f"Subject '{args.subject}' does not exist")
+    rows, _ = get_session_page(args.subject, page_size=args.limit,
+                               start_time=parse_timestamp(args.since), end_time=parse_timestamp(args.until))
+    return [dict(zip(SESSION_COLUMNS, row)) for row in rows]
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Log sessions and query EXP FARM stats as JSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("start", help="Start timing a session")
+    command.add_argument("subject")
+    command.set_defaults(handler=start)
+
+    command = commands.add_parser("stop", help="Stop the running session and save it")
+    command.add_argument("--notes", default="")
+    command.set_defaults(handler=stop)
+
+    command = commands.add_parser("log", help="Save a session that already happened")
+    command.add_argument("subject")
+    command.add_argument("--minutes", type=float, required=True, help="Length of the session")
+    command.add_argument("--start", help="When it started (epoch or ISO 8601; default: it just ended)")
+    command.add_argument("--notes", default="")
+    command.set_defaults(handler=log)
+
+    command = commands.add_parser("list", help="List subjects")
+    command.set_defaults(handler=list_subjects)
+
+    command = commands.add_parser("stats", help="Overall or per-subject totals")
+    command.add_argument("subject", nargs="?")
+    command.set_defaults(handler=stats)
+
+    command = commands.add_parser("history", help="Recent sessions, newest first")
+    command.add_argument("subject", nargs="?")
+    command.add_argument("--limit", type=int, default=10)
+    command.add_argument("--since", help="Only sessions starting at or after this time (epoch or ISO 8601)")
+    command.add_argument("--until", help="Only sessions starting before this time (epoch or ISO 8601)")
+    command.set_defaults(handler=history)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        init_database()
+        output = args.handler(args)
+    except (ValueError, RuntimeError) as error:
+        print(json.dumps({'error': str(error)}, ensure_ascii=False))
+        return 1
+    print(json.dumps(output, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+# core/async_database.py
+"""
+asyncio facade over core.database for headless and server use.
+
+Calls run on thread pools so they never block the event loop: reads on a
+bounded pool of reader threads, which query concurrently thanks to WAL, and
+writes on a single writer thread, so they are serialised in submission order
+and never compete for SQLite's write lock. Every thread uses its own
+connection from the process-wide connection manager.
+
+    async with AsyncDatabase() as db:
+        subject = await db.commit_session(result)
+        history = await db.get_session_history("Guitar")
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from . import database
+from .connection import get_connection_manager
+
+DEFAULT_READERS = 4
+
+
+class AsyncDatabase:
+    """Awaitable versions of the core.database operations"""
+
+    def __init__(self, readers=DEFAULT_READERS):
+        """
+        :param readers: Number of reader threads, i.e. how many reads may run at once
+        """
+        if readers < 1:
+            raise ValueError("AsyncDatabase needs at least one reader thread")
+        self.readers = readers
+        self._read_executor = ThreadPoolExecutor(max_workers=readers, thread_name_prefix="db-read")
+        self._write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-write")
+        self._closed = False
+
+    async def _run(self, executor, function, *args, **kwargs):
+        if self._closed:
+            raise RuntimeError("AsyncDatabase has been closed")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(function, *args, **kwargs))
+
+    def _read(self, function, *args, **kwargs):
+        return self._run(self._read_executor, function, *args, **kwargs)
+
+    def _write(self, function, *args, **kwargs):
+        return self._run(self._write_executor, function, *args, **kwargs)
+
+    # --- Sessions ---
+    def commit_session(self, session_result):
+        """Save a session and update its subject; returns the updated Subject"""
+        return self._write(database.commit_session, session_result)
+
+    def save_session(self, session_result):
+        """Save a completed session without touching its subject's totals"""
+        return self._write(database.save_session, session_result)
+
+    def get_session_history(self, subject_name=None, limit=10):
+        """Most recent sessions, newest first"""
+        return self._read(database.get_session_history, subject_name, limit)
+
+    def get_session_page(self, subject_name=None, cursor=None, page_size=50, start_time=None, end_time=None):
+        """One page of history and the cursor for the next page"""
+        return self._read(database.get_session_page, subject_name, cursor, page_size, start_time, end_time)
+
+    def get_session_start_state(self, subject_name):
+        """Subject id, last session date and streak for starting a session"""
+        return self._read(database.get_session_start_state, subject_name)
+
+    # --- Stats ---
+    def get_total_stats(self):
+        """Overall statistics across all subjects"""
+        return self._read(database.get_total_stats)
+
+    def get_daily_stats(self, subject_name=None, start_day=None, end_day=None):
+        """Per-day totals from the daily rollups"""
+        return self._read(database.get_daily_stats, subject_name, start_day, end_day)
+
+    # --- Subjects ---
+    def load_all_subjects(self):
+        """Every subject as a Subject object"""
+        return self._read(database.load_all_subjects)
+
+    def save_subject(self, subject):
+        """Insert or update a subject, filling in subject.id"""
+        return self._write(database.save_subject, subject)
+
+    def rename_subject(self, old_name, new_name):
+        """Rename a subject; raises ValueError if old_name is missing or new_name is taken"""
+        return self._write(database.rename_subject, old_name, new_name)
+
+    def delete_subject(self, subject_name):
+        """Delete a subject with all its sessions"""
+        return self._write(database.delete_subject, subject_name)
+
+    # --- Lifecycle ---
+    async def close(self):
+        """Wait for queued calls, close the pool threads' connections and stop the pools"""
+        if self._closed:
+            return
+        self._closed = True
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._shutdown)
+
+    def _shutdown(self):
+        manager = get_connection_manager()
+        # One task per thread: the barrier keeps each thread on its own task until all have started
+        for executor, workers in ((self._read_executor, self.readers), (self._write_executor, 1)):
+            barrier = threading.Barrier(workers)
+
+            def release():
+                barrier.wait()
+                manager.release()
+
+            for future in [executor.submit(release) for _ in range(workers)]:
+                future.result()
+            executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -0,0 +1,219 @@
+# core/connection.py
+import atexit
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# Pragmas applied to every new connection, in order
+DEFAULT_PRAGMAS = {
+    "foreign_keys": "ON",
+}
+
+# Named storage profiles, applied on top of DEFAULT_PRAGMAS.
+# WAL lets readers proceed while a write is in progress; the profiles differ in
+# how hard each commit syncs to disk and how much memory SQLite may use.
+STORAGE_PROFILES = {
+    # Every commit is fully synced before it returns
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -8000,  # KiB
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+    },
+    # A power loss may drop the last commits, but never corrupts the database
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000,
+        "mmap_size": 64 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+    # No syncing at all; for bulk imports and benchmarks
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -64000,
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+}
+
+DEFAULT_PROFILE = "balanced"
+
+
+def get_profile_pragmas(profile):
+    """
+    Return the pragmas for a named storage profile
+
+    :param profile: Profile name from STORAGE_PROFILES, or None for no profile
+    :return: dict of PRAGMA name -> value
+    """
+    if profile is None:
+        return {}
+    try:
+        return dict(STORAGE_PROFILES[profile])
+    except KeyError:
+        raise ValueError(
+            f"Unknown storage profile '{profile}', expected one of {', '.join(STORAGE_PROFILES)}"
+        ) from None
+
+
+class ConnectionManager:
+    """
+    Owns long-lived SQLite connections for one database file.
+
+    Each thread gets its own connection (SQLite connections must not be used
+    from several threads at once), created on first use and reused for every
+    later call on that thread. All connections are closed by close().
+    """
+
+    def __init__(self, db_path, profile=DEFAULT_PROFILE, pragmas=None, timeout=30.0):
+        """
+        :param db_path: Path of the SQLite database file
+        :param profile: Storage profile name from STORAGE_PROFILES, or None
+        :param pragmas: Optional dict of PRAGMA name -> value, applied on connect
+            after the profile's pragmas
+        :param timeout: Seconds to wait for a locked database
+        """
+        self.db_path = db_path
+        self.profile = profile
+        self.pragmas = dict(DEFAULT_PRAGMAS)
+        self.pragmas.update(get_profile_pragmas(profile))
+        if pragmas:
+            self.pragmas.update(pragmas)
+        self.timeout = timeout
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+        self._closed = False
+
+    def _connect(self):
+        """Open a new connection and apply the configured pragmas"""
+        connection = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            # Connections never leave their thread, but close() may run elsewhere
+            check_same_thread=False,
+            # Transactions are handled explicitly by transaction()
+            isolation_level=None,
+        )
+        for name, value in self.pragmas.items():
+            connection.execute(f"PRAGMA {name} = {value}")
+        return connection
+
+    def connection(self):
+        """Return this thread's connection, opening it on first use"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("Connection manager has been closed")
+                connection = self._connect()
+                self._connections.append(connection)
+            self._local.connection = connection
+            self._local.depth = 0
+        return connection
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run a block inside a transaction on this thread's connection.
+
+        Commits on success and rolls back on error. Nested blocks join the
+        outermost transaction, so only the outermost one commits. The write
+        lock is taken up front (BEGIN IMMEDIATE): a transaction that read first
+        and then tried to write could fail at once with "database is locked"
+        when another connection committed in between, instead of waiting for
+        the busy timeout.
+        """
+        connection = self.connection()
+        if self._local.depth == 0:
+            connection.execute("BEGIN IMMEDIATE")
+        self._local.depth += 1
+        try:
+            yield connection
+        except BaseException:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                connection.execute("ROLLBACK")
+            raise
+        else:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                connection.execute("COMMIT")
+
+    def release(self):
+        """Close the calling thread's connection, if it has one"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            return
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+        connection.close()
+        self._local.connection = None
+
+    def close(self):
+        """Close every connection opened by this manager"""
+        with self._lock:
+            self._closed = True
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_connection_manager():
+    """Return the process-wide connection manager, creating it on first use"""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                # Imported here to avoid a circular import with core.database
+                from .database import get_database_path
+                _manager = ConnectionManager(get_database_path())
+    return _manager
+
+
+def configure_database(db_path=None, profile=DEFAULT_PROFILE, pragmas=None):
+    """
+    Replace the process-wide connection manager.
+
+    :param db_path: Database file to use, or None for the default location
+    :param profile: Storage profile name from STORAGE_PROFILES
+    :param pragmas: Extra pragmas for every connection
+    :return: The new ConnectionManager
+    """
+    global _manager
+    with _manager_lock:
+        if _manager is not None:
+            _manager.close()
+        if db_path is None:
+            from .database import get_database_path
+            db_path = get_database_path()
+        _manager = ConnectionManager(db_path, profile=profile, pragmas=pragmas)
+    return _manager
+
+
+def close_database():
+    """Close the process-wide connection manager, if one was opened"""
+    global _manager
+    with _manager_lock:
+        if _manager is not None:
+            _manager.close()
+            _manager = None
+
+
+atexit.register(close_database)
@@ -1,9 +1,14 @@
 # core/database.py
 from datetime import datetime, timedelta, time
+import json
 import sqlite3
 import os
 from pathlib import Path
 from data.models import Subject
+from utils.time_helpers import timestamp_to_local_day, local_day_and_offset
+from .connection import get_connection_manager
+from .migrations import run_migrations
+from .streak_engine import compute_streaks
 import time
 
 def get_database_path():
@@ -14,65 +19,74 @@ def get_database_path():
 
 
 def get_connection():
-    """Get a connection to the SQLite database"""
-    db_path = get_database_path()
-    connection = sqlite3.connect(db_path)
-    # Enable foreign key constraints
-    connection.execute("PRAGMA foreign_keys = ON")
-    return connection
+    """
+    Get this thread's shared connection to the SQLite database.
+    The connection is owned by the connection manager and must not be closed.
+    """
+    return get_connection_manager().connection()
+
+
+def transaction():
+    """Context manager running a block in one transaction on the shared connection"""
+    return get_connection_manager().transaction()
+
+
+def get_data_version():
+    """
+    Return SQLite's data_version for this thread's connection.
+    It changes whenever another connection commits to the database.
+    """
+    return get_connection().execute("PRAGMA data_version").fetchone()[0]
+
+
+def get_app_state(key, default=None):
+    """Return a JSON value stored in app_state, or default if the key is not set"""
+    row = get_connection().execute("SELECT value FROM app_state WHERE key = ?", (key,)).fetchone()
+    return json.loads(row[0]) if row else default
+
+
+def set_app_state(key, value, conn=None):
+    """Store a JSON-serialisable value in app_state, replacing any previous value"""
+    (conn or get_connection()).execute(
+        "INSERT INTO app_state (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+        (key, json.dumps(value))
+    )
+
+
+def delete_app_state(key, conn=None):
+    """Remove a key from app_state"""
+    (conn or get_connection()).execute("DELETE FROM app_state WHERE key = ?", (key,))
 
 
 def init_database():
-    """Create database tables if they don't exist"""
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    # Create subjects table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS subjects (
-            name TEXT PRIMARY KEY,
-            icon TEXT,
-            image_path TEXT,
-            total_exp REAL DEFAULT 0,
-            total_hours REAL DEFAULT 0.0,
-            last_session_date REAL,
-            current_streak INTEGER DEFAULT 0,
-            created_at REAL DEFAULT (strftime('%s', 'now'))
-        )
-    """)
-
-    # Create sessions table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS sessions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            subject_name TEXT NOT NULL,
-            start_time REAL NOT NULL,
-            end_time REAL NOT NULL,
-            duration_seconds INTEGER NOT NULL,
-            base_exp INTEGER NOT NULL,
-            bonus_exp INTEGER DEFAULT 0,
-            total_exp INTEGER NOT NULL,
-            streak_days INTEGER DEFAULT 0,
-            notes TEXT,
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (subject_name) REFERENCES subjects (name)
-        )
-    """)
+    """Create the database or upgrade it to the latest schema version"""
+    return run_migrations()
 
-    conn.commit()
-    conn.close()
 
+SUBJECT_SELECT = "id, name, icon, image_path, total_exp, total_hours, last_session_date, current_streak"
 
-def save_subject(subject):
-    """Save or update a subject in the database"""
-    conn = get_connection()
-    cursor = conn.cursor()
 
-    cursor.execute("""
-        INSERT OR REPLACE INTO subjects 
-        (name, icon, image_path, total_exp, total_hours, last_session_date, current_streak)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    """, (
+def _subject_from_row(row):
+    """Build a Subject from a row selected with SUBJECT_SELECT"""
+    subject = Subject(name=row[1], icon=row[2], image_path=row[3])
+    subject.id = row[0]
+    subject.total_exp = row[4]
+    subject.total_hours = row[5]
+    subject.last_session_date = row[6]
+    subject.current_streak = row[7]
+    return subject
+
+
+def get_subject_id(subject_name, conn=None):
+    """Return the id of the named subject, or None if it does not exist"""
+    conn = conn or get_connection()
+    row = conn.execute("SELECT id FROM subjects WHERE name = ?", (subject_name,)).fetchone()
+    return row[0] if row else None
+
+
+def save_subject(subject):
+    """Save or update a subject in the database, filling in subject.id for new subjects"""
+    values = (
         subject.name,
         subject.icon,
         subject.image_path,
@@ -80,59 +94,93 @@ def save_subject(subject):
         subject.total_hours,
         subject.last_session_date,
         subject.current_streak
-    ))
-
-    conn.commit()
-    conn.close()
+    )
+    with transaction() as conn:
+        if subject.id is not None:
+            cursor = conn.execute("""
+                UPDATE subjects
+                SET name = ?, icon = ?, image_path = ?, total_exp = ?, total_hours = ?,
+                    last_session_date = ?, current_streak = ?
+                WHERE id = ?
+            """, (*values, subject.id))
+            if cursor.rowcount:
+                return
+
+        # New subjects (or a saved name that already exists) are matched by name
+        conn.execute("""
+            INSERT INTO subjects
+            (name, icon, image_path, total_exp, total_hours, last_session_date, current_streak)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (name) DO UPDATE SET
+                icon = excluded.icon,
+                image_path = excluded.image_path,
+                total_exp = excluded.total_exp,
+                total_hours = excluded.total_hours,
+                last_session_date = excluded.last_session_date,
+                current_streak = excluded.current_streak
+        """, values)
+        subject.id = get_subject_id(subject.name, conn)
 
 
 def load_all_subjects():
     """Load all subjects from database and return as Subject objects"""
     conn = get_connection()
-    cursor = conn.cursor()
+    rows = conn.execute(f"SELECT {SUBJECT_SELECT} FROM subjects ORDER BY id").fetchall()
 
-    cursor.execute("SELECT * FROM subjects")
-    rows = cursor.fetchall()
-    conn.close()
+    return [_subject_from_row(row) for row in rows]
 
-    subjects = []
-    for row in rows:
-        subject = Subject(name=row[0], icon=row[1], image_path=row[2])
-        subject.total_exp = row[3]
-        subject.total_hours = row[4]
-        subject.last_session_date = row[5]
-        subject.current_streak = row[6]
-        subjects.append(subject)
 
-    return subjects
+def rename_subject(old_name, new_name):
+    """
+    Rename a subject. Sessions refer to the subject by id, so only one row changes.
+
+    Raises:
+        ValueError: If old_name does not exist or new_name is already taken
+    """
+    with transaction() as conn:
+        try:
+            cursor = conn.execute("UPDATE subjects SET name = ? WHERE name = ?", (new_name, old_name))
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Subject '{new_name}' already exists") from None
+        if not cursor.rowcount:
+            raise ValueError(f"Subject '{old_name}' does not exist")
 
 
 def delete_subject(subject_name):
     """Delete a subject and all its sessions from database"""
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    # Delete associated sessions first (foreign key constraint)
-    cursor.execute("DELETE FROM sessions WHERE subject_name = ?", (subject_name,))
-
-    # Delete the subject
-    cursor.execute("DELETE FROM subjects WHERE name = ?", (subject_name,))
-
-    conn.commit()
-    conn.close()
-
-
-def save_session(session_result):
-    """Save a completed session to the database"""
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        INSERT INTO sessions 
-        (subject_name, start_time, end_time, duration_seconds, base_exp, bonus_exp, total_exp, streak_days, notes)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    with transaction() as conn:
+        subject_id = get_subject_id(subject_name, conn)
+        if subject_id is None:
+            return
+
+        # Delete associated sessions and rollups first (foreign key constraint)
+        conn.execute("DELETE FROM sessions WHERE subject_id = ?", (subject_id,))
+        conn.execute("DELETE FROM daily_rollups WHERE subject_id = ?", (subject_id,))
+
+        # Delete the subject
+        conn.execute("DELETE FROM subjects WHERE id = ?", (subject_id,))
+
+
+def _resolve_subject_id(conn, session_result):
+    """Return the session's subject id, looking it up by name only if it is not known yet"""
+    subject_id = session_result.get('subject_id')
+    if subject_id is None:
+        subject_id = get_subject_id(session_result['subject'], conn)
+    if subject_id is None:
+        raise ValueError(f"Subject '{session_result['subject']}' does not exist")
+    return subject_id
+
+
+def _insert_session(conn, subject_id, session_result):
+    """Insert one session row using the given connection"""
+    local_day, utc_offset = local_day_and_offset(session_result['start_time'])
+    conn.execute("""
+        INSERT INTO sessions
+        (subject_id, start_time, end_time, duration_seconds, base_exp, bonus_exp, total_exp, streak_days, notes,
+         local_day, utc_offset)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
     """, (
-        session_result['subject'],
+        subject_id,
         session_result.get('start_time'),  # You'll need to add this to session_result
         session_result.get('end_time'),  # You'll need to add this to session_result
         session_result['duration_seconds'],
@@ -140,57 +188,268 @@ def save_session(session_result):
         session_result['bonus_exp'],
         session_result['total_exp'],
         session_result['streak_days'],
-        session_result.get('notes', '')  # Optional notes
+        session_result.get('notes', ''),  # Optional notes
+        local_day,
+        utc_offset
+    ))
+
+    # Add the session to its subject's total for the local day it started on
+    conn.execute("""
+        INSERT INTO daily_rollups
+        (subject_id, day, session_count, total_seconds, base_exp, bonus_exp, total_exp)
+        VALUES (?, ?, 1, ?, ?, ?, ?)
+        ON CONFLICT (subject_id, day) DO UPDATE SET
+            session_count = session_count + 1,
+            total_seconds = total_seconds + excluded.total_seconds,
+            base_exp = base_exp + excluded.base_exp,
+            bonus_exp = bonus_exp + excluded.bonus_exp,
+            total_exp = total_exp + excluded.total_exp
+    """, (
+        subject_id,
+        local_day,
+        session_result['duration_seconds'],
+        session_result['base_exp'],
+        session_result['bonus_exp'],
+        session_result['total_exp']
     ))
 
-    conn.commit()
-    conn.close()
+
+def _update_subject_totals(conn, subject_id, exp_gained, duration_hours, new_streak, session_timestamp):
+    """
+    Add a session's EXP and hours to its subject using the given connection.
+    The last session date and streak only move forward: a session older than
+    the subject's last one leaves them as they are.
+    """
+    conn.execute("""
+        UPDATE subjects
+        SET total_exp = total_exp + ?,
+            total_hours = total_hours + ?,
+            current_streak = CASE WHEN COALESCE(last_session_date, 0) <= ? THEN ? ELSE current_streak END,
+            last_session_date = MAX(COALESCE(last_session_date, 0), ?)
+        WHERE id = ?
+    """, (exp_gained, duration_hours, session_timestamp, new_streak, session_timestamp, subject_id))
+
+
+def _streak_through_day(conn, subject_id, day):
+    """Number of consecutive active days of a subject ending on day, from the daily rollups (0 if day was inactive)"""
+    length = 0
+    cursor = conn.execute(
+        "SELECT day FROM daily_rollups WHERE subject_id = ? AND day <= ? ORDER BY day DESC", (subject_id, day)
+    )
+    try:
+        for (active_day,) in cursor:
+            if active_day != day - length:
+                break
+            length += 1
+    finally:
+        cursor.close()
+    return length
+
+
+def save_session(session_result):
+    """Save a completed session to the database"""
+    with transaction() as conn:
+        _insert_session(conn, _resolve_subject_id(conn, session_result), session_result)
+
+
+def commit_session(session_result):
+    """
+    Save a completed session and update its subject in a single transaction
+
+    The session row, the subject's EXP/hours totals and its streak are written
+    together, so they can never get out of step and the commit syncs once.
+
+    Args:
+        session_result (dict): Session data as returned by SessionManager.stop_session;
+            'subject_id' is used when present, otherwise 'subject' is looked up by name.
+            A session older than the subject's last one (logged after the fact)
+            is added to the totals, and the current streak is recounted in case
+            it filled a gap.
+
+    Returns:
+        Subject: The subject's state after the session was applied
+    """
+    session_timestamp = session_result.get('end_time') or time.time()
+
+    with transaction() as conn:
+        # Raising inside the transaction rolls everything back
+        subject_id = _resolve_subject_id(conn, session_result)
+        _update_subject_totals(
+            conn,
+            subject_id,
+            session_result['total_exp'],
+            session_result['duration_seconds'] / 3600,
+            session_result['streak_days'],
+            session_timestamp
+        )
+        _insert_session(conn, subject_id, session_result)
+        row = conn.execute(f"SELECT {SUBJECT_SELECT} FROM subjects WHERE id = ?", (subject_id,)).fetchone()
+        if row is not None and row[6] > session_timestamp:
+            streak = _streak_through_day(conn, subject_id, timestamp_to_local_day(row[6]))
+            conn.execute("UPDATE subjects SET current_streak = ? WHERE id = ?", (streak, subject_id))
+            row = conn.execute(f"SELECT {SUBJECT_SELECT} FROM subjects WHERE id = ?", (subject_id,)).fetchone()
+
+    if row is None:
+        raise ValueError(f"Subject id {subject_id} does not exist")
+    return _subject_from_row(row)
+
+
+SESSION_COLUMNS = (
+    'id', 'subject_name', 'start_time', 'end_time', 'duration_seconds',
+    'base_exp', 'bonus_exp', 'total_exp', 'streak_days', 'notes', 'created_at'
+)
+
+# Session rows with the subject's name in place of its id, in SESSION_COLUMNS order
+SESSION_SELECT = """
+    sessions.id, subjects.name, sessions.start_time, sessions.end_time, sessions.duration_seconds,
+    sessions.base_exp, sessions.bonus_exp, sessions.total_exp, sessions.streak_days,
+    sessions.notes, sessions.created_at
+    FROM sessions JOIN subjects ON subjects.id = sessions.subject_id
+"""
 
 
 def get_session_history(subject_name=None, limit=10):
     """Get recent session history, optionally filtered by subject"""
-    conn = get_connection()
-    cursor = conn.cursor()
+    rows, _ = get_session_page(subject_name, page_size=limit)
+    return rows
+
+
+def get_session_page(subject_name=None, cursor=None, page_size=50, start_time=None, end_time=None):
+    """
+    Get one page of session history, newest first, optionally filtered by subject
+
+    Pages are addressed by the last row seen rather than an offset, so every
+    page is an index range scan no matter how far back it is.
 
+    Args:
+        subject_name (str): Only return sessions of this subject (default: all)
+        cursor (tuple): (start_time, id) of the last row of the previous page,
+            or None for the first page
+        page_size (int): Maximum number of rows to return
+        start_time (float): Only return sessions starting at or after this epoch time
+        end_time (float): Only return sessions starting before this epoch time
+
+    Returns:
+        tuple: (rows, next_cursor); next_cursor is None after the last page
+    """
+    conditions = []
+    params = []
     if subject_name:
-        cursor.execute("""
-            SELECT * FROM sessions 
-            WHERE subject_name = ? 
-            ORDER BY created_at DESC 
-            LIMIT ?
-        """, (subject_name, limit))
-    else:
-        cursor.execute("""
-            SELECT * FROM sessions 
-            ORDER BY created_at DESC 
-            LIMIT ?
-        """, (limit,))
+        conditions.append("sessions.subject_id = (SELECT id FROM subjects WHERE name = ?)")
+        params.append(subject_name)
+    if start_time is not None:
+        conditions.append("sessions.start_time >= ?")
+        params.append(start_time)
+    if end_time is not None:
+        conditions.append("sessions.start_time < ?")
+        params.append(end_time)
+    if cursor is not None:
+        last_start_time, last_id = cursor
+        # start_time <= ? bounds the index range, the rest skips rows already seen
+        conditions.append("sessions.start_time <= ? AND (sessions.start_time < ? OR sessions.id < ?)")
+        params.extend((last_start_time, last_start_time, last_id))
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    rows = get_connection().execute(f"""
+        SELECT {SESSION_SELECT}
+        {where}
+        ORDER BY sessions.start_time DESC, sessions.id DESC
+        LIMIT ?
+    """, (*params, page_size)).fetchall()
+
+    next_cursor = None
+    if len(rows) == page_size:
+        next_cursor = (rows[-1][2], rows[-1][0])
+    return rows, next_cursor
+
+
+def count_sessions(subject_name=None, start_day=None, end_day=None):
+    """
+    Count sessions from the daily rollups, without scanning the sessions table
 
-    rows = cursor.fetchall()
-    conn.close()
+    Args:
+        subject_name (str): Only count this subject (default: all)
+        start_day (int): First local day number to include
+        end_day (int): Last local day number to include
 
-    return rows
+    Returns:
+        int: Number of sessions
+    """
+    conditions = []
+    params = []
+    if subject_name:
+        conditions.append("subject_id = (SELECT id FROM subjects WHERE name = ?)")
+        params.append(subject_name)
+    if start_day is not None:
+        conditions.append("day >= ?")
+        params.append(start_day)
+    if end_day is not None:
+        conditions.append("day <= ?")
+        params.append(end_day)
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return get_connection().execute(
+        f"SELECT COALESCE(SUM(session_count), 0) FROM daily_rollups {where}", params
+    ).fetchone()[0]
+
+
+def iter_sessions(subject_name=None, start_time=None, end_time=None, chunk_size=5000):
+    """
+    Iterate over sessions in chronological order without loading them all
+
+    Rows are pulled from the cursor chunk_size at a time, so memory use does
+    not depend on the size of the table.
+
+    Args:
+        subject_name (str): Only include this subject (default: all)
+        start_time (float): Only include sessions starting at or after this epoch time
+        end_time (float): Only include sessions starting before this epoch time
+        chunk_size (int): Rows fetched per round trip
+
+    Yields:
+        tuple: Session rows with the columns in SESSION_COLUMNS
+    """
+    conditions = []
+    params = []
+    if subject_name:
+        conditions.append("sessions.subject_id = (SELECT id FROM subjects WHERE name = ?)")
+        params.append(subject_name)
+    if start_time is not None:
+        conditions.append("sessions.start_time >= ?")
+        params.append(start_time)
+    if end_time is not None:
+        conditions.append("sessions.start_time < ?")
+        params.append(end_time)
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    cursor = get_connection().execute(f"""
+        SELECT {SESSION_SELECT}
+        {where}
+        ORDER BY sessions.start_time, sessions.id
+    """, params)
+    try:
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        cursor.close()
 
 
 def get_total_stats():
     """Get overall statistics across all subjects"""
     conn = get_connection()
-    cursor = conn.cursor()
 
-    # Total sessions count
-    cursor.execute("SELECT COUNT(*) FROM sessions")
-    total_sessions = cursor.fetchone()[0]
-
-    # Total hours (sum of all session durations)
-    cursor.execute("SELECT SUM(duration_seconds) FROM sessions")
-    total_seconds = cursor.fetchone()[0] or 0
-    total_hours = total_seconds / 3600
+    # Total sessions count and hours, summed over the daily rollups
+    total_sessions, total_seconds = conn.execute(
+        "SELECT SUM(session_count), SUM(total_seconds) FROM daily_rollups"
+    ).fetchone()
+    total_sessions = total_sessions or 0
+    total_hours = (total_seconds or 0) / 3600
 
     # Current longest streak (this is simplified - you might want more complex streak logic)
-    cursor.execute("SELECT MAX(current_streak) FROM subjects")
-    current_streak = cursor.fetchone()[0] or 0
-
-    conn.close()
+    current_streak = conn.execute("SELECT MAX(current_streak) FROM subjects").fetchone()[0] or 0
 
     return {
         'total_sessions': total_sessions,
@@ -199,68 +458,122 @@ def get_total_stats():
     }
 
 
+def get_daily_stats(subject_name=None, start_day=None, end_day=None):
+    """
+    Get per-day totals from the daily rollups, oldest day first
+
+    Args:
+        subject_name (str): Only include this subject (default: all subjects summed)
+        start_day (int): First local day number to include (see timestamp_to_local_day)
+        end_day (int): Last local day number to include
+
+    Returns:
+        list: (day, session_count, total_seconds, base_exp, bonus_exp, total_exp) tuples
+    """
+    conditions = []
+    params = []
+    if subject_name:
+        conditions.append("subject_id = (SELECT id FROM subjects WHERE name = ?)")
+        params.append(subject_name)
+    if start_day is not None:
+        conditions.append("day >= ?")
+        params.append(start_day)
+    if end_day is not None:
+        conditions.append("day <= ?")
+        params.append(end_day)
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return get_connection().execute(f"""
+        SELECT day, SUM(session_count), SUM(total_seconds),
+               SUM(base_exp), SUM(bonus_exp), SUM(total_exp)
+        FROM daily_rollups
+        {where}
+        GROUP BY day
+        ORDER BY day
+    """, params).fetchall()
+
+
+def rebuild_daily_rollups():
+    """Recompute every daily rollup from the sessions table in one pass"""
+    with transaction() as conn:
+        conn.execute("DELETE FROM daily_rollups")
+        conn.execute(f"""
+            INSERT INTO daily_rollups
+            (subject_id, day, session_count, total_seconds, base_exp, bonus_exp, total_exp)
+            SELECT subject_id, local_day,
+                   COUNT(*), SUM(duration_seconds), SUM(base_exp), SUM(bonus_exp), SUM(total_exp)
+            FROM sessions
+            GROUP BY subject_id, local_day
+        """)
+
+
+def recompute_subject_aggregates():
+    """
+    Recompute every subject's total EXP, hours, last session date and streak
+
+    Totals are summed from the daily rollups, so those must be current
+    (see rebuild_daily_rollups). The streak is the run of consecutive active
+    days ending on the subject's last active day.
+    """
+    with transaction() as conn:
+        conn.execute("""
+            UPDATE subjects SET
+                total_exp = COALESCE((
+                    SELECT SUM(total_exp) FROM daily_rollups WHERE subject_id = subjects.id
+                ), 0),
+                total_hours = COALESCE((
+                    SELECT SUM(total_seconds) FROM daily_rollups WHERE subject_id = subjects.id
+                ), 0) / 3600.0,
+                last_session_date = (
+                    SELECT end_time FROM sessions WHERE subject_id = subjects.id
+                    ORDER BY start_time DESC LIMIT 1
+                )
+        """)
+
+        streaks = compute_streaks(from_rollups=True, conn=conn)
+        conn.execute("UPDATE subjects SET current_streak = 0")
+        conn.executemany(
+            "UPDATE subjects SET current_streak = ? WHERE id = ?",
+            [(streak.current, subject_id) for subject_id, streak in streaks.items()]
+        )
+
+
 def update_subject_after_session(subject_name, exp_gained, duration_hours, new_streak):
     """Update subject's total EXP, hours, and streak after a session"""
-    conn = get_connection()
-    cursor = conn.cursor()
-
     # Use timestamp for last_session_date (consistent with your schema)
     current_timestamp = time.time()
 
-    cursor.execute("""
-        UPDATE subjects 
-        SET total_exp = total_exp + ?,
-            total_hours = total_hours + ?,
-            last_session_date = ?,
-            current_streak = ?
-        WHERE name = ?
-    """, (exp_gained, duration_hours, current_timestamp, new_streak, subject_name))
-
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        subject_id = get_subject_id(subject_name, conn)
+        if subject_id is not None:
+            _update_subject_totals(conn, subject_id, exp_gained, duration_hours, new_streak, current_timestamp)
 
 
-def calculate_current_streak(subject_name):
+def next_streak(last_session_date, stored_streak, today=None):
     """
-    Calculate the current streak for a subject based on session history
+    Work out the streak a new session would run with, from a subject's stored state
+
+    Args:
+        last_session_date: Epoch time of the subject's last session, or None
+        stored_streak (int): The subject's stored current_streak
+        today (date): Day of the new session; defaults to today
 
     Returns:
-        int: Current streak days (0 if no sessions, 1+ for active streaks)
+        int: stored_streak on the same day, stored_streak + 1 the day after, 1 otherwise
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    # Get the subject's current data
-    cursor.execute("SELECT last_session_date, current_streak FROM subjects WHERE name = ?", (subject_name,))
-    result = cursor.fetchone()
-
-    if not result:
-        conn.close()
-        return 0
-
-    last_session_date, stored_streak = result
-
     # If no previous session, this will be day 1
     if not last_session_date:
-        conn.close()
         return 1
 
     try:
         timestamp = float(last_session_date)
     except (ValueError, TypeError):
         # If the date is invalid, we can't calculate a streak. Reset to 1.
-        conn.close()
         return 1
 
-    # Convert stored timestamp to date
-    last_session_datetime = datetime.fromtimestamp(timestamp)
-    last_session_day = last_session_datetime.date()
-    today = datetime.now().date()
-
     # Calculate days between last session and today
-    days_diff = (today - last_session_day).days
-
-    conn.close()
+    today = today or datetime.now().date()
+    days_diff = today.toordinal() - timestamp_to_local_day(timestamp)
 
     # Streak logic:
     if days_diff == 0:
@@ -273,3 +586,45 @@ def calculate_current_streak(subject_name):
         # More than 1 day gap - reset streak
         return 1
 
+
+def get_session_start_state(subject_name, start_time=None):
+    """
+    Everything needed to start a session, in one lookup on the unique subject name index
+
+    Args:
+        subject_name (str): Subject of the session
+        start_time (float): Start of a session that already happened; its streak is
+            counted from the daily rollups up to the day before. Default: a session starting now
+
+    Returns:
+        dict: subject_id, last_session_date and streak_days (the streak the new session
+        runs with), or None if the subject does not exist
+    """
+    conn = get_connection()
+    row = conn.execute(
+        "SELECT id, last_session_date, current_streak FROM subjects WHERE name = ?", (subject_name,)
+    ).fetchone()
+    if row is None:
+        return None
+
+    subject_id, last_session_date, stored_streak = row
+    if start_time is None:
+        streak_days = next_streak(last_session_date, stored_streak)
+    else:
+        streak_days = _streak_through_day(conn, subject_id, timestamp_to_local_day(start_time) - 1) + 1
+    return {
+        'subject_id': subject_id,
+        'last_session_date': last_session_date,
+        'streak_days': streak_days,
+    }
+
+
+def calculate_current_streak(subject_name):
+    """
+    Calculate the current streak for a subject based on session history
+
+    Returns:
+        int: Current streak days (0 if no sessions, 1+ for active streaks)
+    """
+    state = get_session_start_state(subject_name)
+    return state['streak_days'] if state else 0
@@ -1,4 +1,8 @@
 # core/exp_engine.py
+from bisect import bisect_left
+
+from utils.numpy_support import require_numpy
+
 TIER_1_DURATION = 1800  # 30 minutes in seconds
 TIER_2_DURATION = 3600  # 60 minutes in seconds
 
@@ -7,17 +11,76 @@ TIER_2_RATE = 20  # EXP per second
 TIER_3_RATE = 30  # EXP per second
 
 STREAK_BONUS_RATE = 0.05  # 5% per day
-def calculate_base_exp(session_seconds):
+
+
+class TierTable:
+    """
+    Piecewise-linear EXP rates for any number of tiers.
+
+    Tier i covers durations up to breakpoints[i] (inclusive) and earns rates[i]
+    EXP per second; the last tier has no upper bound. The EXP earned at the
+    start of each tier is precomputed, so scoring a duration is a binary search
+    plus one multiply.
+    """
+
+    def __init__(self, breakpoints, rates):
+        """
+        :param breakpoints: Ascending tier upper bounds in seconds, one fewer than rates
+        :param rates: EXP per second for each tier
+        """
+        breakpoints = list(breakpoints)
+        rates = list(rates)
+        if len(rates) != len(breakpoints) + 1:
+            raise ValueError("A tier table needs exactly one more rate than breakpoints")
+        if any(b <= a for a, b in zip([0] + breakpoints, breakpoints)):
+            raise ValueError("Tier breakpoints must be positive and strictly increasing")
+        if any(rate < 0 for rate in rates):
+            raise ValueError("Tier rates cannot be negative")
+
+        self.breakpoints = tuple(breakpoints)
+        self.rates = tuple(rates)
+        self.starts = (0,) + self.breakpoints
+        # EXP earned at the start of each tier
+        cumulative = [0]
+        for index, end in enumerate(self.breakpoints):
+            cumulative.append(cumulative[-1] + (end - self.starts[index]) * rates[index])
+        self.cumulative = tuple(cumulative)
+        self._arrays = None
+
+    def __repr__(self):
+        return f"TierTable(breakpoints={list(self.breakpoints)}, rates={list(self.rates)})"
+
+    def base_exp(self, session_seconds):
+        """EXP for one duration, which must already be validated as a non-negative number"""
+        tier = bisect_left(self.breakpoints, session_seconds)
+        return self.cumulative[tier] + (session_seconds - self.starts[tier]) * self.rates[tier]
+
+    def base_exp_batch(self, seconds):
+        """EXP for a numpy array of validated durations"""
+        np = require_numpy("batch EXP scoring")
+        if self._arrays is None:
+            self._arrays = (np.asarray(self.breakpoints), np.asarray(self.starts),
+                            np.asarray(self.cumulative), np.asarray(self.rates))
+        breakpoints, starts, cumulative, rates = self._arrays
+        tier = np.searchsorted(breakpoints, seconds, side="left")
+        return cumulative[tier] + (seconds - starts[tier]) * rates[tier]
+
+
+DEFAULT_TIER_TABLE = TierTable((TIER_1_DURATION, TIER_2_DURATION), (TIER_1_RATE, TIER_2_RATE, TIER_3_RATE))
+
+
+def calculate_base_exp(session_seconds, tier_table=None):
     """
     Calculate base EXP earned from a session using the tier system
 
-    Tiers:
+    Tiers (DEFAULT_TIER_TABLE):
     - 0-30 min (0-1800s): 10 EXP per second
     - 30-60 min (1800-3600s): 20 EXP per second
     - 60+ min (3600s+): 30 EXP per second
 
     Args:
         session_seconds (int): Total session duration in seconds
+        tier_table (TierTable): Rates to use (default: DEFAULT_TIER_TABLE)
 
     Returns:
         int: Total base EXP earned
@@ -30,16 +93,7 @@ def calculate_base_exp(session_seconds):
     if session_seconds == 0:
         return 0
 
-    # Logic Implementation
-    if session_seconds <= TIER_1_DURATION:
-        return session_seconds * TIER_1_RATE
-    elif session_seconds <= TIER_2_DURATION:
-        return (TIER_1_DURATION * TIER_1_RATE +
-                (session_seconds - TIER_1_DURATION) * TIER_2_RATE)
-    else:
-        return (TIER_1_DURATION * TIER_1_RATE +
-                TIER_1_DURATION * TIER_2_RATE +
-                (session_seconds - TIER_2_DURATION) * TIER_3_RATE)
+    return (tier_table or DEFAULT_TIER_TABLE).base_exp(session_seconds)
 
 
 def apply_streak_bonus(base_exp, streak_days):
@@ -56,20 +110,76 @@ def apply_streak_bonus(base_exp, streak_days):
     Returns:
         int: EXP with streak bonus applied
     """
-    bonus = 1 + 0.05 * streak_days
+    bonus = 1 + STREAK_BONUS_RATE * streak_days
     return round(base_exp * bonus)
 
 
-def calculate_total_exp(session_seconds, streak_days=0):
+def calculate_total_exp(session_seconds, streak_days=0, tier_table=None):
     """
     Calculate total EXP including streak bonuses
 
     Args:
         session_seconds (int): Session duration in seconds
         streak_days (int): Current streak length (default: 0)
+        tier_table (TierTable): Rates to use (default: DEFAULT_TIER_TABLE)
 
     Returns:
         int: Total EXP earned
     """
-    base_exp = calculate_base_exp(session_seconds)
-    return apply_streak_bonus(base_exp, streak_days)
\ No newline at end of file
+    base_exp = calculate_base_exp(session_seconds, tier_table)
+    return apply_streak_bonus(base_exp, streak_days)
+
+
+def calculate_base_exp_batch(session_seconds, tier_table=None):
+    """
+    Vectorized calculate_base_exp over an array of session durations
+
+    Args:
+        session_seconds (array-like): Session durations in seconds
+        tier_table (TierTable): Rates to use (default: DEFAULT_TIER_TABLE)
+
+    Returns:
+        numpy.ndarray: Base EXP per session, equal to calculate_base_exp element-wise
+    """
+    np = require_numpy("batch EXP scoring")
+    seconds = np.asarray(session_seconds)
+    if seconds.dtype.kind not in "iuf":
+        raise TypeError("session_seconds must be numbers")
+    if (seconds < 0).any():
+        raise ValueError("session_seconds cannot be negative")
+
+    return (tier_table or DEFAULT_TIER_TABLE).base_exp_batch(seconds)
+
+
+def apply_streak_bonus_batch(base_exp, streak_days):
+    """
+    Vectorized apply_streak_bonus
+
+    Args:
+        base_exp (array-like): Base EXP per session
+        streak_days (array-like or int): Streak length per session, or one value for all
+
+    Returns:
+        numpy.ndarray: int64 EXP with streak bonus applied, equal to apply_streak_bonus element-wise
+    """
+    np = require_numpy("batch EXP scoring")
+    bonus = 1 + STREAK_BONUS_RATE * np.asarray(streak_days, dtype=np.float64)
+    # np.rint rounds half to even, like round() on a float
+    return np.rint(np.asarray(base_exp) * bonus).astype(np.int64)
+
+
+def score_sessions_batch(session_seconds, streak_days=0, tier_table=None):
+    """
+    Score many sessions at once
+
+    Args:
+        session_seconds (array-like): Session durations in seconds
+        streak_days (array-like or int): Streak length per session, or one value for all
+        tier_table (TierTable): Rates to use (default: DEFAULT_TIER_TABLE)
+
+    Returns:
+        tuple: (base_exp, bonus_exp, total_exp) arrays
+    """
+    base_exp = calculate_base_exp_batch(session_seconds, tier_table)
+    total_exp = apply_streak_bonus_batch(base_exp, streak_days)
+    return base_exp, total_exp - base_exp, total_exp
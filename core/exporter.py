@@ -0,0 +1,154 @@
+# core/exporter.py
+"""
+Streaming export of sessions and subjects to CSV or JSONL.
+
+Sessions are read from the database in fixed-size chunks and written out as
+they arrive, so memory use stays flat whatever the size of the table. Files
+ending in .gz are gzip-compressed. Exported session files can be read back by
+core.importer.
+
+Usage: python -m core.exporter sessions out.csv.gz [--subject NAME] [--since T] [--until T]
+       python -m core.exporter subjects out.jsonl
+"""
+import argparse
+import csv
+import gzip
+import json
+import sys
+import time
+
+from utils.time_helpers import parse_timestamp
+from .database import SESSION_COLUMNS, iter_sessions, get_connection
+
+DEFAULT_CHUNK_SIZE = 5000
+
+SUBJECT_COLUMNS = (
+    'name', 'icon', 'image_path', 'total_exp', 'total_hours', 'last_session_date', 'current_streak'
+)
+
+
+def _open_output(path, compress):
+    """Open a text output, gzip-compressed when asked; '-' means stdout"""
+    if path == "-":
+        if compress:
+            return gzip.open(sys.stdout.buffer, "wt", encoding="utf-8", newline="")
+        return sys.stdout
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def _detect_format(path):
+    """Guess 'csv' or 'jsonl' from an output file name, defaulting to jsonl"""
+    name = str(path).lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    return "csv" if name.endswith(".csv") else "jsonl"
+
+
+def write_rows(rows, columns, path, fmt=None, compress=None):
+    """
+    Write an iterable of row tuples as CSV or JSONL
+    :param rows: Iterable of tuples matching columns
+    :param columns: Column names
+    :param path: Output file, or '-' for stdout
+    :param fmt: 'csv' or 'jsonl'; guessed from the file name when None
+    :param compress: gzip the output; defaults to True for .gz file names
+    :return: int: Number of rows written
+    """
+    fmt = fmt or _detect_format(path)
+    if fmt not in ("csv", "jsonl"):
+        raise ValueError(f"Unsupported format '{fmt}'")
+    if compress is None:
+        compress = str(path).endswith(".gz")
+
+    count = 0
+    handle = _open_output(path, compress)
+    try:
+        if fmt == "csv":
+            writer = csv.writer(handle)
+            writer.writerow(columns)
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        else:
+            for row in rows:
+                handle.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False))
+                handle.write("\n")
+                count += 1
+    finally:
+        if handle is sys.stdout:
+            handle.flush()
+        else:
+            handle.close()
+    return count
+
+
+def export_sessions(path, fmt=None, subject_name=None, start_time=None, end_time=None,
+                    compress=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Stream sessions to a CSV or JSONL file in chronological order
+
+    Args:
+        path: Output file, or '-' for stdout
+        fmt (str): 'csv' or 'jsonl'; guessed from the file name when None
+        subject_name (str): Only export this subject
+        start_time (float): Only export sessions starting at or after this epoch time
+        end_time (float): Only export sessions starting before this epoch time
+        compress (bool): gzip the output; defaults to True for .gz file names
+        chunk_size (int): Rows fetched from the database at a time
+
+    Returns:
+        dict: rows, seconds, rows_per_second
+    """
+    started = time.perf_counter()
+    rows = iter_sessions(subject_name, start_time, end_time, chunk_size)
+    count = write_rows(rows, SESSION_COLUMNS, path, fmt, compress)
+    seconds = time.perf_counter() - started
+    return {
+        'rows': count,
+        'seconds': round(seconds, 3),
+        'rows_per_second': round(count / seconds) if seconds > 0 else 0,
+    }
+
+
+def export_subjects(path, fmt=None, compress=None):
+    """
+    Write every subject to a CSV or JSONL file
+
+    Returns:
+        dict: rows, seconds, rows_per_second
+    """
+    started = time.perf_counter()
+    cursor = get_connection().execute(f"SELECT {', '.join(SUBJECT_COLUMNS)} FROM subjects ORDER BY name")
+    count = write_rows(cursor, SUBJECT_COLUMNS, path, fmt, compress)
+    seconds = time.perf_counter() - started
+    return {
+        'rows': count,
+        'seconds': round(seconds, 3),
+        'rows_per_second': round(count / seconds) if seconds > 0 else 0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export EXP Farm data as CSV or JSONL")
+    parser.add_argument("table", choices=("sessions", "subjects"), help="What to export")
+    parser.add_argument("path", help="Output file ('.gz' to compress, '-' for stdout)")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="Output format (default: from file name)")
+    parser.add_argument("--gzip", action="store_true", default=None, help="Compress the output")
+    parser.add_argument("--subject", help="Only export sessions of this subject")
+    parser.add_argument("--since", help="Only sessions starting at or after this time (epoch or ISO 8601)")
+    parser.add_argument("--until", help="Only sessions starting before this time (epoch or ISO 8601)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows fetched per chunk")
+    args = parser.parse_args(argv)
+
+    if args.table == "sessions":
+        report = export_sessions(args.path, args.format, args.subject, parse_timestamp(args.since),
+                                 parse_timestamp(args.until), args.gzip, args.chunk_size)
+    else:
+        report = export_subjects(args.path, args.format, args.gzip)
+    print(json.dumps(report), file=sys.stderr if args.path == "-" else sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
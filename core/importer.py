@@ -0,0 +1,238 @@
+# core/importer.py
+"""
+Bulk import of historical sessions from CSV or JSONL files.
+
+Each row needs a subject, a start time and either an end time or a duration:
+
+    subject,start_time,end_time,duration_seconds,notes
+    Guitar,2023-01-05T18:00:00,2023-01-05T19:10:00,,scales
+
+Times may be epoch seconds or ISO 8601 strings. Rows are scored with the
+current EXP rules; streaks are carried per subject, so rows should be in
+chronological order for each subject (an explicit streak_days column is used
+as-is). Missing subjects are created.
+
+Usage: python -m core.importer sessions.csv [--format csv|jsonl] [--batch-size N]
+"""
+import argparse
+import csv
+import gzip
+import json
+import time
+
+from utils.time_helpers import timestamp_to_local_day, local_day_and_offset, parse_timestamp
+from .exp_engine import calculate_base_exp, apply_streak_bonus
+from .database import (init_database, transaction, get_connection, rebuild_daily_rollups,
+                       recompute_subject_aggregates)
+
+DEFAULT_BATCH_SIZE = 20000
+
+INSERT_SESSION_SQL = """
+    INSERT INTO sessions
+    (subject_id, start_time, end_time, duration_seconds, base_exp, bonus_exp, total_exp, streak_days, notes,
+     local_day, utc_offset)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _open_text(path):
+    """Open a text file for reading, transparently decompressing .gz files"""
+    if str(path).endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def detect_format(path):
+    """Guess 'csv' or 'jsonl' from a file name"""
+    name = str(path).lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    if name.endswith(".jsonl") or name.endswith(".ndjson"):
+        return "jsonl"
+    if name.endswith(".csv"):
+        return "csv"
+    raise ValueError(f"Cannot tell the format of '{path}', pass csv or jsonl explicitly")
+
+
+def read_rows(path, fmt=None):
+    """
+    Stream raw rows from a CSV or JSONL file as dicts
+    :param path: File to read (may be gzip-compressed)
+    :param fmt: 'csv' or 'jsonl'; guessed from the file name when None
+    :return: Iterator of dicts
+    """
+    fmt = fmt or detect_format(path)
+    with _open_text(path) as handle:
+        if fmt == "csv":
+            yield from csv.DictReader(handle)
+        elif fmt == "jsonl":
+            for line in handle:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        else:
+            raise ValueError(f"Unsupported format '{fmt}'")
+
+
+def parse_row(row):
+    """
+    Normalise one raw row
+    :param row: dict read from the input file
+    :return: tuple (subject, start_time, end_time, duration_seconds, notes, streak_days or None)
+    """
+    subject = (row.get("subject") or row.get("subject_name") or "").strip()
+    if not subject:
+        raise ValueError("missing subject")
+
+    start_time = parse_timestamp(row.get("start_time"))
+    if start_time is None:
+        raise ValueError("missing start_time")
+    end_time = parse_timestamp(row.get("end_time"))
+    duration = row.get("duration_seconds")
+
+    if duration not in (None, ""):
+        duration_seconds = int(float(duration))
+        if end_time is None:
+            end_time = start_time + duration_seconds
+    elif end_time is not None:
+        duration_seconds = int(end_time - start_time)
+    else:
+        raise ValueError("need end_time or duration_seconds")
+    if duration_seconds < 0:
+        raise ValueError("session ends before it starts")
+
+    streak = row.get("streak_days")
+    streak_days = int(streak) if streak not in (None, "") else None
+
+    return subject, start_time, end_time, duration_seconds, row.get("notes") or "", streak_days
+
+
+class _StreakTracker:
+    """Carries each subject's streak forward as its sessions are read in order"""
+
+    def __init__(self, initial_state):
+        # subject id -> (last local day, streak on that day)
+        self.state = dict(initial_state)
+
+    def streak_for(self, subject_id, day):
+        last = self.state.get(subject_id)
+        if last is None:
+            streak = 1
+        else:
+            last_day, last_streak = last
+            if day == last_day:
+                streak = last_streak
+            elif day == last_day + 1:
+                streak = last_streak + 1
+            elif day > last_day:
+                streak = 1
+            else:
+                # Out-of-order row: score it as a fresh streak without rewinding state
+                return 1
+        self.state[subject_id] = (day, streak)
+        return streak
+
+
+def _load_streak_state(conn):
+    """Read each existing subject's last session day and stored streak, keyed by subject id"""
+    state = {}
+    for subject_id, last_session_date, streak in conn.execute(
+            "SELECT id, last_session_date, current_streak FROM subjects"):
+        try:
+            state[subject_id] = (timestamp_to_local_day(float(last_session_date)), streak or 0)
+        except (TypeError, ValueError):
+            continue
+    return state
+
+
+def import_sessions(path, fmt=None, batch_size=DEFAULT_BATCH_SIZE, strict=False):
+    """
+    Import sessions from a CSV or JSONL file
+
+    Rows are inserted with executemany in batches, one transaction per batch.
+    The daily rollups and subject aggregates are rebuilt once at the end.
+
+    Args:
+        path: File to import (.csv, .jsonl, optionally .gz)
+        fmt (str): 'csv' or 'jsonl'; guessed from the file name when None
+        batch_size (int): Rows per transaction
+        strict (bool): Raise on the first invalid row instead of skipping it
+
+    Returns:
+        dict: rows_imported, rows_skipped, subjects_created, seconds, rows_per_second
+    """
+    started = time.perf_counter()
+    conn = get_connection()
+    # Subject names are resolved to ids once; rows only carry the id
+    subject_ids = dict(conn.execute("SELECT name, id FROM subjects"))
+    streaks = _StreakTracker(_load_streak_state(conn))
+
+    imported = skipped = subjects_created = 0
+    batch = []
+
+    def flush():
+        with transaction() as tx:
+            tx.executemany(INSERT_SESSION_SQL, batch)
+
+    for line_number, raw in enumerate(read_rows(path, fmt), start=1):
+        try:
+            subject, start_time, end_time, duration_seconds, notes, streak_days = parse_row(raw)
+        except (ValueError, TypeError) as error:
+            if strict:
+                raise ValueError(f"Row {line_number}: {error}") from error
+            skipped += 1
+            continue
+
+        subject_id = subject_ids.get(subject)
+        if subject_id is None:
+            with transaction() as tx:
+                subject_id = tx.execute("INSERT INTO subjects (name) VALUES (?)", (subject,)).lastrowid
+            subject_ids[subject] = subject_id
+            subjects_created += 1
+
+        local_day, utc_offset = local_day_and_offset(start_time)
+        if streak_days is None:
+            streak_days = streaks.streak_for(subject_id, local_day)
+        base_exp = calculate_base_exp(duration_seconds)
+        total_exp = apply_streak_bonus(base_exp, streak_days)
+
+        batch.append((subject_id, start_time, end_time, duration_seconds,
+                      base_exp, total_exp - base_exp, total_exp, streak_days, notes, local_day, utc_offset))
+        if len(batch) >= batch_size:
+            flush()
+            imported += len(batch)
+            batch.clear()
+
+    if batch:
+        flush()
+        imported += len(batch)
+
+    # One pass over the whole history to bring the aggregates in step
+    rebuild_daily_rollups()
+    recompute_subject_aggregates()
+
+    seconds = time.perf_counter() - started
+    return {
+        'rows_imported': imported,
+        'rows_skipped': skipped,
+        'subjects_created': subjects_created,
+        'seconds': round(seconds, 3),
+        'rows_per_second': round(imported / seconds) if seconds > 0 else 0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import historical sessions into EXP Farm")
+    parser.add_argument("path", help="CSV or JSONL file (optionally .gz)")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="Input format (default: from file name)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per transaction")
+    parser.add_argument("--strict", action="store_true", help="Stop at the first invalid row")
+    args = parser.parse_args(argv)
+
+    init_database()
+    report = import_sessions(args.path, args.format, args.batch_size, args.strict)
+    print(json.dumps(report))
+
+
+if __name__ == "__main__":
+    main()
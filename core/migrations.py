@@ -0,0 +1,360 @@
+# core/migrations.py
+"""
+Versioned schema migrations.
+
+The schema version lives in PRAGMA user_version. Each migration has a schema
+step, run in one transaction, and optionally a batched step for rewriting
+existing rows. The batched step runs one chunk per transaction and records its
+position in migration_state in the same transaction, so a migration over a
+large sessions table never holds one huge transaction and resumes where it
+stopped if interrupted. user_version is bumped when the migration is complete.
+"""
+from .connection import get_connection_manager
+
+DEFAULT_CHUNK_SIZE = 50000
+
+# Local calendar date of an epoch column as date.toordinal(); julianday('0001-01-01') is 1721425.5
+LOCAL_DAY_SQL = "CAST(julianday(date({column}, 'unixepoch', 'localtime')) - 1721424.5 AS INTEGER)"
+
+# Local UTC offset in seconds at an epoch column
+UTC_OFFSET_SQL = ("CAST(round((julianday({column}, 'unixepoch', 'localtime') - julianday({column}, 'unixepoch'))"
+                  " * 86400) AS INTEGER)")
+
+
+class Migration:
+    """One step in the schema history"""
+
+    def __init__(self, version, description, schema, batch=None, finish=None):
+        """
+        :param version: Schema version this migration produces
+        :param description: Short human-readable summary
+        :param schema: Function(conn) applying schema changes, run once in one transaction
+        :param batch: Optional function(conn, position, chunk_size) rewriting one chunk of
+            rows after position; returns the new position, or None when nothing is left
+        :param finish: Optional function(conn) run in the same transaction as the last
+            chunk, e.g. to swap rebuilt tables into place
+        """
+        self.version = version
+        self.description = description
+        self.schema = schema
+        self.batch = batch
+        self.finish = finish
+
+
+def _chunk_end(conn, table, position, chunk_size):
+    """Return the last id of the next chunk of rows after position, or None if there are none"""
+    return conn.execute(
+        f"SELECT MAX(id) FROM (SELECT id FROM {table} WHERE id > ? ORDER BY id LIMIT ?)",
+        (position, chunk_size)
+    ).fetchone()[0]
+
+
+def _create_base_tables(conn):
+    # Create subjects table
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS subjects (
+            name TEXT PRIMARY KEY,
+            icon TEXT,
+            image_path TEXT,
+            total_exp REAL DEFAULT 0,
+            total_hours REAL DEFAULT 0.0,
+            last_session_date REAL,
+            current_streak INTEGER DEFAULT 0,
+            created_at REAL DEFAULT (strftime('%s', 'now'))
+        )
+    """)
+
+    # Create sessions table
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS sessions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            subject_name TEXT NOT NULL,
+            start_time REAL NOT NULL,
+            end_time REAL NOT NULL,
+            duration_seconds INTEGER NOT NULL,
+            base_exp INTEGER NOT NULL,
+            bonus_exp INTEGER DEFAULT 0,
+            total_exp INTEGER NOT NULL,
+            streak_days INTEGER DEFAULT 0,
+            notes TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (subject_name) REFERENCES subjects (name)
+        )
+    """)
+
+
+def _create_history_indexes(conn):
+    # Indexes for per-subject and global history, newest first
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_subject_start ON sessions (subject_name, start_time)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_start ON sessions (start_time)")
+
+
+def _create_daily_rollups(conn):
+    # Per-subject, per-local-day totals, kept in step with sessions
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS daily_rollups (
+            subject_name TEXT NOT NULL,
+            day INTEGER NOT NULL,
+            session_count INTEGER NOT NULL DEFAULT 0,
+            total_seconds INTEGER NOT NULL DEFAULT 0,
+            base_exp INTEGER NOT NULL DEFAULT 0,
+            bonus_exp INTEGER NOT NULL DEFAULT 0,
+            total_exp INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (subject_name, day),
+            FOREIGN KEY (subject_name) REFERENCES subjects (name)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_daily_rollups_day ON daily_rollups (day)")
+    # The backfill below rebuilds every row from history
+    conn.execute("DELETE FROM daily_rollups")
+
+
+def _backfill_daily_rollups(conn, position, chunk_size):
+    last_id = _chunk_end(conn, "sessions", position, chunk_size)
+    if last_id is None:
+        return None
+
+    conn.execute(f"""
+        INSERT INTO daily_rollups
+        (subject_name, day, session_count, total_seconds, base_exp, bonus_exp, total_exp)
+        SELECT subject_name, {LOCAL_DAY_SQL.format(column='start_time')},
+               COUNT(*), SUM(duration_seconds), SUM(base_exp), SUM(bonus_exp), SUM(total_exp)
+        FROM sessions
+        WHERE id > ? AND id <= ?
+        GROUP BY 1, 2
+        ON CONFLICT (subject_name, day) DO UPDATE SET
+            session_count = session_count + excluded.session_count,
+            total_seconds = total_seconds + excluded.total_seconds,
+            base_exp = base_exp + excluded.base_exp,
+            bonus_exp = bonus_exp + excluded.bonus_exp,
+            total_exp = total_exp + excluded.total_exp
+    """, (position, last_id))
+    return last_id
+
+
+def _create_surrogate_key_tables(conn):
+    # Subjects get an integer id; their names stay unique for lookups
+    conn.execute("""
+        CREATE TABLE subjects_v4 (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE,
+            icon TEXT,
+            image_path TEXT,
+            total_exp REAL DEFAULT 0,
+            total_hours REAL DEFAULT 0.0,
+            last_session_date REAL,
+            current_streak INTEGER DEFAULT 0,
+            created_at REAL DEFAULT (strftime('%s', 'now'))
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE sessions_v4 (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            subject_id INTEGER NOT NULL,
+            start_time REAL NOT NULL,
+            end_time REAL NOT NULL,
+            duration_seconds INTEGER NOT NULL,
+            base_exp INTEGER NOT NULL,
+            bonus_exp INTEGER DEFAULT 0,
+            total_exp INTEGER NOT NULL,
+            streak_days INTEGER DEFAULT 0,
+            notes TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (subject_id) REFERENCES subjects_v4 (id)
+        )
+    """)
+    conn.execute("""
+        INSERT INTO subjects_v4
+        (name, icon, image_path, total_exp, total_hours, last_session_date, current_streak, created_at)
+        SELECT name, icon, image_path, total_exp, total_hours, last_session_date, current_streak, created_at
+        FROM subjects
+        ORDER BY rowid
+    """)
+    # Sessions whose subject row went missing keep a (new, empty) subject
+    conn.execute("""
+        INSERT OR IGNORE INTO subjects_v4 (name)
+        SELECT DISTINCT subject_name FROM sessions
+    """)
+
+
+def _copy_sessions_to_surrogate_keys(conn, position, chunk_size):
+    last_id = _chunk_end(conn, "sessions", position, chunk_size)
+    if last_id is None:
+        return None
+
+    conn.execute("""
+        INSERT INTO sessions_v4
+        (id, subject_id, start_time, end_time, duration_seconds, base_exp, bonus_exp,
+         total_exp, streak_days, notes, created_at)
+        SELECT s.id, subj.id, s.start_time, s.end_time, s.duration_seconds, s.base_exp, s.bonus_exp,
+               s.total_exp, s.streak_days, s.notes, s.created_at
+        FROM sessions s
+        JOIN subjects_v4 subj ON subj.name = s.subject_name
+        WHERE s.id > ? AND s.id <= ?
+    """, (position, last_id))
+    return last_id
+
+
+def _swap_in_surrogate_key_tables(conn):
+    conn.execute("""
+        CREATE TABLE daily_rollups_v4 (
+            subject_id INTEGER NOT NULL,
+            day INTEGER NOT NULL,
+            session_count INTEGER NOT NULL DEFAULT 0,
+            total_seconds INTEGER NOT NULL DEFAULT 0,
+            base_exp INTEGER NOT NULL DEFAULT 0,
+            bonus_exp INTEGER NOT NULL DEFAULT 0,
+            total_exp INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (subject_id, day),
+            FOREIGN KEY (subject_id) REFERENCES subjects_v4 (id)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("""
+        INSERT INTO daily_rollups_v4
+        SELECT subj.id, r.day, r.session_count, r.total_seconds, r.base_exp, r.bonus_exp, r.total_exp
+        FROM daily_rollups r
+        JOIN subjects_v4 subj ON subj.name = r.subject_name
+    """)
+
+    conn.execute("DROP TABLE daily_rollups")
+    conn.execute("DROP TABLE sessions")
+    conn.execute("DROP TABLE subjects")
+    # Renaming also rewrites the REFERENCES clauses that point at the renamed tables
+    conn.execute("ALTER TABLE subjects_v4 RENAME TO subjects")
+    conn.execute("ALTER TABLE sessions_v4 RENAME TO sessions")
+    conn.execute("ALTER TABLE daily_rollups_v4 RENAME TO daily_rollups")
+
+    conn.execute("CREATE INDEX idx_sessions_subject_start ON sessions (subject_id, start_time)")
+    conn.execute("CREATE INDEX idx_sessions_start ON sessions (start_time)")
+    conn.execute("CREATE INDEX idx_daily_rollups_day ON daily_rollups (day)")
+
+
+def _create_app_state(conn):
+    conn.execute("""
+        CREATE TABLE app_state (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+    """)
+
+
+def _add_session_local_day(conn):
+    conn.execute("ALTER TABLE sessions ADD COLUMN local_day INTEGER")
+    conn.execute("ALTER TABLE sessions ADD COLUMN utc_offset INTEGER")
+
+
+def _backfill_session_local_day(conn, position, chunk_size):
+    last_id = _chunk_end(conn, "sessions", position, chunk_size)
+    if last_id is None:
+        return None
+
+    conn.execute(f"""
+        UPDATE sessions SET
+            local_day = {LOCAL_DAY_SQL.format(column='start_time')},
+            utc_offset = {UTC_OFFSET_SQL.format(column='start_time')}
+        WHERE id > ? AND id <= ?
+    """, (position, last_id))
+    return last_id
+
+
+def _index_session_local_day(conn):
+    conn.execute("CREATE INDEX idx_sessions_subject_day ON sessions (subject_id, local_day)")
+
+
+MIGRATIONS = [
+    Migration(1, "Create subjects and sessions tables", _create_base_tables),
+    Migration(2, "Index session history by subject and start time", _create_history_indexes),
+    Migration(3, "Add daily rollups", _create_daily_rollups, _backfill_daily_rollups),
+    Migration(4, "Key subjects by integer id", _create_surrogate_key_tables,
+              _copy_sessions_to_surrogate_keys, _swap_in_surrogate_key_tables),
+    Migration(5, "Add key-value app state", _create_app_state),
+    Migration(6, "Store each session's local day and UTC offset", _add_session_local_day,
+              _backfill_session_local_day, _index_session_local_day),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def get_schema_version(conn):
+    """Return the database's current schema version"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _check_foreign_keys(conn, migration):
+    violation = conn.execute("PRAGMA foreign_key_check").fetchone()
+    if violation is not None:
+        raise RuntimeError(
+            f"Migration {migration.version} ({migration.description}) broke a foreign key in '{violation[0]}'"
+        )
+
+
+def run_migrations(migrations=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Bring the database up to the latest schema version
+
+    Foreign keys are switched off while migrating so tables can be rebuilt,
+    and checked before each migration commits.
+
+    Args:
+        migrations (list): Migrations to apply, in version order (default: MIGRATIONS)
+        chunk_size (int): Rows per transaction for batched steps
+
+    Returns:
+        list: Versions that were applied
+    """
+    migrations = MIGRATIONS if migrations is None else migrations
+    manager = get_connection_manager()
+    conn = manager.connection()
+
+    current = get_schema_version(conn)
+    pending = [migration for migration in migrations if migration.version > current]
+    if not pending:
+        return []
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS migration_state (
+            version INTEGER PRIMARY KEY,
+            position INTEGER NOT NULL
+        )
+    """)
+    foreign_keys = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+    conn.execute("PRAGMA foreign_keys = OFF")
+    applied = []
+    try:
+        for migration in pending:
+            with manager.transaction():
+                started = conn.execute(
+                    "SELECT 1 FROM migration_state WHERE version = ?", (migration.version,)
+                ).fetchone()
+                if not started:
+                    migration.schema(conn)
+                    _check_foreign_keys(conn, migration)
+                    if migration.batch is None:
+                        if migration.finish is not None:
+                            migration.finish(conn)
+                            _check_foreign_keys(conn, migration)
+                        conn.execute(f"PRAGMA user_version = {int(migration.version)}")
+                    else:
+                        conn.execute("INSERT INTO migration_state (version, position) VALUES (?, 0)",
+                                     (migration.version,))
+
+            while migration.batch is not None:
+                with manager.transaction():
+                    position = conn.execute(
+                        "SELECT position FROM migration_state WHERE version = ?", (migration.version,)
+                    ).fetchone()[0]
+                    position = migration.batch(conn, position, chunk_size)
+                    if position is None:
+                        if migration.finish is not None:
+                            migration.finish(conn)
+                        _check_foreign_keys(conn, migration)
+                        conn.execute("DELETE FROM migration_state WHERE version = ?", (migration.version,))
+                        conn.execute(f"PRAGMA user_version = {int(migration.version)}")
+                        break
+                    conn.execute("UPDATE migration_state SET position = ? WHERE version = ?",
+                                 (position, migration.version))
+            applied.append(migration.version)
+    finally:
+        if foreign_keys:
+            conn.execute("PRAGMA foreign_keys = ON")
+    return applied
@@ -0,0 +1,124 @@
+# core/rescoring.py
+"""
+Retroactive rescoring of stored sessions with the current EXP rules.
+
+After tier rates or STREAK_BONUS_RATE change, the base/bonus/total EXP stored
+on each session is stale. The rescore walks the sessions table in id order,
+one chunk per transaction, and rewrites only the rows whose scores changed.
+The last rescored id is checkpointed in app_state in the same transaction, so
+an interrupted rescore resumes where it stopped. Daily rollups and subject
+totals are rebuilt at the end.
+
+Usage: python -m core.rescoring [--chunk-size N] [--restart]
+"""
+import argparse
+import json
+import time
+
+from .exp_engine import (calculate_base_exp, apply_streak_bonus, score_sessions_batch,
+                         DEFAULT_TIER_TABLE, STREAK_BONUS_RATE)
+from .database import (init_database, transaction, get_connection, get_app_state, set_app_state,
+                       delete_app_state, rebuild_daily_rollups, recompute_subject_aggregates)
+
+DEFAULT_CHUNK_SIZE = 50000
+
+CHECKPOINT_KEY = "rescore_checkpoint"
+
+UPDATE_SESSION_SQL = "UPDATE sessions SET base_exp = ?, bonus_exp = ?, total_exp = ? WHERE id = ?"
+
+
+def _rules_fingerprint(tier_table):
+    """Identify the scoring rules, so a checkpoint taken under other rules is not resumed"""
+    return f"{tier_table!r} streak_bonus_rate={STREAK_BONUS_RATE!r}"
+
+
+def _score_chunk(rows, tier_table):
+    """
+    Return (base, bonus, total) per row of (id, duration, streak_days, ...)
+    """
+    try:
+        base, bonus, total = score_sessions_batch([row[1] for row in rows], [row[2] for row in rows], tier_table)
+    except ImportError:
+        pass  # No numpy: score one row at a time
+    else:
+        return zip(base.tolist(), bonus.tolist(), total.tolist())
+
+    scores = []
+    for _, duration, streak_days, *_ in rows:
+        base = calculate_base_exp(duration, tier_table)
+        total = apply_streak_bonus(base, streak_days)
+        scores.append((base, total - base, total))
+    return scores
+
+
+def rescore_sessions(chunk_size=DEFAULT_CHUNK_SIZE, tier_table=None, restart=False):
+    """
+    Rescore every session with the current EXP rules and rebuild subject totals
+
+    Args:
+        chunk_size (int): Sessions per transaction
+        tier_table (TierTable): Rates to use (default: DEFAULT_TIER_TABLE)
+        restart (bool): Ignore any checkpoint and start from the first session
+
+    Returns:
+        dict: rows_scanned, rows_updated, resumed_from, seconds, rows_per_second
+    """
+    tier_table = tier_table or DEFAULT_TIER_TABLE
+    rules = _rules_fingerprint(tier_table)
+    checkpoint = None if restart else get_app_state(CHECKPOINT_KEY)
+    position = checkpoint['last_id'] if checkpoint and checkpoint['rules'] == rules else 0
+    resumed_from = position
+
+    started = time.perf_counter()
+    scanned = updated = 0
+    conn = get_connection()
+    while True:
+        with transaction():
+            rows = conn.execute("""
+                SELECT id, duration_seconds, streak_days, base_exp, bonus_exp, total_exp
+                FROM sessions WHERE id > ? ORDER BY id LIMIT ?
+            """, (position, chunk_size)).fetchall()
+            if not rows:
+                break
+
+            changes = [
+                (base, bonus, total, row[0])
+                for row, (base, bonus, total) in zip(rows, _score_chunk(rows, tier_table))
+                if (base, bonus, total) != row[3:]
+            ]
+            conn.executemany(UPDATE_SESSION_SQL, changes)
+
+            position = rows[-1][0]
+            set_app_state(CHECKPOINT_KEY, {'last_id': position, 'rules': rules}, conn)
+        scanned += len(rows)
+        updated += len(changes)
+
+    # The checkpoint stays until the totals are rebuilt, so a crash here only repeats this step
+    rebuild_daily_rollups()
+    recompute_subject_aggregates()
+    with transaction() as conn:
+        delete_app_state(CHECKPOINT_KEY, conn)
+
+    seconds = time.perf_counter() - started
+    return {
+        'rows_scanned': scanned,
+        'rows_updated': updated,
+        'resumed_from': resumed_from,
+        'seconds': round(seconds, 3),
+        'rows_per_second': round(scanned / seconds) if seconds > 0 else 0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rescore stored sessions with the current EXP rules")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Sessions per transaction")
+    parser.add_argument("--restart", action="store_true", help="Ignore any checkpoint from an interrupted run")
+    args = parser.parse_args(argv)
+
+    init_database()
+    report = rescore_sessions(args.chunk_size, restart=args.restart)
+    print(json.dumps(report))
+
+
+if __name__ == "__main__":
+    main()
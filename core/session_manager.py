@@ -1,8 +1,8 @@
 # core/session_manager.py
 import time
 from .exp_engine import calculate_base_exp, apply_streak_bonus
-from utils.time_helpers import seconds_to_human_readable
-from .database import save_session, update_subject_after_session, load_all_subjects, calculate_current_streak
+from utils.time_helpers import seconds_to_human_readable, timestamp_to_local_day
+from .database import commit_session, get_session_start_state
 
 
 class SessionManager:
@@ -16,18 +16,25 @@ class SessionManager:
         if self.is_running:
             raise RuntimeError("You need to stop your current session to start a new one")
 
-        # Check if subject exists
-        subjects = load_all_subjects()
-        if not any(s.name == subject_name for s in subjects):
-            raise ValueError(f"Subject '{subject_name}' does not exist")
+        # Check the subject exists and fetch its id and streak in a single lookup
+        return self.begin_session(subject_name, get_session_start_state(subject_name))
 
-        # Calculate the actual current streak
-        streak_days = calculate_current_streak(subject_name)
+    def begin_session(self, subject_name, state):
+        """
+        Start a new session from a get_session_start_state lookup made elsewhere,
+        e.g. on a background thread, without touching the database
+        """
+        if self.is_running:
+            raise RuntimeError("You need to stop your current session to start a new one")
+        if state is None:
+            raise ValueError(f"Subject '{subject_name}' does not exist")
+        streak_days = state['streak_days']
 
         # Start the session
         start_time = time.time()
         self.current_session = {
             'subject': subject_name,
+            'subject_id': state['subject_id'],
             'start_time': start_time,
             'streak_days': streak_days
         }
@@ -42,16 +49,72 @@ class SessionManager:
 
     def stop_session(self, notes=""):
         """Stop the current session, calculate EXP, and save to database"""
+        results = self.finish_session(notes)
+
+        # Save the session and update the subject's EXP, hours and streak in one transaction
+        results['subject_state'] = commit_session(results)
+
+        return results
+
+    def resume_session(self, session):
+        """
+        Continue a session started elsewhere, e.g. by another process
+        :param session: A current_session dict, as saved after start_session
+        """
+        if self.is_running:
+            raise RuntimeError("You need to stop your current session to start a new one")
+        self.current_session = dict(session)
+        self.is_running = True
+
+    def log_past_session(self, subject_name, start_time, duration_seconds, notes=""):
+        """
+        Score and save a session that already happened, e.g. one that was not timed in the app.
+        Its streak bonus is the streak the subject had on the day it started.
+        """
+        duration_seconds = int(duration_seconds)
+        if duration_seconds <= 0:
+            raise ValueError("Session duration must be positive")
+        end_time = start_time + duration_seconds
+        if end_time > time.time():
+            raise ValueError("A past session cannot end in the future")
+
+        state = get_session_start_state(subject_name, start_time=start_time)
+        if state is None:
+            raise ValueError(f"Subject '{subject_name}' does not exist")
+
+        results = self._score_session({
+            'subject': subject_name,
+            'subject_id': state['subject_id'],
+            'start_time': start_time,
+            'streak_days': state['streak_days'],
+        }, end_time, notes)
+        results['subject_state'] = commit_session(results)
+        return results
+
+    def finish_session(self, notes=""):
+        """
+        Stop the current session and calculate EXP without touching the database.
+        The results are ready for commit_session, e.g. on a background writer.
+        """
         if not self.is_running:
             raise RuntimeError("No session is currently running")
 
+        results = self._score_session(self.current_session, time.time(), notes)
+
+        # Reset session state
+        self.current_session = None
+        self.is_running = False
+
+        return results
+
+    def _score_session(self, session, end_time, notes):
+        """Calculate the EXP of a session ending at end_time and build its results dict"""
         # Calculate session duration
-        end_time = time.time()
-        session_seconds = int(end_time - self.current_session['start_time'])
+        session_seconds = int(end_time - session['start_time'])
 
         # Calculate EXP
         base_exp = calculate_base_exp(session_seconds)
-        total_exp = apply_streak_bonus(base_exp, self.current_session['streak_days'])
+        total_exp = apply_streak_bonus(base_exp, session['streak_days'])
         bonus_exp = total_exp - base_exp
         bonus_percentage = round((bonus_exp / base_exp * 100)) if base_exp > 0 else 0
 
@@ -61,12 +124,13 @@ class SessionManager:
         #     new_streak = streak_before + 1
         # else:
         #     new_streak = streak_before
-        new_streak = self.current_session['streak_days']
+        new_streak = session['streak_days']
 
         # Prepare results
-        results = {
-            'subject': self.current_session['subject'],
-            'start_time': self.current_session['start_time'],
+        return {
+            'subject': session['subject'],
+            'subject_id': session['subject_id'],
+            'start_time': session['start_time'],
             'end_time': end_time,
             'duration_seconds': session_seconds,
             'duration_human': seconds_to_human_readable(session_seconds),
@@ -78,48 +142,21 @@ class SessionManager:
             'notes': notes
         }
 
-        # Save session to database
-        save_session(results)
-
-        # Update subject's total EXP and hours with the new streak
-        update_subject_after_session(
-            self.current_session['subject'],
-            total_exp,
-            session_seconds / 3600,
-            new_streak  # Pass the updated streak
-        )
-
-        # Reset session state
-        self.current_session = None
-        self.is_running = False
-
-        return results
-
     def session_is_on_new_day(self):
         """Check if this session is happening on a new day compared to last session"""
-        from datetime import datetime
+        # Look up the subject's last session date
+        state = get_session_start_state(self.current_session['subject'])
 
-        # Load the subject to get its last session date
-        subjects = load_all_subjects()
-        current_subject = None
-        for subject in subjects:
-            if subject.name == self.current_session['subject']:
-                current_subject = subject
-                break
-
-        if not current_subject or not current_subject.last_session_date:
+        if not state or not state['last_session_date']:
             # No previous session, so this counts as a new day
             return True
         try:
-            timestamp = float(current_subject.last_session_date)
+            timestamp = float(state['last_session_date'])
         except (ValueError, TypeError):
             # If the date is invalid, treat it as the first session.
             return True
-        # Compare session start date with last session date
-        session_start_date = datetime.fromtimestamp(self.current_session['start_time']).date()
-        last_session_date = datetime.fromtimestamp(timestamp).date()
-
-        return session_start_date > last_session_date
+        # Compare session start day with last session day
+        return timestamp_to_local_day(self.current_session['start_time']) > timestamp_to_local_day(timestamp)
 
     def get_session_progress(self):
         """Get current session progress without stopping it"""
@@ -0,0 +1,115 @@
+# core/streak_engine.py
+"""
+Set-based streak calculation from session history.
+
+Sessions are bucketed into local days, and consecutive days are grouped into
+runs with the gaps-and-islands trick: within one subject, day minus its row
+number is constant along a run of consecutive days. One query then yields
+every subject's current streak (the run ending on its last active day, which
+is what subjects.current_streak stores) and its longest streak.
+
+Usage: python -m core.streak_engine [--repair] [--from-rollups]
+"""
+import argparse
+import json
+from collections import namedtuple
+from datetime import date
+
+from .connection import get_connection_manager
+
+Streak = namedtuple("Streak", "subject_id current longest last_day")
+
+_DAYS_FROM_SESSIONS = "SELECT DISTINCT subject_id, local_day AS day FROM sessions"
+_DAYS_FROM_ROLLUPS = "SELECT subject_id, day FROM daily_rollups"
+
+STREAKS_SQL = """
+    WITH days AS ({days}),
+    islands AS (
+        SELECT subject_id, day,
+               day - ROW_NUMBER() OVER (PARTITION BY subject_id ORDER BY day) AS run
+        FROM days
+    ),
+    runs AS (
+        SELECT subject_id, MAX(day) AS end_day, COUNT(*) AS length,
+               ROW_NUMBER() OVER (PARTITION BY subject_id ORDER BY MAX(day) DESC) AS recency
+        FROM islands
+        GROUP BY subject_id, run
+    )
+    SELECT subject_id, MAX(CASE WHEN recency = 1 THEN length END), MAX(length), MAX(end_day)
+    FROM runs
+    GROUP BY subject_id
+"""
+
+
+def compute_streaks(from_rollups=False, conn=None):
+    """
+    Current and longest streak of every subject with at least one session
+
+    Args:
+        from_rollups (bool): Read active days from daily_rollups instead of sessions.
+            Much faster, but only as correct as the rollups.
+        conn: Connection to use (default: this thread's shared connection)
+
+    Returns:
+        dict: subject_id -> Streak(subject_id, current, longest, last_day), where
+        current is the run of consecutive days ending on last_day (a date ordinal)
+    """
+    conn = conn or get_connection_manager().connection()
+    sql = STREAKS_SQL.format(days=_DAYS_FROM_ROLLUPS if from_rollups else _DAYS_FROM_SESSIONS)
+    return {row[0]: Streak(*row) for row in conn.execute(sql)}
+
+
+def active_streak(streak, today=None):
+    """
+    The streak a subject still holds on a given day: its current run if it was
+    active today or yesterday, otherwise 0
+    """
+    today = (today or date.today()).toordinal()
+    return streak.current if streak.last_day >= today - 1 else 0
+
+
+def repair_streaks(from_rollups=False):
+    """
+    Rewrite subjects.current_streak from session history
+
+    Returns:
+        int: Number of subjects whose stored streak was wrong
+    """
+    with get_connection_manager().transaction() as conn:
+        streaks = compute_streaks(from_rollups, conn)
+        stored = conn.execute("SELECT id, current_streak FROM subjects").fetchall()
+        changes = []
+        for subject_id, current_streak in stored:
+            streak = streaks.get(subject_id)
+            correct = streak.current if streak else 0
+            if current_streak != correct:
+                changes.append((correct, subject_id))
+        conn.executemany("UPDATE subjects SET current_streak = ? WHERE id = ?", changes)
+    return len(changes)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compute subject streaks from session history")
+    parser.add_argument("--repair", action="store_true", help="Rewrite stored streaks that are wrong")
+    parser.add_argument("--from-rollups", action="store_true", help="Read active days from the daily rollups")
+    args = parser.parse_args(argv)
+
+    from .database import init_database
+    init_database()
+    if args.repair:
+        print(json.dumps({'subjects_repaired': repair_streaks(args.from_rollups)}))
+        return
+
+    names = dict(get_connection_manager().connection().execute("SELECT id, name FROM subjects"))
+    for streak in compute_streaks(args.from_rollups).values():
+        print(json.dumps({
+            'subject': names[streak.subject_id],
+            'current_streak': streak.current,
+            'active_streak': active_streak(streak),
+            'longest_streak': streak.longest,
+            'last_active_day': date.fromordinal(streak.last_day).isoformat(),
+        }, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
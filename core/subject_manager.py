@@ -1,47 +1,61 @@
 # subject_manager.py
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from .database import save_subject, load_all_subjects, delete_subject as db_delete_subject
+from .database import (save_subject, load_all_subjects, delete_subject as db_delete_subject,
+                       rename_subject as db_rename_subject, get_data_version)
 from data.models import Subject
 
 
 class SubjectManager:
-    def __init__(self):
-        self.subjects = load_all_subjects()
+    """
+    In-memory registry of subjects, keyed by name.
+
+    Writes made through the manager update the registry in place. The registry
+    is only reloaded when another connection has changed the database, which
+    is detected cheaply with PRAGMA data_version.
+    """
+
+    def __init__(self, load: bool = True):
+        """
+        Args:
+            load (bool): Load the subjects now; pass False when they will be
+                loaded elsewhere and handed over with adopt_subjects()
+        """
+        self._subjects: Dict[str, Subject] = {}
+        self._data_version = None
+        if load:
+            self.refresh_subjects()
+
+    @property
+    def subjects(self) -> List[Subject]:
+        """All subjects, in the order they were loaded or created"""
+        return list(self._subjects.values())
 
     def create_subject(self, name: str, icon: Optional[str] = None, image_path: Optional[str] = None) -> Subject:
         """Create a new subject and save it to database"""
         if self.get_subject_by_name(name) is not None:
             raise ValueError(f"Subject '{name}' already exists")
 
-        # Create new subject and add to list
+        # Save to database, then add to the registry
         new_subject = Subject(name, icon, image_path)
-        self.subjects.append(new_subject)
-
-        # Save to database
         save_subject(new_subject)
-
-        self.refresh_subjects()
+        self._subjects[name] = new_subject
 
         return new_subject
 
     def get_all_subjects(self) -> List[Subject]:
-        """Return list of all subjects with fresh data"""
-        self.refresh_subjects()
+        """Return list of all subjects, reloading only if the database changed underneath us"""
+        self.sync()
         return self.subjects
 
     def get_subject_by_name(self, name: str) -> Optional[Subject]:
         """Find and return subject by name, or None if not found"""
-        for subject in self.subjects:
-            if subject.name == name:
-                return subject
-        return None
+        return self._subjects.get(name)
 
     def delete_subject(self, name: str) -> bool:
         """Remove subject by name from memory and database"""
-        subject = self.get_subject_by_name(name)
+        subject = self._subjects.pop(name, None)
         if subject:
-            self.subjects.remove(subject)
             db_delete_subject(name)  # Remove from database
             return True
         return False
@@ -55,11 +69,58 @@ class SubjectManager:
                 if hasattr(subject, key):
                     setattr(subject, key, value)
             save_subject(subject)
+            if subject.name != name:
+                self._subjects = {subject.name if key == name else key: value
+                                  for key, value in self._subjects.items()}
+            return True
+        return False
+
+    def rename_subject(self, old_name: str, new_name: str) -> bool:
+        """Rename a subject. Return True if found and renamed, False otherwise"""
+        subject = self.get_subject_by_name(old_name)
+        if subject is None:
+            return False
+        if self.get_subject_by_name(new_name) is not None:
+            raise ValueError(f"Subject '{new_name}' already exists")
+
+        db_rename_subject(old_name, new_name)
+        subject.name = new_name
+        # Rebuild the dict so the subject keeps its position
+        self._subjects = {new_name if key == old_name else key: value for key, value in self._subjects.items()}
+        return True
+
+    def apply_subject_state(self, state: Subject) -> Subject:
+        """
+        Copy a subject's fresh database state (e.g. from commit_session) into the registry.
+        The registered object is updated in place so existing references see the change.
+        """
+        subject = self._subjects.get(state.name)
+        if subject is None:
+            self._subjects[state.name] = state
+            return state
+
+        subject.id = state.id
+        subject.icon = state.icon
+        subject.image_path = state.image_path
+        subject.total_exp = state.total_exp
+        subject.total_hours = state.total_hours
+        subject.last_session_date = state.last_session_date
+        subject.current_streak = state.current_streak
+        return subject
+
+    def sync(self) -> bool:
+        """Reload the registry if another connection changed the database. Return True if reloaded"""
+        if get_data_version() != self._data_version:
             self.refresh_subjects()
             return True
         return False
 
+    def adopt_subjects(self, subjects: List[Subject]):
+        """Replace the registry with subjects loaded elsewhere, e.g. on a background thread"""
+        self._data_version = get_data_version()
+        self._subjects = {subject.name: subject for subject in subjects}
+
     def refresh_subjects(self):
         """Reload all subjects from database to get latest data"""
-        self.subjects = load_all_subjects()
-
+        self._data_version = get_data_version()
+        self._subjects = {subject.name: subject for subject in load_all_subjects()}
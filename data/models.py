@@ -1,5 +1,10 @@
+import math
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
+from utils.numpy_support import require_numpy
+
 
 def calculate_exp_for_level(level, base_exp=50000, exponent=1.25):
     """
@@ -20,6 +25,118 @@ def calculate_exp_for_level(level, base_exp=50000, exponent=1.25):
     return int(base_exp * (exponent ** (level - 1)))
 
 
+class LevelCurve:
+    """
+    Level lookups for one (base_exp, exponent) curve.
+
+    The EXP threshold of every level up to MAX_TABLE_LEVEL (or until thresholds
+    pass the int64 range) is precomputed with calculate_exp_for_level, so a
+    level is a binary search over that table. Totals beyond the table start
+    from the logarithmic inverse and are corrected against the exact integer
+    thresholds.
+    """
+
+    MAX_TABLE_LEVEL = 10000
+    TABLE_LIMIT = 2 ** 63 - 1
+
+    def __init__(self, base_exp=50000, exponent=1.25):
+        if base_exp <= 0 or exponent <= 1:
+            raise ValueError("A level curve needs base_exp > 0 and exponent > 1")
+        self.base_exp = base_exp
+        self.exponent = exponent
+
+        # thresholds[i] is the total EXP needed to reach level i + 1
+        thresholds = [0]
+        while len(thresholds) < self.MAX_TABLE_LEVEL:
+            threshold = calculate_exp_for_level(len(thresholds) + 1, base_exp, exponent)
+            if threshold > self.TABLE_LIMIT:
+                break
+            thresholds.append(threshold)
+        self.thresholds = thresholds
+        self._log_exponent = math.log(exponent)
+        self._array = None
+
+    def threshold(self, level):
+        """Total EXP needed to reach level"""
+        if level <= 1:
+            return 0
+        if level <= len(self.thresholds):
+            return self.thresholds[level - 1]
+        return calculate_exp_for_level(level, self.base_exp, self.exponent)
+
+    def level(self, total_exp):
+        """Current level for a total EXP"""
+        if total_exp == 0:
+            return 1
+        level = bisect_right(self.thresholds, total_exp)
+        if level < len(self.thresholds):
+            return max(level, 1)
+        return self._level_beyond_table(total_exp)
+
+    def _level_beyond_table(self, total_exp):
+        # Start from the float inverse of base * exponent^(level - 1), then fix rounding
+        level = max(len(self.thresholds),
+                    1 + int(math.log(total_exp / self.base_exp) / self._log_exponent))
+        while self.threshold(level + 1) <= total_exp:
+            level += 1
+        while level > len(self.thresholds) and self.threshold(level) > total_exp:
+            level -= 1
+        return level
+
+    def exp_to_next(self, total_exp):
+        """EXP still needed to reach the next level"""
+        return self.threshold(self.level(total_exp) + 1) - total_exp
+
+    def progress(self, total_exp):
+        """Progress percentage towards the next level (0-100)"""
+        level = self.level(total_exp)
+        current_level_exp = self.threshold(level)
+        next_level_exp = self.threshold(level + 1)
+        return (total_exp - current_level_exp) / (next_level_exp - current_level_exp) * 100
+
+    def levels_batch(self, total_exps):
+        """
+        Levels for an array of total EXP values
+        :param total_exps: Array-like of integer EXP totals
+        :return: numpy.ndarray: Level per total
+        """
+        np = require_numpy("batch level calculation")
+        if self._array is None:
+            self._array = np.asarray(self.thresholds, dtype=np.int64)
+        totals = np.asarray(total_exps)
+        levels = np.maximum(np.searchsorted(self._array, totals, side="right"), 1)
+        levels[totals == 0] = 1
+        # The few totals past the end of the table take the scalar path
+        for index in np.flatnonzero(levels >= len(self.thresholds)):
+            levels[index] = self._level_beyond_table(totals[index].item())
+        return levels
+
+    def batch(self, total_exps):
+        """
+        Level, EXP to next level and progress percentage for an array of totals
+        :param total_exps: Array-like of integer EXP totals
+        :return: tuple: (levels, exp_to_next, progress) arrays
+        """
+        np = require_numpy("batch level calculation")
+        totals = np.asarray(total_exps)
+        levels = self.levels_batch(totals)
+        if levels.max(initial=0) < len(self.thresholds):
+            current_level_exp = self._array[levels - 1]
+            next_level_exp = self._array[levels]
+        else:
+            current_level_exp = np.array([self.threshold(level) for level in levels.tolist()])
+            next_level_exp = np.array([self.threshold(level + 1) for level in levels.tolist()])
+        exp_to_next = next_level_exp - totals
+        progress = (totals - current_level_exp) / (next_level_exp - current_level_exp) * 100
+        return levels, exp_to_next, progress
+
+
+@lru_cache(maxsize=None)
+def get_level_curve(base_exp=50000, exponent=1.25):
+    """Shared LevelCurve for a (base_exp, exponent) pair"""
+    return LevelCurve(base_exp, exponent)
+
+
 def calculate_level_from_exp(total_exp, base_exp=50000, exponent=1.25):
     """
     Calculate current level based on total EXP
@@ -32,22 +149,22 @@ def calculate_level_from_exp(total_exp, base_exp=50000, exponent=1.25):
     Returns:
         int: Current level
     """
-    if total_exp == 0:
-        return 1
-
-    level = 1
-    while total_exp >= calculate_exp_for_level(level + 1, base_exp, exponent):
-        level += 1
-    return level
+    return get_level_curve(base_exp, exponent).level(total_exp)
 
 
 def calculate_exp_to_next_level(total_exp):
     """Calculate how much EXP needed to level up"""
-    return calculate_exp_for_level(calculate_level_from_exp(total_exp) + 1) - total_exp
+    return get_level_curve().exp_to_next(total_exp)
 
 
 class Subject:
+    # Slots keep a loaded subject small; the _level* fields cache the level
+    # lookup until total_exp changes
+    __slots__ = ('id', 'name', 'icon', 'image_path', '_total_exp', 'total_hours',
+                 'last_session_date', 'current_streak', '_level', '_level_exp', '_next_level_exp')
+
     def __init__(self, name: str, icon: Optional[str] = None, image_path: Optional[str] = None):
+        self.id: Optional[int] = None
         self.name = name
         self.icon = icon
         self.image_path = image_path
@@ -56,24 +173,37 @@ class Subject:
         self.last_session_date = None
         self.current_streak = 0
 
+    @property
+    def total_exp(self) -> int:
+        return self._total_exp
+
+    @total_exp.setter
+    def total_exp(self, value: int) -> None:
+        self._total_exp = value
+        self._level = None
+
+    def _level_state(self):
+        """Return (level, EXP at this level, EXP at next level), computing it only after total_exp changed"""
+        if self._level is None:
+            curve = get_level_curve()
+            level = curve.level(self._total_exp)
+            self._level_exp = curve.threshold(level)
+            self._next_level_exp = curve.threshold(level + 1)
+            self._level = level
+        return self._level, self._level_exp, self._next_level_exp
+
     def get_current_level(self) -> int:
         """Return current level"""
-        return calculate_level_from_exp(self.total_exp)
+        return self._level_state()[0]
 
     def get_exp_for_next_level(self) -> int:
         """Return EXP needed to reach next level"""
-        return calculate_exp_to_next_level(self.total_exp)
+        return self._level_state()[2] - self._total_exp
 
     def get_progress_percentage(self) -> float:
         """Return progress percentage to next level (0-100)"""
-        current_level = self.get_current_level()
-        current_level_exp = calculate_exp_for_level(current_level)
-        next_level_exp = calculate_exp_for_level(current_level + 1)
-
-        progress_exp = self.total_exp - current_level_exp
-        total_needed = next_level_exp - current_level_exp
-
-        return (progress_exp / total_needed) * 100
+        _, current_level_exp, next_level_exp = self._level_state()
+        return (self._total_exp - current_level_exp) / (next_level_exp - current_level_exp) * 100
 
     def add_exp(self, amount: int) -> None:
         """Add EXP to this subject"""
@@ -82,6 +212,7 @@ class Subject:
     def to_dict(self) -> Dict[str, Any]:
         """Convert subject to dictionary for saving/loading"""
         return {
+            'id': self.id,
             'name': self.name,
             'icon': self.icon,
             'image_path': self.image_path,
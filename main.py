@@ -11,8 +11,8 @@ def main():
     
     # Apply Steam theme
     apply_steam_theme(app)
-    
-    # Create and show main window
+
+    # Create and show main window; the database is prepared in the background
     window = MainWindow()
     window.show()
     
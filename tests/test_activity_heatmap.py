@@ -0,0 +1,143 @@
+import unittest
+import os
+import sys
+import tempfile
+from datetime import date
+
+# Add the parent directory to sys.path to allow imports from project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QApplication
+
+from core.connection import configure_database, close_database
+from core import database
+from data.models import Subject
+from ui.components.activity_heatmap import ActivityHeatmap, HeatmapLoader, build_day_values, MIN_DAYS
+from utils.time_helpers import timestamp_to_local_day
+
+# A Monday
+MONDAY = date(2024, 1, 1).toordinal()
+
+
+class TestBuildDayValues(unittest.TestCase):
+    """Tests for turning daily stats into a per-day array"""
+
+    def test_values_start_on_a_monday(self):
+        """The array starts on a Monday and holds each day's seconds"""
+        today = MONDAY + 400
+        start_day, values = build_day_values([(MONDAY + 2, 1, 600, 0, 0, 0), (today, 2, 90, 0, 0, 0)], today)
+
+        self.assertEqual(date.fromordinal(start_day).weekday(), 0)
+        self.assertEqual(start_day, MONDAY)
+        self.assertEqual(len(values), today - MONDAY + 1)
+        self.assertEqual(values[2], 600)
+        self.assertEqual(values[-1], 90)
+        self.assertEqual(sum(values), 690)
+
+    def test_short_history_covers_a_year(self):
+        """At least MIN_DAYS are shown even without data"""
+        _, values = build_day_values([], MONDAY)
+        self.assertGreaterEqual(len(values), MIN_DAYS)
+
+
+class TestActivityHeatmap(unittest.TestCase):
+    """Tests for the QPainter heatmap widget"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.heatmap = ActivityHeatmap()
+        self.heatmap.set_days(MONDAY, [0] * 70)
+        self.updates = []
+        self.heatmap.update = lambda *args: self.updates.append(args)
+
+    def test_levels_follow_thresholds(self):
+        """Colour levels come from the fixed thresholds"""
+        self.assertEqual([self.heatmap.level(seconds) for seconds in (0, 1, 1800, 3600, 7200, 86400)],
+                         [0, 1, 2, 3, 4, 4])
+
+    def test_day_at_inverts_cell_rect(self):
+        """Every day maps to a cell and back; gaps map to nothing"""
+        for day in range(MONDAY, MONDAY + 70):
+            centre = self.heatmap.cell_rect(day).center()
+            self.assertEqual(self.heatmap.day_at(centre.x(), centre.y()), day)
+        gap = self.heatmap.CELL_SIZE
+        self.assertIsNone(self.heatmap.day_at(gap, 0))
+        self.assertIsNone(self.heatmap.day_at(0, 7 * (gap + self.heatmap.CELL_GAP)))
+
+    def test_add_seconds_repaints_only_changed_cell(self):
+        """Adding time repaints the day's cell, and only when its colour changes"""
+        day = MONDAY + 9
+
+        self.assertTrue(self.heatmap.add_seconds(day, 600))
+        self.assertEqual(self.updates, [(self.heatmap.cell_rect(day),)])
+
+        self.heatmap.add_seconds(day, 60)
+        self.assertEqual(len(self.updates), 1)
+        self.assertEqual(self.heatmap.values[9], 660)
+
+        self.assertFalse(self.heatmap.add_seconds(MONDAY + 100, 600))
+
+    def test_cells_are_painted_in_level_colours(self):
+        """The rendered image has each cell in its level's colour"""
+        del self.heatmap.update
+        self.heatmap.add_seconds(MONDAY + 3, 2 * 3600)
+        self.heatmap.resize(self.heatmap.sizeHint())
+        image = self.heatmap.grab().toImage()
+
+        def colour_of(day):
+            centre = self.heatmap.cell_rect(day).center()
+            return image.pixelColor(centre).name()
+
+        self.assertEqual(colour_of(MONDAY + 3), QColor(self.heatmap.LEVEL_COLORS[4]).name())
+        self.assertEqual(colour_of(MONDAY + 4), QColor(self.heatmap.LEVEL_COLORS[0]).name())
+
+
+class TestHeatmapLoader(unittest.TestCase):
+    """Tests for the background heatmap loader"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        configure_database(os.path.join(self.temp_dir.name, "test.db"))
+        database.init_database()
+
+    def tearDown(self):
+        close_database()
+        self.temp_dir.cleanup()
+
+    def test_loader_reads_daily_totals(self):
+        """The loader reports per-day seconds for one subject or all"""
+        database.save_subject(Subject("Study"))
+        database.save_subject(Subject("Guitar"))
+        start_time = 1_700_000_000.0
+        for subject, duration in (("Study", 600), ("Guitar", 900)):
+            database.save_session({
+                'subject': subject, 'start_time': start_time, 'end_time': start_time + duration,
+                'duration_seconds': duration, 'base_exp': 0, 'bonus_exp': 0,
+                'total_exp': 0, 'streak_days': 0, 'notes': '',
+            })
+        day = timestamp_to_local_day(start_time)
+
+        results = []
+        for request_id, subject_name in ((1, "Study"), (2, None)):
+            loader = HeatmapLoader(request_id, subject_name)
+            loader.signals.loaded.connect(lambda *args: results.append(args))
+            loader.run()
+
+        (first_id, start_day, study), (second_id, _, overall) = results
+        self.assertEqual((first_id, second_id), (1, 2))
+        self.assertEqual(study[day - start_day], 600)
+        self.assertEqual(overall[day - start_day], 1500)
+        self.assertEqual(sum(overall), 1500)
+
+
+if __name__ == '__main__':
+    unittest.main()
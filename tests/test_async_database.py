@@ -0,0 +1,94 @@
+import unittest
+import asyncio
+import os
+import sys
+import tempfile
+
+# Add the parent directory to sys.path to allow imports from project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.connection import configure_database, close_database, get_connection_manager
+from core import database
+from core.async_database import AsyncDatabase
+from data.models import Subject
+
+
+def session_result(index, subject="Study"):
+    start_time = 1_700_000_000.0 + index * 1000
+    return {
+        'subject': subject, 'start_time': start_time, 'end_time': start_time + 600,
+        'duration_seconds': 600, 'base_exp': 6000, 'bonus_exp': 300,
+        'total_exp': 6300, 'streak_days': 1,
+    }
+
+
+class TestAsyncDatabase(unittest.IsolatedAsyncioTestCase):
+    """Tests for the asyncio facade"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        configure_database(os.path.join(self.temp_dir.name, "test.db"))
+        database.init_database()
+
+    async def asyncSetUp(self):
+        self.db = AsyncDatabase(readers=3)
+
+    async def asyncTearDown(self):
+        await self.db.close()
+
+    def tearDown(self):
+        close_database()
+        self.temp_dir.cleanup()
+
+    async def test_concurrent_commits_are_serialised(self):
+        """Many simultaneous commits all land, with consistent subject totals"""
+        await self.db.save_subject(Subject("Study"))
+
+        await asyncio.gather(*(self.db.commit_session(session_result(i)) for i in range(40)))
+
+        subjects = await self.db.load_all_subjects()
+        self.assertEqual(subjects[0].total_exp, 40 * 6300)
+        self.assertEqual(len(await self.db.get_session_history(limit=100)), 40)
+        self.assertEqual((await self.db.get_total_stats())['total_sessions'], 40)
+
+    async def test_reads_run_alongside_writes(self):
+        """Reads and writes can be awaited together"""
+        await self.db.save_subject(Subject("Study"))
+        writes = [self.db.commit_session(session_result(i)) for i in range(10)]
+        reads = [self.db.get_session_page("Study", page_size=5) for _ in range(10)]
+
+        results = await asyncio.gather(*writes, *reads)
+
+        self.assertEqual(results[9].total_exp, 10 * 6300)
+        for rows, _ in results[10:]:
+            self.assertLessEqual(len(rows), 5)
+
+    async def test_subject_crud(self):
+        """Subjects can be created, renamed and deleted"""
+        await self.db.save_subject(Subject("Guitar"))
+        await self.db.rename_subject("Guitar", "Bass")
+        state = await self.db.get_session_start_state("Bass")
+        self.assertIsNotNone(state)
+
+        await self.db.delete_subject("Bass")
+        self.assertEqual(await self.db.load_all_subjects(), [])
+
+    async def test_errors_propagate(self):
+        """Exceptions from the worker threads are raised to the awaiting task"""
+        with self.assertRaises(ValueError):
+            await self.db.commit_session(session_result(0, subject="Missing"))
+
+    async def test_close_releases_connections(self):
+        """Closing leaves only connections opened outside the pools"""
+        await self.db.save_subject(Subject("Study"))
+        await asyncio.gather(*(self.db.get_total_stats() for _ in range(10)))
+
+        await self.db.close()
+
+        self.assertEqual(len(get_connection_manager()._connections), 1)
+        with self.assertRaises(RuntimeError):
+            await self.db.get_total_stats()
+
+
+if __name__ == '__main__':
+    unittest.main()
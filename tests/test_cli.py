@@ -0,0 +1,114 @@
+import unittest
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import date, datetime
+
+# Add the parent directory to sys.path to allow imports from project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import cli
+from core.connection import configure_database, close_database
+from core import database
+from data.models import Subject
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+class TestCli(unittest.TestCase):
+    """Tests for the headless command-line interface"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        configure_database(os.path.join(self.temp_dir.name, "test.db"))
+        database.init_database()
+        database.save_subject(Subject("Guitar", "🎸"))
+
+    def tearDown(self):
+        close_database()
+        self.temp_dir.cleanup()
+
+    def run_cli(self, *argv):
+        """Run a command and return (exit status, parsed JSON output)"""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            status = cli.main(list(argv))
+        return status, json.loads(output.getvalue())
+
+    def test_start_and_stop(self):
+        """A started session is kept in app_state until stop saves it"""
+        status, started = self.run_cli("start", "Guitar")
+        self.assertEqual(status, 0)
+        self.assertEqual(started['subject'], "Guitar")
+
+        status, error = self.run_cli("start", "Guitar")
+        self.assertEqual(status, 1)
+        self.assertIn("already running", error['error'])
+
+        _, stats = self.run_cli("stats")
+        self.assertEqual(stats['active_session']['subject'], "Guitar")
+
+        status, stopped = self.run_cli("stop", "--notes", "Scales")
+        self.assertEqual(status, 0)
+        self.assertEqual(stopped['notes'], "Scales")
+        self.assertEqual(stopped['subject_state']['name'], "Guitar")
+        self.assertIsNone(database.get_app_state(cli.ACTIVE_SESSION_KEY))
+        self.assertEqual(len(database.get_session_history("Guitar")), 1)
+
+        status, error = self.run_cli("stop")
+        self.assertEqual(status, 1)
+        self.assertEqual(error['error'], "No session is currently running")
+
+    def test_log_past_sessions(self):
+        """Logged sessions are scored, saved and counted into the streak"""
+        midnight = datetime.combine(date.today(), datetime.min.time()).timestamp()
+        for days_ago in (1, 3, 2):
+            start = datetime.fromtimestamp(midnight - days_ago * 86400 + 3600).isoformat()
+            status, logged = self.run_cli("log", "Guitar", "--minutes", "45", "--start", start)
+            self.assertEqual(status, 0)
+
+        self.assertEqual(logged['duration_seconds'], 2700)
+        self.assertEqual(logged['streak_days'], 2)
+        self.assertEqual(logged['subject_state']['current_streak'], 3)
+
+        _, subject = self.run_cli("stats", "Guitar")
+        self.assertEqual(subject['total_sessions'], 3)
+        self.assertEqual(subject['level'], database.load_all_subjects()[0].get_current_level())
+
+    def test_log_rejects_unknown_subject(self):
+        """Errors are reported as JSON with status 1"""
+        status, error = self.run_cli("log", "Piano", "--minutes", "10")
+        self.assertEqual(status, 1)
+        self.assertEqual(error['error'], "Subject 'Piano' does not exist")
+
+    def test_list_and_history(self):
+        """list returns every subject and history the newest sessions first"""
+        database.save_subject(Subject("Study"))
+        now = time.time()
+        for hours_ago in (5, 3, 1):
+            self.run_cli("log", "Guitar", "--minutes", "30", "--start", str(now - hours_ago * 3600))
+
+        _, subjects = self.run_cli("list")
+        self.assertEqual([subject['name'] for subject in subjects], ["Guitar", "Study"])
+
+        _, sessions = self.run_cli("history", "Guitar", "--limit", "2")
+        self.assertEqual([round(now - session['start_time']) for session in sessions], [3600, 3 * 3600])
+        self.assertEqual(set(sessions[0]), set(database.SESSION_COLUMNS))
+
+        _, sessions = self.run_cli("history", "--since", str(now - 4 * 3600), "--until", str(now - 2 * 3600))
+        self.assertEqual(len(sessions), 1)
+
+    def test_does_not_import_qt(self):
+        """The CLI runs without loading PyQt6"""
+        code = "import sys, cli; print(any(name.startswith('PyQt6') for name in sys.modules))"
+        output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        self.assertEqual(output.stdout.strip(), "False")
+
+
+if __name__ == '__main__':
+    unittest.main()
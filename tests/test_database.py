@@ -0,0 +1,409 @@
+import unittest
+import os
+import sys
+import tempfile
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+
+# Add the parent directory to sys.path to allow imports from project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.connection import ConnectionManager, configure_database, close_database, get_connection_manager
+from core import database
+from data.models import Subject
+from utils.time_helpers import timestamp_to_local_day, local_day_and_offset
+
+
+class TestConnectionManager(unittest.TestCase):
+    """Tests for the ConnectionManager class"""
+
+    def setUp(self):
+        """Create a manager on a temporary database file"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "test.db")
+        self.manager = ConnectionManager(self.db_path)
+
+    def tearDown(self):
+        self.manager.close()
+        self.temp_dir.cleanup()
+
+    def test_connection_is_reused_per_thread(self):
+        """The same thread always gets the same connection"""
+        self.assertIs(self.manager.connection(), self.manager.connection())
+
+    def test_each_thread_gets_own_connection(self):
+        """Different threads get different connections"""
+        main_connection = self.manager.connection()
+        other = []
+        thread = threading.Thread(target=lambda: other.append(self.manager.connection()))
+        thread.start()
+        thread.join()
+
+        self.assertIsNot(main_connection, other[0])
+
+    def test_pragmas_are_applied(self):
+        """Configured pragmas are set on new connections"""
+        manager = ConnectionManager(self.db_path, pragmas={"cache_size": -4000})
+        try:
+            connection = manager.connection()
+            self.assertEqual(connection.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+            self.assertEqual(connection.execute("PRAGMA cache_size").fetchone()[0], -4000)
+        finally:
+            manager.close()
+
+    def test_storage_profile_is_applied(self):
+        """Connections use the manager's storage profile"""
+        manager = ConnectionManager(self.db_path, profile="fast")
+        try:
+            connection = manager.connection()
+            self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(connection.execute("PRAGMA synchronous").fetchone()[0], 0)
+        finally:
+            manager.close()
+
+    def test_unknown_storage_profile(self):
+        """An unknown profile name is rejected"""
+        with self.assertRaises(ValueError):
+            ConnectionManager(self.db_path, profile="reckless")
+
+    def test_transaction_commits(self):
+        """A successful block is committed"""
+        with self.manager.transaction() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+            conn.execute("INSERT INTO t VALUES (1)")
+
+        other = ConnectionManager(self.db_path)
+        try:
+            count = other.connection().execute("SELECT COUNT(*) FROM t").fetchone()[0]
+        finally:
+            other.close()
+        self.assertEqual(count, 1)
+
+    def test_transaction_rolls_back_on_error(self):
+        """A failing block leaves no changes behind"""
+        with self.manager.transaction() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+
+        with self.assertRaises(ValueError):
+            with self.manager.transaction() as conn:
+                conn.execute("INSERT INTO t VALUES (1)")
+                raise ValueError("boom")
+
+        count = self.manager.connection().execute("SELECT COUNT(*) FROM t").fetchone()[0]
+        self.assertEqual(count, 0)
+
+    def test_nested_transaction_commits_once(self):
+        """Inner blocks join the outer transaction"""
+        with self.manager.transaction() as outer:
+            outer.execute("CREATE TABLE t (x INTEGER)")
+            with self.manager.transaction() as inner:
+                inner.execute("INSERT INTO t VALUES (1)")
+            self.assertTrue(outer.in_transaction)
+        self.assertFalse(self.manager.connection().in_transaction)
+
+    def test_transaction_takes_write_lock_up_front(self):
+        """Other writers wait for the transaction even before it writes anything"""
+        with self.manager.transaction() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+
+        other = ConnectionManager(self.db_path, timeout=0.05)
+        try:
+            with self.manager.transaction() as conn:
+                conn.execute("SELECT COUNT(*) FROM t").fetchone()
+                with self.assertRaises(sqlite3.OperationalError):
+                    other.connection().execute("INSERT INTO t VALUES (1)")
+        finally:
+            other.close()
+
+    def test_close_rejects_new_connections(self):
+        """A closed manager cannot open connections"""
+        self.manager.connection()
+        self.manager.close()
+
+        with self.assertRaises(RuntimeError):
+            self.manager.connection()
+
+
+class TestDatabaseFunctions(unittest.TestCase):
+    """Tests for core.database against a temporary database"""
+
+    def setUp(self):
+        """Point the shared connection manager at a fresh database"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        configure_database(os.path.join(self.temp_dir.name, "test.db"))
+        database.init_database()
+
+    def tearDown(self):
+        close_database()
+        self.temp_dir.cleanup()
+
+    def test_save_and_load_subject(self):
+        """Saved subjects are loaded back"""
+        subject = Subject("Study", "📚")
+        subject.total_exp = 1234
+        database.save_subject(subject)
+
+        subjects = database.load_all_subjects()
+
+        self.assertEqual(len(subjects), 1)
+        self.assertEqual(subjects[0].name, "Study")
+        self.assertEqual(subjects[0].total_exp, 1234)
+
+    def test_save_subject_assigns_id(self):
+        """New subjects get an id, and saving again updates the same row"""
+        subject = Subject("Study")
+        database.save_subject(subject)
+        self.assertIsNotNone(subject.id)
+
+        subject.name = "Studying"
+        subject.total_exp = 10
+        database.save_subject(subject)
+
+        subjects = database.load_all_subjects()
+        self.assertEqual([(s.id, s.name, s.total_exp) for s in subjects], [(subject.id, "Studying", 10)])
+
+    def test_rename_subject_keeps_sessions(self):
+        """Renaming a subject keeps its sessions attached"""
+        database.save_subject(Subject("Study"))
+        database.save_subject(Subject("Guitar"))
+        database.commit_session(self._session_result())
+
+        database.rename_subject("Study", "Studying")
+
+        self.assertEqual(database.get_session_history("Studying")[0][1], "Studying")
+        self.assertEqual(database.get_daily_stats("Studying")[0][1], 1)
+        with self.assertRaises(ValueError):
+            database.rename_subject("Studying", "Guitar")
+        with self.assertRaises(ValueError):
+            database.rename_subject("Missing", "Other")
+
+    def test_calls_share_one_connection(self):
+        """Repeated calls on one thread reuse the same connection"""
+        connection = get_connection_manager().connection()
+        database.save_subject(Subject("Study"))
+        database.load_all_subjects()
+
+        self.assertIs(database.get_connection(), connection)
+
+    def test_delete_subject_removes_sessions(self):
+        """Deleting a subject also removes its sessions"""
+        database.save_subject(Subject("Study"))
+        database.save_session({
+            'subject': 'Study', 'start_time': 1000.0, 'end_time': 1060.0,
+            'duration_seconds': 60, 'base_exp': 600, 'bonus_exp': 0,
+            'total_exp': 600, 'streak_days': 0,
+        })
+
+        database.delete_subject("Study")
+
+        self.assertEqual(database.load_all_subjects(), [])
+        self.assertEqual(database.get_session_history(), [])
+
+    def _session_result(self, **overrides):
+        """Build a session result dict like SessionManager.stop_session returns"""
+        result = {
+            'subject': 'Study', 'start_time': 1000.0, 'end_time': 4600.0,
+            'duration_seconds': 3600, 'base_exp': 54000, 'bonus_exp': 2700,
+            'total_exp': 56700, 'streak_days': 1, 'notes': 'notes',
+        }
+        result.update(overrides)
+        return result
+
+    def test_commit_session_updates_subject(self):
+        """commit_session stores the session and returns the updated subject"""
+        database.save_subject(Subject("Study"))
+
+        subject = database.commit_session(self._session_result())
+
+        self.assertEqual(subject.name, "Study")
+        self.assertEqual(subject.total_exp, 56700)
+        self.assertAlmostEqual(subject.total_hours, 1.0)
+        self.assertEqual(subject.current_streak, 1)
+        self.assertEqual(subject.last_session_date, 4600.0)
+        self.assertEqual(len(database.get_session_history()), 1)
+
+    def test_commit_session_commits_once(self):
+        """The session insert and subject update share a single COMMIT"""
+        database.save_subject(Subject("Study"))
+        statements = []
+        database.get_connection().set_trace_callback(statements.append)
+        try:
+            database.commit_session(self._session_result())
+        finally:
+            database.get_connection().set_trace_callback(None)
+
+        self.assertEqual(statements.count("COMMIT"), 1)
+
+    def test_commit_session_unknown_subject_rolls_back(self):
+        """A session for a missing subject is not stored"""
+        with self.assertRaises(ValueError):
+            database.commit_session(self._session_result(subject="Missing"))
+
+        self.assertEqual(database.get_session_history(), [])
+
+    def test_session_history_newest_first(self):
+        """History is ordered by start time, newest first"""
+        database.save_subject(Subject("Study"))
+        for start_time in (3000.0, 1000.0, 2000.0):
+            database.save_session(self._session_result(start_time=start_time))
+
+        rows = database.get_session_history("Study")
+
+        self.assertEqual([row[2] for row in rows], [3000.0, 2000.0, 1000.0])
+
+    def test_session_pages_cover_every_row_once(self):
+        """Walking the cursor visits each session exactly once, ties included"""
+        database.save_subject(Subject("Study"))
+        database.save_subject(Subject("Guitar"))
+        for index in range(25):
+            # Pairs of sessions share a start time to exercise the id tie-break
+            database.save_session(self._session_result(start_time=float(index // 2)))
+        database.save_session(self._session_result(subject="Guitar", start_time=5.0))
+
+        seen = []
+        cursor = None
+        while True:
+            rows, cursor = database.get_session_page("Study", cursor=cursor, page_size=4)
+            seen.extend(rows)
+            if cursor is None:
+                break
+
+        self.assertEqual(len(seen), 25)
+        self.assertEqual(len({row[0] for row in seen}), 25)
+        keys = [(row[2], row[0]) for row in seen]
+        self.assertEqual(keys, sorted(keys, reverse=True))
+
+    def test_session_pages_filter_by_time_range(self):
+        """Pages only contain sessions starting inside the time range"""
+        database.save_subject(Subject("Study"))
+        for start_time in range(10):
+            database.save_session(self._session_result(start_time=float(start_time)))
+
+        rows, cursor = database.get_session_page(start_time=3.0, end_time=7.0, page_size=3)
+        more, last_cursor = database.get_session_page(cursor=cursor, start_time=3.0, end_time=7.0, page_size=3)
+
+        self.assertEqual([row[2] for row in rows + more], [6.0, 5.0, 4.0, 3.0])
+        self.assertIsNone(last_cursor)
+
+    def test_count_sessions(self):
+        """count_sessions counts from the rollups per subject and day range"""
+        database.save_subject(Subject("Study"))
+        database.save_subject(Subject("Guitar"))
+        start_time = 1_700_000_000.0
+        for offset in (0, 86400, 2 * 86400):
+            database.save_session(self._session_result(start_time=start_time + offset))
+        database.save_session(self._session_result(subject="Guitar", start_time=start_time))
+        first_day = timestamp_to_local_day(start_time)
+
+        self.assertEqual(database.count_sessions(), 4)
+        self.assertEqual(database.count_sessions("Study"), 3)
+        self.assertEqual(database.count_sessions(start_day=first_day, end_day=first_day), 2)
+        self.assertEqual(database.count_sessions("Study", start_day=first_day + 1), 2)
+        self.assertEqual(database.count_sessions("Missing"), 0)
+
+    def test_rollups_follow_session_inserts(self):
+        """Each committed session is added to its subject's day total"""
+        database.save_subject(Subject("Study"))
+        start_time = 1_700_000_000.0
+        database.commit_session(self._session_result(start_time=start_time))
+        database.commit_session(self._session_result(start_time=start_time + 60))
+
+        day = timestamp_to_local_day(start_time)
+        self.assertEqual(
+            database.get_daily_stats("Study"),
+            [(day, 2, 7200, 108000, 5400, 113400)]
+        )
+
+        stats = database.get_total_stats()
+        self.assertEqual(stats['total_sessions'], 2)
+        self.assertEqual(stats['total_hours'], 2.0)
+
+    def test_sessions_store_local_day(self):
+        """Each session is stored with its local day and UTC offset"""
+        database.save_subject(Subject("Study"))
+        start_time = 1_700_000_000.0
+        database.save_session(self._session_result(start_time=start_time))
+
+        row = database.get_connection().execute("SELECT local_day, utc_offset FROM sessions").fetchone()
+        self.assertEqual(row, local_day_and_offset(start_time))
+
+    def test_rebuild_daily_rollups_matches_incremental(self):
+        """Rebuilding from history gives the same rollups as the insert path"""
+        database.save_subject(Subject("Study"))
+        database.save_subject(Subject("Guitar"))
+        start_time = 1_700_000_000.0
+        for index in range(40):
+            subject = "Study" if index % 3 else "Guitar"
+            database.save_session(self._session_result(subject=subject, start_time=start_time + index * 20000))
+        incremental = database.get_connection().execute(
+            "SELECT * FROM daily_rollups ORDER BY subject_id, day").fetchall()
+
+        database.rebuild_daily_rollups()
+        rebuilt = database.get_connection().execute(
+            "SELECT * FROM daily_rollups ORDER BY subject_id, day").fetchall()
+
+        self.assertEqual(rebuilt, incremental)
+
+    def test_daily_stats_day_range(self):
+        """get_daily_stats sums subjects per day and honours the day range"""
+        database.save_subject(Subject("Study"))
+        database.save_subject(Subject("Guitar"))
+        start_time = 1_700_000_000.0
+        for offset in (0, 86400, 2 * 86400):
+            database.save_session(self._session_result(start_time=start_time + offset))
+            database.save_session(self._session_result(subject="Guitar", start_time=start_time + offset))
+
+        first_day = timestamp_to_local_day(start_time)
+        rows = database.get_daily_stats(start_day=first_day + 1, end_day=first_day + 1)
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0][0], first_day + 1)
+        self.assertEqual(rows[0][1], 2)
+
+    def test_session_start_state(self):
+        """get_session_start_state returns the id and next streak in one lookup"""
+        subject = Subject("Study")
+        subject.last_session_date = time.time() - 86400
+        subject.current_streak = 3
+        database.save_subject(subject)
+
+        state = database.get_session_start_state("Study")
+
+        self.assertEqual(state['subject_id'], subject.id)
+        self.assertEqual(state['streak_days'], 4)
+        self.assertIsNone(database.get_session_start_state("Missing"))
+        self.assertEqual(database.calculate_current_streak("Missing"), 0)
+
+    def test_backdated_session_keeps_last_date_and_recounts_streak(self):
+        """An older session adds to the totals and can join two runs into one streak"""
+        database.save_subject(Subject("Study"))
+        today = datetime.combine(date.today(), datetime.min.time()).timestamp() + 60
+        database.commit_session(self._session_result(start_time=today - 2 * 86400, end_time=today - 2 * 86400 + 60))
+        latest = database.commit_session(self._session_result(start_time=today, end_time=today + 60))
+        self.assertEqual(latest.current_streak, 1)
+
+        # The missing day in between
+        state = database.get_session_start_state("Study", start_time=today - 86400)
+        self.assertEqual(state['streak_days'], 2)
+        subject = database.commit_session(self._session_result(
+            start_time=today - 86400, end_time=today - 86400 + 60, streak_days=state['streak_days']))
+
+        self.assertEqual(subject.last_session_date, today + 60)
+        self.assertEqual(subject.current_streak, 3)
+        self.assertEqual(subject.total_exp, 3 * 56700)
+
+    def test_next_streak(self):
+        """The streak continues the next day and resets after a gap"""
+        today = date(2024, 3, 10)
+        noon = datetime(2024, 3, 10, 12).timestamp()
+
+        self.assertEqual(database.next_streak(None, 5, today), 1)
+        self.assertEqual(database.next_streak(noon, 5, today), 5)
+        self.assertEqual(database.next_streak(noon - 86400, 5, today), 6)
+        self.assertEqual(database.next_streak(noon - 3 * 86400, 5, today), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import os
+import sys
+import tempfile
+import threading
+
+# Add the parent directory to sys.path to allow imports from project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from core.connection import configure_database, close_database
+from core import database
+from data.models import Subject
+from ui.db_writer import DatabaseWriter
+
+
+class TestDatabaseWriter(unittest.TestCase):
+    """Tests for the background database writer"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        configure_database(os.path.join(self.temp_dir.name, "test.db"))
+        database.init_database()
+        self.writer = DatabaseWriter()
+        self.writer.start()
+
+    def tearDown(self):
+        self.writer.stop()
+        close_database()
+        self.temp_dir.cleanup()
+
+    def _wait_for(self, condition, timeout_ms=5000):
+        """Run the event loop until condition() is true"""
+        loop = QEventLoop()
+        poll = QTimer()
+        poll.timeout.connect(lambda: condition() and loop.quit())
+        poll.start(5)
+        QTimer.singleShot(timeout_ms, loop.quit)
+        loop.exec()
+        poll.stop()
+        self.assertTrue(condition(), "timed out waiting for the writer")
+
+    def test_commands_run_in_order_off_the_gui_thread(self):
+        """Commands run sequentially on the writer thread; callbacks come back on the GUI thread"""
+        ran_on, results, callback_threads = [], [], []
+
+        def command(value):
+            ran_on.append(threading.get_ident())
+            return value
+
+        def on_done(value):
+            callback_threads.append(threading.get_ident())
+            results.append(value)
+
+        for value in range(5):
+            self.writer.submit(command, value, on_done=on_done)
+        self._wait_for(lambda: len(results) == 5)
+
+        self.assertEqual(results, [0, 1, 2, 3, 4])
+        self.assertNotIn(threading.get_ident(), ran_on)
+        self.assertEqual(set(callback_threads), {threading.get_ident()})
+
+    def test_errors_are_delivered(self):
+        """An exception in a command reaches on_error and commandFailed"""
+        errors, failed_ids = [], []
+        self.writer.commandFailed.connect(lambda command_id, error: failed_ids.append(command_id))
+
+        command_id = self.writer.submit(database.commit_session, {'subject': 'Missing'},
+                                        on_error=errors.append)
+        self._wait_for(lambda: errors and failed_ids)
+
+        self.assertIsInstance(errors[0], ValueError)
+        self.assertEqual(failed_ids, [command_id])
+
+    def test_commit_session_on_writer(self):
+        """A session committed on the writer is visible to the GUI thread's connection"""
+        database.save_subject(Subject("Study"))
+        states = []
+
+        self.writer.submit(database.commit_session, {
+            'subject': 'Study', 'start_time': 1000.0, 'end_time': 1600.0, 'duration_seconds': 600,
+            'base_exp': 6000, 'bonus_exp': 0, 'total_exp': 6000, 'streak_days': 1,
+        }, on_done=states.append)
+        self._wait_for(lambda: states)
+
+        self.assertEqual(states[0].total_exp, 6000)
+        self.assertEqual(database.load_all_subjects()[0].total_exp, 6000)
+
+
+if __name__ == '__main__':
+    unittest.main()
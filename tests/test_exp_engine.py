@@ -3,7 +3,14 @@ import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from core.exp_engine import calculate_base_exp, apply_streak_bonus, calculate_total_exp
+from core.exp_engine import (calculate_base_exp, apply_streak_bonus, calculate_total_exp,
+                             calculate_base_exp_batch, apply_streak_bonus_batch, score_sessions_batch,
+                             TierTable)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class TestEXPEngine(unittest.TestCase):
@@ -75,6 +82,77 @@ class TestEXPEngine(unittest.TestCase):
         total_exp = calculate_total_exp(25 * 60, 0)
         self.assertEqual(total_exp, 15000)
 
+    def test_custom_tier_table(self):
+        """Any number of tiers can be configured"""
+        table = TierTable([60, 120, 300], [1, 2, 3, 5])
+
+        self.assertEqual(table.cumulative, (0, 60, 180, 720))
+        self.assertEqual(calculate_base_exp(60, table), 60)
+        self.assertEqual(calculate_base_exp(61, table), 62)
+        self.assertEqual(calculate_base_exp(400, table), 720 + 100 * 5)
+        self.assertEqual(calculate_total_exp(400, 2, table), 1342)
+
+    def test_single_tier_table(self):
+        """A table with no breakpoints is a flat rate"""
+        self.assertEqual(calculate_base_exp(5000, TierTable([], [7])), 35000)
+
+    def test_invalid_tier_table(self):
+        """Mismatched or unsorted tiers are rejected"""
+        with self.assertRaises(ValueError):
+            TierTable([60, 120], [1, 2])
+        with self.assertRaises(ValueError):
+            TierTable([120, 60], [1, 2, 3])
+        with self.assertRaises(ValueError):
+            TierTable([60], [1, -2])
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestBatchScoring(unittest.TestCase):
+    """The batch functions must match the scalar ones exactly"""
+
+    def test_base_exp_matches_scalar(self):
+        """Every whole-second duration across all tiers scores the same"""
+        seconds = np.arange(0, 4 * 3600)
+        expected = [calculate_base_exp(int(s)) for s in seconds]
+        self.assertEqual(calculate_base_exp_batch(seconds).tolist(), expected)
+
+    def test_float_durations_match_scalar(self):
+        """Fractional durations follow the same float arithmetic"""
+        seconds = np.random.default_rng(1).uniform(0, 20000, 5000)
+        expected = [calculate_base_exp(float(s)) for s in seconds]
+        self.assertEqual(calculate_base_exp_batch(seconds).tolist(), expected)
+
+    def test_streak_bonus_matches_scalar_rounding(self):
+        """Ties round half to even, like round()"""
+        rng = np.random.default_rng(2)
+        base = rng.integers(0, 300000, 20000)
+        streaks = rng.integers(0, 400, 20000)
+        # 10 * 1.05 = 10.5 and 30 * 1.05 = 31.5 hit the tie cases
+        base[:2], streaks[:2] = [10, 30], [1, 1]
+
+        expected = [apply_streak_bonus(int(b), int(d)) for b, d in zip(base, streaks)]
+        self.assertEqual(apply_streak_bonus_batch(base, streaks).tolist(), expected)
+
+    def test_score_sessions_batch(self):
+        """Base, bonus and total line up with the scalar path"""
+        base, bonus, total = score_sessions_batch([25 * 60, 45 * 60], [0, 3])
+
+        self.assertEqual(base.tolist(), [15000, 36000])
+        self.assertEqual(bonus.tolist(), [0, 5400])
+        self.assertEqual(total.tolist(), [15000, 41400])
+
+    def test_custom_tier_table_batch(self):
+        """Batch scoring with a custom table matches the scalar path"""
+        table = TierTable([60, 120, 300], [1, 2, 3, 5])
+        seconds = np.arange(0, 1000)
+
+        expected = [calculate_base_exp(int(s), table) for s in seconds]
+        self.assertEqual(calculate_base_exp_batch(seconds, table).tolist(), expected)
+
+    def test_negative_duration_rejected(self):
+        with self.assertRaises(ValueError):
+            calculate_base_exp_batch([10, -1])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,90 @@
+import unittest
+import csv
+import gzip
+import json
+import os
+import sys
+import tempfile
+
+# Add the parent directory to sys.path to allow imports from project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.connection import configure_database, close_database
+from core import database
+from core.exporter import export_sessions, export_subjects
+from core.importer import import_sessions
+from data.models import Subject
+
+
+class TestExporter(unittest.TestCase):
+    """Tests for the streaming exporter"""
+
+    def setUp(self):
+        """Fill a fresh database with a few sessions"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        configure_database(os.path.join(self.temp_dir.name, "test.db"))
+        database.init_database()
+
+        database.save_subject(Subject("Study", "📚"))
+        database.save_subject(Subject("Guitar"))
+        for index in range(10):
+            subject = "Study" if index % 2 else "Guitar"
+            start_time = 1_700_000_000.0 + index * 1000
+            database.commit_session({
+                'subject': subject, 'start_time': start_time, 'end_time': start_time + 600,
+                'duration_seconds': 600, 'base_exp': 6000, 'bonus_exp': 300,
+                'total_exp': 6300, 'streak_days': 1, 'notes': f'note {index}',
+            })
+
+    def tearDown(self):
+        close_database()
+        self.temp_dir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def test_export_csv_with_filters(self):
+        """Subject and time filters limit the exported rows"""
+        path = self._path("sessions.csv")
+
+        report = export_sessions(path, subject_name="Study",
+                                 start_time=1_700_000_000.0 + 3000, end_time=1_700_000_000.0 + 7000,
+                                 chunk_size=2)
+
+        with open(path, newline="", encoding="utf-8") as handle:
+            rows = list(csv.DictReader(handle))
+        self.assertEqual(report['rows'], 2)
+        self.assertEqual([row['notes'] for row in rows], ['note 3', 'note 5'])
+        self.assertEqual({row['subject_name'] for row in rows}, {'Study'})
+
+    def test_export_gzip_jsonl_round_trips_through_importer(self):
+        """A compressed JSONL export can be imported into an empty database"""
+        path = self._path("sessions.jsonl.gz")
+        export_sessions(path)
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            first = json.loads(handle.readline())
+        self.assertEqual(first['notes'], 'note 0')
+        totals = {s.name: s.total_exp for s in database.load_all_subjects()}
+
+        configure_database(self._path("copy.db"))
+        database.init_database()
+        report = import_sessions(path)
+
+        self.assertEqual(report['rows_imported'], 10)
+        self.assertEqual({s.name: s.total_exp for s in database.load_all_subjects()}, totals)
+
+    def test_export_subjects(self):
+        """Subjects are exported with their totals"""
+        path = self._path("subjects.jsonl")
+
+        export_subjects(path)
+
+        with open(path, encoding="utf-8") as handle:
+            subjects = [json.loads(line) for line in handle]
+        self.assertEqual([s['name'] for s in subjects], ['Guitar', 'Study'])
+        self.assertEqual(subjects[1]['icon'], '📚')
+        self.assertEqual(subjects[1]['total_exp'], 5 * 6300)
+
+
+if __name__ == '__main__':
+    unittest.main()
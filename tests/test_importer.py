@@ -0,0 +1,99 @@
+import unittest
+import gzip
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+# Add the parent directory to sys.path to allow imports from project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.connection import configure_database, close_database
+from core import database
+from core.exp_engine import calculate_base_exp, apply_streak_bonus
+from core.importer import import_sessions, parse_row
+
+
+class TestImporter(unittest.TestCase):
+    """Tests for the bulk session importer"""
+
+    def setUp(self):
+        """Point the shared connection manager at a fresh database"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        configure_database(os.path.join(self.temp_dir.name, "test.db"))
+        database.init_database()
+
+    def tearDown(self):
+        close_database()
+        self.temp_dir.cleanup()
+
+    def _write(self, name, text):
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        return path
+
+    def test_parse_row_with_duration_only(self):
+        """A duration without an end time fills in the end time"""
+        subject, start, end, duration, notes, streak = parse_row(
+            {"subject": "Study", "start_time": "1000", "duration_seconds": "60"})
+
+        self.assertEqual((subject, start, end, duration, notes, streak), ("Study", 1000.0, 1060.0, 60, "", None))
+
+    def test_parse_row_rejects_negative_duration(self):
+        """A session ending before it starts is invalid"""
+        with self.assertRaises(ValueError):
+            parse_row({"subject": "Study", "start_time": "2000", "end_time": "1000"})
+
+    def test_import_csv_scores_and_aggregates(self):
+        """Imported rows are scored with streaks and rolled into the subject totals"""
+        day_one = datetime(2023, 1, 5, 18, 0)
+        day_two = datetime(2023, 1, 6, 18, 0)
+        path = self._write("sessions.csv", (
+            "subject,start_time,end_time,duration_seconds,notes\n"
+            f"Guitar,{day_one.isoformat()},,3600,scales\n"
+            f"Guitar,{day_two.timestamp()},{day_two.timestamp() + 1800},,chords\n"
+            ",1000,,60,no subject\n"
+        ))
+
+        report = import_sessions(path)
+
+        self.assertEqual(report['rows_imported'], 2)
+        self.assertEqual(report['rows_skipped'], 1)
+        self.assertEqual(report['subjects_created'], 1)
+
+        expected_exp = apply_streak_bonus(calculate_base_exp(3600), 1) + apply_streak_bonus(calculate_base_exp(1800), 2)
+        subject = database.load_all_subjects()[0]
+        self.assertEqual(subject.name, "Guitar")
+        self.assertEqual(subject.total_exp, expected_exp)
+        self.assertAlmostEqual(subject.total_hours, 1.5)
+        self.assertEqual(subject.current_streak, 2)
+        self.assertEqual(subject.last_session_date, day_two.timestamp() + 1800)
+        self.assertEqual(database.get_total_stats()['total_sessions'], 2)
+
+    def test_import_gzip_jsonl_in_batches(self):
+        """Compressed JSONL spanning several batches is imported completely"""
+        path = os.path.join(self.temp_dir.name, "sessions.jsonl.gz")
+        with gzip.open(path, "wt", encoding="utf-8") as handle:
+            for index in range(25):
+                handle.write(json.dumps({
+                    "subject": "Study", "start_time": 1_700_000_000 + index * 600,
+                    "duration_seconds": 300, "streak_days": 0,
+                }) + "\n")
+
+        report = import_sessions(path, batch_size=10)
+
+        self.assertEqual(report['rows_imported'], 25)
+        self.assertEqual(database.load_all_subjects()[0].total_exp, 25 * calculate_base_exp(300))
+
+    def test_strict_mode_raises(self):
+        """Strict imports stop at the first invalid row"""
+        path = self._write("bad.csv", "subject,start_time\nStudy,\n")
+
+        with self.assertRaises(ValueError):
+            import_sessions(path, strict=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import unittest
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+# Add the parent directory to sys.path to allow imports from project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from core.connection import configure_database, close_database
+from core import database
+from data.models import Subject
+from ui.main_window import MainWindow
+
+
+class TestStartup(unittest.TestCase):
+    """Tests for the deferred startup of the main window"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """A database file with two subjects, not yet opened by the window"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        configure_database(os.path.join(self.temp_dir.name, "test.db"))
+        database.init_database()
+        database.save_subject(Subject("Study"))
+        guitar = Subject("Guitar")
+        guitar.current_streak = 3
+        database.save_subject(guitar)
+
+    def tearDown(self):
+        self.window.app_logic.shutdown()
+        self.window.close()
+        close_database()
+        self.temp_dir.cleanup()
+
+    def _wait_for(self, condition, timeout_ms=5000):
+        """Run the event loop until condition() is true"""
+        loop = QEventLoop()
+        poll = QTimer()
+        poll.timeout.connect(lambda: condition() and loop.quit())
+        poll.start(5)
+        QTimer.singleShot(timeout_ms, loop.quit)
+        loop.exec()
+        poll.stop()
+        self.assertTrue(condition(), "timed out waiting for startup")
+
+    def test_window_is_built_before_data_and_secondary_views(self):
+        """Construction returns before loading; the rest arrives once the event loop runs"""
+        self.window = MainWindow()
+        self.assertIsNone(self.window.statistics_view)
+        self.assertFalse(self.window.app_logic.data_ready)
+
+        self.window.show()
+        self._wait_for(lambda: self.window.app_logic.data_ready and self.window.history_view is not None)
+
+        self.assertEqual(self.window.subject_list_view.subjects_model.rowCount(), 2)
+        self.assertEqual(self.window.history_view.subject_filter.count(), 3)
+
+    def test_secondary_views_catch_up_with_selection(self):
+        """Views attached after the data is ready get the subjects and the selected subject"""
+        self.window = MainWindow()
+        self._wait_for(lambda: self.window.app_logic.data_ready)
+        self.window.subject_list_view.select_subject("Guitar")
+
+        self.window.show()
+        self._wait_for(lambda: self.window.history_view is not None)
+
+        self.assertEqual(self.window.history_view.subject_filter.count(), 3)
+        self.assertEqual(self.window.statistics_view.streak_label.text(), "Streak: 3 days")
+
+
+class TestSessionControls(unittest.TestCase):
+    """Tests for starting and stopping sessions from the window"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        configure_database(os.path.join(self.temp_dir.name, "test.db"))
+        database.init_database()
+        database.save_subject(Subject("Study"))
+        self.window = MainWindow()
+        self.app_logic = self.window.app_logic
+        self._wait_for(lambda: self.app_logic.data_ready)
+        self.window.subject_list_view.select_subject("Study")
+
+    def tearDown(self):
+        self.app_logic.shutdown()
+        self.window.close()
+        close_database()
+        self.temp_dir.cleanup()
+
+    def _wait_for(self, condition, timeout_ms=5000):
+        """Run the event loop until condition() is true"""
+        loop = QEventLoop()
+        poll = QTimer()
+        poll.timeout.connect(lambda: condition() and loop.quit())
+        poll.start(5)
+        QTimer.singleShot(timeout_ms, loop.quit)
+        loop.exec()
+        poll.stop()
+        self.assertTrue(condition(), "timed out waiting for the writer")
+
+    def test_double_start_starts_one_session(self):
+        """A second Start click while the first is pending is ignored, and no error is shown"""
+        errors = []
+        self.app_logic.errorOccurred.connect(errors.append)
+
+        self.app_logic._on_start_session()
+        self.assertFalse(self.window.progression_view.start_stop_button.isEnabled())
+        self.app_logic._on_start_session()
+        self._wait_for(lambda: self.app_logic.session_manager.is_running)
+        # Commands run in order, so once this one is back the second click's would be too
+        drained = []
+        self.app_logic.db_writer.submit(lambda: None, on_done=drained.append)
+        self._wait_for(lambda: drained)
+
+        self.assertEqual(errors, [])
+        self.assertFalse(self.app_logic.start_pending)
+        self.assertTrue(self.window.progression_view.start_stop_button.isEnabled())
+        self.assertEqual(self.window.progression_view.start_stop_button.text(), "Stop")
+
+    def test_failed_save_keeps_session_for_retry(self):
+        """A session whose save fails is kept, and retrying saves it"""
+        failures = []
+        # No modal retry prompt in the test; retry by hand below
+        self.app_logic.sessionSaveFailed.disconnect(self.window._offer_save_retry)
+        self.app_logic.sessionSaveFailed.connect(failures.append)
+        self.app_logic._on_start_session()
+        self._wait_for(lambda: self.app_logic.session_manager.is_running)
+
+        with patch("ui.app_logic.commit_session", side_effect=RuntimeError("database is locked")):
+            self.app_logic._on_stop_session()
+            self._wait_for(lambda: failures)
+        self.assertEqual(len(self.app_logic.unsaved_sessions), 1)
+        self.assertIn("database is locked", failures[0])
+        self.assertEqual(database.count_sessions("Study"), 0)
+
+        self.app_logic.retry_unsaved_sessions()
+        self._wait_for(lambda: database.count_sessions("Study") == 1)
+        self.assertEqual(self.app_logic.unsaved_sessions, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
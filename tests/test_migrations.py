@@ -0,0 +1,119 @@
+import unittest
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+# Add the parent directory to sys.path to allow imports from project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.connection import configure_database, close_database
+from core import database
+from utils.time_helpers import local_day_and_offset
+from core.migrations import Migration, run_migrations, get_schema_version, LATEST_VERSION
+
+REPO_DATABASE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "exp_farm.db")
+
+
+class TestMigrations(unittest.TestCase):
+    """Tests for the schema migration runner"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "test.db")
+        configure_database(self.db_path)
+
+    def tearDown(self):
+        close_database()
+        self.temp_dir.cleanup()
+
+    def test_fresh_database_reaches_latest_version(self):
+        """A new database gets every migration"""
+        applied = database.init_database()
+
+        self.assertEqual(applied[-1], LATEST_VERSION)
+        self.assertEqual(get_schema_version(database.get_connection()), LATEST_VERSION)
+        self.assertEqual(database.init_database(), [])
+
+    def test_upgrade_existing_database(self):
+        """An unversioned database from an older install is upgraded in place"""
+        close_database()
+        shutil.copyfile(REPO_DATABASE, self.db_path)
+        legacy = sqlite3.connect(self.db_path)
+        session_count, total_seconds = legacy.execute(
+            "SELECT COUNT(*), COALESCE(SUM(duration_seconds), 0) FROM sessions").fetchone()
+        subject_names = {name for (name,) in legacy.execute("SELECT name FROM subjects")}
+        legacy.close()
+        configure_database(self.db_path)
+
+        database.init_database()
+
+        stats = database.get_total_stats()
+        self.assertEqual(stats['total_sessions'], session_count)
+        self.assertEqual(stats['total_hours'], round(total_seconds / 3600, 1))
+        self.assertEqual(get_schema_version(database.get_connection()), LATEST_VERSION)
+
+        # Subjects keep their names and sessions now point at subject ids
+        subjects = database.load_all_subjects()
+        self.assertEqual({subject.name for subject in subjects}, subject_names)
+        self.assertTrue(all(subject.id is not None for subject in subjects))
+        self.assertEqual(len(database.get_session_history(limit=session_count + 1)), session_count)
+        self.assertEqual(database.get_connection().execute("PRAGMA foreign_key_check").fetchall(), [])
+
+        # Every session got the local day and UTC offset Python would compute
+        for start_time, local_day, utc_offset in database.get_connection().execute(
+                "SELECT start_time, local_day, utc_offset FROM sessions"):
+            self.assertEqual((local_day, utc_offset), local_day_and_offset(start_time))
+
+    def test_batched_step_resumes_after_interruption(self):
+        """An interrupted batched step continues from its last committed chunk"""
+        calls = []
+
+        def schema(conn):
+            conn.execute("CREATE TABLE numbers (n INTEGER PRIMARY KEY, doubled INTEGER)")
+            conn.executemany("INSERT INTO numbers (n) VALUES (?)", [(n,) for n in range(1, 11)])
+
+        def batch(conn, position, chunk_size):
+            calls.append(position)
+            if len(calls) == 2:
+                raise KeyboardInterrupt
+            rows = conn.execute("SELECT n FROM numbers WHERE n > ? ORDER BY n LIMIT ?",
+                                (position, chunk_size)).fetchall()
+            if not rows:
+                return None
+            conn.executemany("UPDATE numbers SET doubled = n * 2 WHERE n = ?", rows)
+            return rows[-1][0]
+
+        migrations = [Migration(1, "Double numbers", schema, batch)]
+
+        with self.assertRaises(KeyboardInterrupt):
+            run_migrations(migrations, chunk_size=4)
+        conn = database.get_connection()
+        self.assertEqual(get_schema_version(conn), 0)
+        self.assertFalse(conn.in_transaction)
+
+        run_migrations(migrations, chunk_size=4)
+
+        self.assertEqual(calls, [0, 4, 4, 8, 10])
+        self.assertEqual(get_schema_version(conn), 1)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM numbers WHERE doubled = n * 2").fetchone()[0], 10)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM migration_state").fetchone()[0], 0)
+
+    def test_failed_schema_step_rolls_back(self):
+        """A schema step that fails leaves the version and tables unchanged"""
+        def schema(conn):
+            conn.execute("CREATE TABLE half_done (x INTEGER)")
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            run_migrations([Migration(1, "Broken", schema)])
+
+        conn = database.get_connection()
+        self.assertEqual(get_schema_version(conn), 0)
+        self.assertIsNone(conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'half_done'").fetchone())
+
+
+if __name__ == '__main__':
+    unittest.main()
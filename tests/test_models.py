@@ -0,0 +1,107 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data.models import (Subject, LevelCurve, get_level_curve, calculate_exp_for_level,
+                         calculate_level_from_exp, calculate_exp_to_next_level)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def loop_level(total_exp, base_exp=50000, exponent=1.25):
+    """The original one-level-at-a-time search, kept as the reference"""
+    if total_exp == 0:
+        return 1
+    level = 1
+    while total_exp >= calculate_exp_for_level(level + 1, base_exp, exponent):
+        level += 1
+    return level
+
+
+class TestLevelCurve(unittest.TestCase):
+    """Tests for table-driven level lookups"""
+
+    def test_levels_match_loop_at_thresholds(self):
+        """Every threshold and its neighbours give the same level as the loop"""
+        for level in range(1, 200):
+            threshold = calculate_exp_for_level(level)
+            for total in (threshold - 1, threshold, threshold + 1):
+                self.assertEqual(calculate_level_from_exp(total), loop_level(total), total)
+
+    def test_other_curves_match_loop(self):
+        """Small bases with repeated integer thresholds behave like the loop"""
+        for base_exp, exponent in ((1, 1.25), (100, 1.05), (50000, 2)):
+            for total in range(0, 3000, 7):
+                self.assertEqual(calculate_level_from_exp(total, base_exp, exponent),
+                                 loop_level(total, base_exp, exponent))
+
+    def test_totals_beyond_table(self):
+        """Totals past the precomputed table still get the exact level"""
+        curve = get_level_curve()
+        for level in (len(curve.thresholds), len(curve.thresholds) + 1, 500):
+            threshold = calculate_exp_for_level(level)
+            self.assertEqual(curve.level(threshold), level)
+            self.assertEqual(curve.level(threshold - 1), level - 1)
+
+    def test_exp_to_next_and_progress(self):
+        """Progress and EXP to next level follow the thresholds"""
+        self.assertEqual(calculate_exp_to_next_level(0), 62500)
+        self.assertEqual(calculate_exp_to_next_level(62500), 78125 - 62500)
+        subject = Subject("Study")
+        subject.total_exp = 62500 + (78125 - 62500) // 2
+        self.assertEqual(subject.get_current_level(), 2)
+        self.assertAlmostEqual(subject.get_progress_percentage(), 50, places=2)
+
+    def test_invalid_curve(self):
+        """Curves that never grow are rejected instead of looping forever"""
+        with self.assertRaises(ValueError):
+            LevelCurve(50000, 1)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_batch_matches_scalar(self):
+        """The batch form agrees with the scalar lookups"""
+        curve = get_level_curve()
+        totals = np.concatenate([
+            np.random.default_rng(3).integers(0, 10 ** 12, 5000),
+            [0, 62499, 62500, curve.thresholds[-1]],
+        ])
+
+        levels, exp_to_next, progress = curve.batch(totals)
+
+        self.assertEqual(levels.tolist(), [curve.level(int(t)) for t in totals])
+        self.assertEqual(exp_to_next.tolist(), [curve.exp_to_next(int(t)) for t in totals])
+        self.assertEqual(progress.tolist(), [curve.progress(int(t)) for t in totals])
+
+
+class TestSubject(unittest.TestCase):
+    """Tests for the Subject model"""
+
+    def test_subject_has_no_instance_dict(self):
+        """Subjects use slots, so unknown attributes cannot be set by mistake"""
+        subject = Subject("Study")
+        self.assertFalse(hasattr(subject, '__dict__'))
+        with self.assertRaises(AttributeError):
+            subject.totl_exp = 10
+
+    def test_level_cache_follows_total_exp(self):
+        """Assigning total_exp or calling add_exp invalidates the cached level"""
+        subject = Subject("Study")
+        self.assertEqual(subject.get_current_level(), 1)
+        self.assertEqual(subject.get_exp_for_next_level(), 62500)
+
+        subject.add_exp(62500)
+        self.assertEqual(subject.get_current_level(), 2)
+        self.assertEqual(subject.get_exp_for_next_level(), 78125 - 62500)
+        self.assertEqual(subject.get_progress_percentage(), 0)
+
+        subject.total_exp = 97656
+        self.assertEqual(subject.get_current_level(), 4)
+        self.assertEqual(subject.to_dict()['total_exp'], 97656)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+# Add the parent directory to sys.path to allow imports from project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.connection import configure_database, close_database
+from core import database, rescoring
+from core.exp_engine import TierTable, calculate_base_exp, apply_streak_bonus
+from core.rescoring import rescore_sessions, CHECKPOINT_KEY
+from data.models import Subject
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestRescoring(unittest.TestCase):
+    """Tests for the retroactive rescoring job"""
+
+    def setUp(self):
+        """Store sessions whose EXP was scored with old, wrong rules"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        configure_database(os.path.join(self.temp_dir.name, "test.db"))
+        database.init_database()
+
+        database.save_subject(Subject("Study"))
+        for index in range(10):
+            start_time = 1_700_000_000.0 + index * 86400
+            database.commit_session({
+                'subject': 'Study', 'start_time': start_time, 'end_time': start_time + 600 * (index + 1),
+                'duration_seconds': 600 * (index + 1), 'base_exp': 1, 'bonus_exp': 1,
+                'total_exp': 2, 'streak_days': index, 'notes': '',
+            })
+
+    def tearDown(self):
+        close_database()
+        self.temp_dir.cleanup()
+
+    def _expected_totals(self, tier_table=None):
+        return [apply_streak_bonus(calculate_base_exp(600 * (index + 1), tier_table), index)
+                for index in range(10)]
+
+    def _stored_totals(self):
+        return [row[0] for row in database.get_connection().execute("SELECT total_exp FROM sessions ORDER BY id")]
+
+    def test_rescore_updates_sessions_and_subjects(self):
+        """Stale scores are rewritten and subject totals rebuilt"""
+        report = rescore_sessions(chunk_size=3)
+
+        expected = self._expected_totals()
+        self.assertEqual(self._stored_totals(), expected)
+        self.assertEqual(report['rows_scanned'], 10)
+        self.assertEqual(report['rows_updated'], 10)
+        self.assertEqual(database.load_all_subjects()[0].total_exp, sum(expected))
+        rollup_exp = database.get_connection().execute("SELECT SUM(total_exp) FROM daily_rollups").fetchone()[0]
+        self.assertEqual(rollup_exp, sum(expected))
+        self.assertIsNone(database.get_app_state(CHECKPOINT_KEY))
+
+        # A second run finds nothing to change
+        self.assertEqual(rescore_sessions()['rows_updated'], 0)
+
+    def test_rescore_with_custom_tier_table(self):
+        """A different tier table is applied to every session"""
+        table = TierTable([1200], [5, 50])
+
+        rescore_sessions(tier_table=table)
+
+        self.assertEqual(self._stored_totals(), self._expected_totals(table))
+
+    def test_interrupted_rescore_resumes_from_checkpoint(self):
+        """A rescore stopped part-way continues after its last committed chunk"""
+        real_score_chunk = rescoring._score_chunk
+        calls = []
+
+        def failing_score_chunk(rows, tier_table):
+            calls.append(rows[0][0])
+            if len(calls) == 2:
+                raise KeyboardInterrupt
+            return real_score_chunk(rows, tier_table)
+
+        with patch('core.rescoring._score_chunk', failing_score_chunk):
+            with self.assertRaises(KeyboardInterrupt):
+                rescore_sessions(chunk_size=4)
+        self.assertEqual(database.get_app_state(CHECKPOINT_KEY)['last_id'], 4)
+
+        report = rescore_sessions(chunk_size=4)
+
+        self.assertEqual(report['resumed_from'], 4)
+        self.assertEqual(report['rows_scanned'], 6)
+        self.assertEqual(self._stored_totals(), self._expected_totals())
+
+    def test_checkpoint_from_other_rules_is_ignored(self):
+        """A checkpoint taken under different rules starts the rescore over"""
+        database.set_app_state(CHECKPOINT_KEY, {'last_id': 8, 'rules': 'old rules'})
+
+        report = rescore_sessions()
+
+        self.assertEqual(report['resumed_from'], 0)
+        self.assertEqual(self._stored_totals(), self._expected_totals())
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_rescore_uses_batch_scoring(self):
+        """With numpy installed each chunk is scored by the vectorized path"""
+        with patch.object(rescoring, "score_sessions_batch", wraps=rescoring.score_sessions_batch) as batch, \
+                patch.object(rescoring, "calculate_base_exp", wraps=rescoring.calculate_base_exp) as scalar:
+            rescore_sessions(chunk_size=4)
+
+        self.assertEqual(batch.call_count, 3)
+        scalar.assert_not_called()
+        self.assertEqual(self._stored_totals(), self._expected_totals())
+
+    def test_rescore_without_numpy_scores_row_by_row(self):
+        """The scalar path gives the same scores when numpy is missing"""
+        with patch.object(rescoring, "score_sessions_batch", side_effect=ImportError("no numpy")):
+            rescore_sessions(chunk_size=4)
+
+        self.assertEqual(self._stored_totals(), self._expected_totals())
+
+
+if __name__ == '__main__':
+    unittest.main()
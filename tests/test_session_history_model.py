@@ -0,0 +1,125 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# Add the parent directory to sys.path to allow imports from project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication, Qt
+
+from core.connection import configure_database, close_database
+from core import database
+from data.models import Subject
+from ui.components.session_history_model import SessionHistoryModel
+from utils.time_helpers import timestamp_to_local_day
+
+START_TIME = 1_700_000_000.0
+
+
+class TestSessionHistoryModel(unittest.TestCase):
+    """Tests for the paged session history model"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        """Fill a temporary database with 30 Study sessions, one per hour, and 5 Guitar sessions"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        configure_database(os.path.join(self.temp_dir.name, "test.db"))
+        database.init_database()
+        database.save_subject(Subject("Study"))
+        database.save_subject(Subject("Guitar"))
+        for index in range(35):
+            start_time = START_TIME + index * 3600
+            database.save_session({
+                'subject': "Study" if index < 30 else "Guitar",
+                'start_time': start_time, 'end_time': start_time + 5400,
+                'duration_seconds': 5400, 'base_exp': 1000, 'bonus_exp': 234,
+                'total_exp': 1234, 'streak_days': 2, 'notes': f"note {index}",
+            })
+
+        self.pages = []
+        fetch_page = database.get_session_page
+
+        def counting_fetch_page(*args):
+            self.pages.append(args[1])
+            return fetch_page(*args)
+
+        self.model = SessionHistoryModel(fetch_page=counting_fetch_page)
+        self.model.PAGE_SIZE = 4
+        self.model.MAX_CACHED_PAGES = 2
+        self.model.refresh()
+
+    def tearDown(self):
+        close_database()
+        self.temp_dir.cleanup()
+
+    def _fetch_all(self):
+        while self.model.canFetchMore():
+            self.model.fetchMore()
+
+    def test_rows_are_fetched_in_pages(self):
+        """Only the first page is read until the view asks for more"""
+        self.assertEqual(self.model.rowCount(), 4)
+        self.assertEqual(self.model.total_count(), 35)
+        self.assertEqual(len(self.pages), 1)
+
+        self.model.fetchMore()
+        self.assertEqual(self.model.rowCount(), 8)
+
+        self._fetch_all()
+        self.assertEqual(self.model.rowCount(), 35)
+        self.assertFalse(self.model.canFetchMore())
+
+    def test_rows_are_newest_first(self):
+        """Rows follow the history order, newest first"""
+        self._fetch_all()
+        starts = [self.model.session_at(row)[2] for row in range(self.model.rowCount())]
+        self.assertEqual(starts, sorted(starts, reverse=True))
+        self.assertEqual(len(set(starts)), 35)
+
+    def test_cells_are_formatted(self):
+        """Display text is built from the raw row"""
+        values = [self.model.index(0, column).data() for column in range(self.model.columnCount())]
+
+        self.assertEqual(values[1:], ["Guitar", "1h 30m", "1,234", "2", "note 34"])
+        self.assertEqual(self.model.headerData(2, Qt.Orientation.Horizontal), "Duration")
+
+    def test_cache_is_bounded(self):
+        """Old pages are evicted and read again from their cursor when revisited"""
+        self._fetch_all()
+        self.assertLessEqual(len(self.model._pages), 2)
+        reads = len(self.pages)
+
+        self.assertEqual(self.model.index(0, 5).data(), "note 34")
+        self.assertEqual(len(self.pages), reads + 1)
+        self.assertIsNone(self.pages[-1])
+        # The page is cached again now
+        self.assertEqual(self.model.index(1, 5).data(), "note 33")
+        self.assertEqual(len(self.pages), reads + 1)
+
+    def test_subject_filter(self):
+        """Filtering by subject resets the rows and the count"""
+        self.model.set_filter("Guitar")
+        self._fetch_all()
+
+        self.assertEqual(self.model.rowCount(), 5)
+        self.assertEqual(self.model.total_count(), 5)
+        self.assertEqual({self.model.index(row, 1).data() for row in range(5)}, {"Guitar"})
+
+    def test_day_filter(self):
+        """Filtering by day range only shows sessions started on those days"""
+        first_day = timestamp_to_local_day(START_TIME)
+        self.model.set_filter("Study", first_day, first_day)
+        self._fetch_all()
+
+        days = {timestamp_to_local_day(self.model.session_at(row)[2]) for row in range(self.model.rowCount())}
+        self.assertEqual(days, {first_day})
+        self.assertEqual(self.model.rowCount(), self.model.total_count())
+
+
+if __name__ == '__main__':
+    unittest.main()
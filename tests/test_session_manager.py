@@ -31,26 +31,28 @@ class TestSessionManager(unittest.TestCase):
         self.mock_subjects[0].current_streak = 2
 
         # Use patchers to avoid actual database calls
-        self.load_all_subjects_patcher = patch('core.session_manager.load_all_subjects')
-        self.mock_load_all_subjects = self.load_all_subjects_patcher.start()
-        self.mock_load_all_subjects.return_value = self.mock_subjects
+        self.start_state_patcher = patch('core.session_manager.get_session_start_state')
+        self.mock_start_state = self.start_state_patcher.start()
+        self.mock_start_state.side_effect = self._start_state
 
-        self.save_session_patcher = patch('core.session_manager.save_session')
-        self.mock_save_session = self.save_session_patcher.start()
-
-        self.update_subject_patcher = patch('core.session_manager.update_subject_after_session')
-        self.mock_update_subject = self.update_subject_patcher.start()
-
-        self.calculate_streak_patcher = patch('core.session_manager.calculate_current_streak')
-        self.mock_calculate_streak = self.calculate_streak_patcher.start()
-        self.mock_calculate_streak.return_value = 2  # Default streak value for tests
+        self.commit_session_patcher = patch('core.session_manager.commit_session')
+        self.mock_commit_session = self.commit_session_patcher.start()
 
     def tearDown(self):
         """Clean up after each test - stop all patchers"""
-        self.load_all_subjects_patcher.stop()
-        self.save_session_patcher.stop()
-        self.update_subject_patcher.stop()
-        self.calculate_streak_patcher.stop()
+        self.start_state_patcher.stop()
+        self.commit_session_patcher.stop()
+
+    def _start_state(self, subject_name, start_time=None):
+        """Stand-in for get_session_start_state backed by the mock subjects"""
+        subject = next((s for s in self.mock_subjects if s.name == subject_name), None)
+        if subject is None:
+            return None
+        return {
+            'subject_id': subject.id,
+            'last_session_date': subject.last_session_date,
+            'streak_days': 2  # Default streak value for tests
+        }
 
     def test_start_session(self):
         """Test starting a new session"""
@@ -63,6 +65,12 @@ class TestSessionManager(unittest.TestCase):
         self.assertEqual(result['streak_days'], 2)
         self.assertIsNotNone(result['start_time'])
 
+    def test_start_session_single_lookup(self):
+        """Test that starting a session needs only one subject lookup"""
+        self.session_manager.start_session("Study")
+
+        self.mock_start_state.assert_called_once_with("Study")
+
     def test_start_session_invalid_subject(self):
         """Test starting a session with an invalid subject name"""
         with self.assertRaises(ValueError):
@@ -75,6 +83,20 @@ class TestSessionManager(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             self.session_manager.start_session("Guitar")
 
+    def test_begin_session_uses_given_state(self):
+        """Test starting a session from a lookup made elsewhere, without a database call"""
+        result = self.session_manager.begin_session("Study", {'subject_id': 1, 'streak_days': 5})
+
+        self.assertTrue(self.session_manager.is_running)
+        self.assertEqual(result['streak_days'], 5)
+        self.mock_start_state.assert_not_called()
+
+    def test_begin_session_missing_subject(self):
+        """Test that an empty lookup result means the subject does not exist"""
+        with self.assertRaises(ValueError):
+            self.session_manager.begin_session("InvalidSubject", None)
+        self.assertFalse(self.session_manager.is_running)
+
     def test_stop_session(self):
         """Test stopping a session and calculating results"""
         # Start a session with a mocked start time
@@ -99,11 +121,60 @@ class TestSessionManager(unittest.TestCase):
         self.assertEqual(result['duration_seconds'], 10)  # Explicitly check for 10 seconds
         self.assertEqual(result['notes'], 'Test notes')
 
-        # Verify that save_session was called
-        self.mock_save_session.assert_called_once()
+        # Verify that the session was committed once with the results
+        self.mock_commit_session.assert_called_once_with(result)
+
+    def test_finish_session_does_not_commit(self):
+        """Test that finish_session scores the session but leaves saving to the caller"""
+        self.session_manager.start_session("Study")
+
+        result = self.session_manager.finish_session("Later")
 
-        # Verify that update_subject_after_session was called
-        self.mock_update_subject.assert_called_once()
+        self.assertFalse(self.session_manager.is_running)
+        self.assertEqual(result['notes'], 'Later')
+        self.assertNotIn('subject_state', result)
+        self.mock_commit_session.assert_not_called()
+
+    def test_resume_session(self):
+        """A session saved by another process can be resumed and stopped"""
+        self.session_manager.start_session("Study")
+        saved = dict(self.session_manager.current_session)
+        self.session_manager.finish_session()
+
+        other_manager = SessionManager()
+        other_manager.resume_session(saved)
+        result = other_manager.stop_session()
+
+        self.assertEqual(result['subject'], "Study")
+        self.assertEqual(result['start_time'], saved['start_time'])
+        other_manager.resume_session(saved)
+        with self.assertRaises(RuntimeError):
+            other_manager.resume_session(saved)
+
+    def test_log_past_session(self):
+        """A past session is scored with the streak of its day and committed"""
+        start_time = time.time() - 2 * 86400
+
+        result = self.session_manager.log_past_session("Study", start_time, 2700, "Logged")
+
+        self.mock_start_state.assert_called_once_with("Study", start_time=start_time)
+        self.assertEqual(result['duration_seconds'], 2700)
+        self.assertEqual(result['end_time'], start_time + 2700)
+        self.assertEqual(result['base_exp'], calculate_base_exp(2700))
+        self.assertEqual(result['total_exp'], apply_streak_bonus(calculate_base_exp(2700), 2))
+        self.assertEqual(result['notes'], "Logged")
+        self.mock_commit_session.assert_called_once()
+        self.assertFalse(self.session_manager.is_running)
+
+    def test_log_past_session_rejects_bad_input(self):
+        """Past sessions must have a positive length, have ended and belong to a subject"""
+        with self.assertRaises(ValueError):
+            self.session_manager.log_past_session("Study", time.time() - 3600, 0)
+        with self.assertRaises(ValueError):
+            self.session_manager.log_past_session("Study", time.time() - 60, 3600)
+        with self.assertRaises(ValueError):
+            self.session_manager.log_past_session("Missing", time.time() - 7200, 3600)
+        self.mock_commit_session.assert_not_called()
 
     def test_stop_session_no_session(self):
         """Test stopping when no session is running"""
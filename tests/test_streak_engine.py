@@ -0,0 +1,79 @@
+import unittest
+import os
+import sys
+import tempfile
+from datetime import date, datetime
+
+# Add the parent directory to sys.path to allow imports from project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.connection import configure_database, close_database
+from core import database
+from core.streak_engine import compute_streaks, active_streak, repair_streaks
+from data.models import Subject
+
+
+class TestStreakEngine(unittest.TestCase):
+    """Tests for set-based streak calculation"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        configure_database(os.path.join(self.temp_dir.name, "test.db"))
+        database.init_database()
+
+        for name in ("Study", "Guitar", "Drawing"):
+            database.save_subject(Subject(name))
+        # Study: Jan 1-3 (twice on the 2nd), then Jan 5-6
+        for day in (1, 2, 2, 3, 5, 6):
+            self._add_session("Study", date(2024, 1, day))
+        self._add_session("Guitar", date(2024, 1, 10))
+        self.ids = {s.name: s.id for s in database.load_all_subjects()}
+
+    def tearDown(self):
+        close_database()
+        self.temp_dir.cleanup()
+
+    def _add_session(self, subject, day):
+        start_time = datetime(day.year, day.month, day.day, 12).timestamp()
+        database.save_session({
+            'subject': subject, 'start_time': start_time, 'end_time': start_time + 600,
+            'duration_seconds': 600, 'base_exp': 6000, 'bonus_exp': 0,
+            'total_exp': 6000, 'streak_days': 1,
+        })
+
+    def test_current_and_longest_streaks(self):
+        """Repeated days count once and the last run is the current streak"""
+        streaks = compute_streaks()
+
+        study = streaks[self.ids["Study"]]
+        self.assertEqual((study.current, study.longest), (2, 3))
+        self.assertEqual(study.last_day, date(2024, 1, 6).toordinal())
+        self.assertEqual(streaks[self.ids["Guitar"]][1:3], (1, 1))
+        self.assertNotIn(self.ids["Drawing"], streaks)
+
+    def test_rollups_give_the_same_streaks(self):
+        """Reading days from the rollups agrees with the sessions"""
+        self.assertEqual(compute_streaks(from_rollups=True), compute_streaks())
+
+    def test_active_streak(self):
+        """A streak is only held while the subject was active today or yesterday"""
+        study = compute_streaks()[self.ids["Study"]]
+
+        self.assertEqual(active_streak(study, date(2024, 1, 7)), 2)
+        self.assertEqual(active_streak(study, date(2024, 1, 8)), 0)
+
+    def test_repair_streaks(self):
+        """Wrong stored streaks are rewritten and correct ones left alone"""
+        conn = database.get_connection()
+        conn.execute("UPDATE subjects SET current_streak = 40 WHERE name IN ('Study', 'Drawing')")
+        conn.execute("UPDATE subjects SET current_streak = 1 WHERE name = 'Guitar'")
+
+        self.assertEqual(repair_streaks(), 2)
+
+        stored = {s.name: s.current_streak for s in database.load_all_subjects()}
+        self.assertEqual(stored, {"Study": 2, "Guitar": 1, "Drawing": 0})
+        self.assertEqual(repair_streaks(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
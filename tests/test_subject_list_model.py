@@ -0,0 +1,85 @@
+import unittest
+import os
+import sys
+
+# Add the parent directory to sys.path to allow imports from project
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication
+
+from data.models import Subject
+from ui.components.subject_list_model import SubjectListModel
+
+
+class TestSubjectListModel(unittest.TestCase):
+    """Tests for the lazily fetched subject list model"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.model = SubjectListModel()
+        self.model.FETCH_BATCH = 10
+        self.model.set_subjects([Subject(f"Subject {n}") for n in range(25)])
+        self.inserted = []
+        self.removed = []
+        self.changed = []
+        self.model.rowsInserted.connect(lambda parent, first, last: self.inserted.append((first, last)))
+        self.model.rowsRemoved.connect(lambda parent, first, last: self.removed.append((first, last)))
+        self.model.dataChanged.connect(lambda first, last: self.changed.append(first.row()))
+
+    def test_rows_are_fetched_in_batches(self):
+        """Only the first batch is visible until more is fetched"""
+        self.assertEqual(self.model.rowCount(), 10)
+        self.assertTrue(self.model.canFetchMore())
+
+        self.model.fetchMore()
+        self.model.fetchMore()
+
+        self.assertEqual(self.inserted, [(10, 19), (20, 24)])
+        self.assertFalse(self.model.canFetchMore())
+        self.assertEqual(self.model.index(24).data(), "Subject 24")
+
+    def test_add_subject_to_partially_loaded_model(self):
+        """A new subject past the loaded rows waits to be fetched"""
+        self.model.add_subject(Subject("New"))
+
+        self.assertEqual(self.inserted, [])
+        self.assertEqual(self.model.row_of("New"), 25)
+
+    def test_add_subject_to_fully_loaded_model(self):
+        """A new subject is inserted as one row once everything is loaded"""
+        while self.model.canFetchMore():
+            self.model.fetchMore()
+        self.inserted.clear()
+
+        self.model.add_subject(Subject("New"))
+
+        self.assertEqual(self.inserted, [(25, 25)])
+        self.assertEqual(self.model.index(25).data(), "New")
+
+    def test_remove_subject(self):
+        """Removing a row shifts the rows after it"""
+        self.assertTrue(self.model.remove_subject("Subject 3"))
+
+        self.assertEqual(self.removed, [(3, 3)])
+        self.assertEqual(self.model.row_of("Subject 4"), 3)
+        self.assertEqual(self.model.index(3).data(), "Subject 4")
+        self.assertFalse(self.model.remove_subject("Missing"))
+
+    def test_update_and_rename_subject(self):
+        """Updated rows emit dataChanged; renames move the name lookup"""
+        renamed = Subject("Renamed")
+
+        self.assertTrue(self.model.update_subject(renamed, old_name="Subject 2"))
+
+        self.assertEqual(self.changed, [2])
+        self.assertEqual(self.model.index(2).data(), "Renamed")
+        self.assertEqual(self.model.row_of("Subject 2"), -1)
+        self.assertIs(self.model.index(2).data(SubjectListModel.SubjectRole), renamed)
+
+
+if __name__ == '__main__':
+    unittest.main()
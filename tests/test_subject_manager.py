@@ -36,6 +36,13 @@ class TestSubjectManager(unittest.TestCase):
         self.delete_subject_patcher = patch('core.subject_manager.db_delete_subject')
         self.mock_delete_subject = self.delete_subject_patcher.start()
 
+        self.rename_subject_patcher = patch('core.subject_manager.db_rename_subject')
+        self.mock_rename_subject = self.rename_subject_patcher.start()
+
+        self.data_version_patcher = patch('core.subject_manager.get_data_version')
+        self.mock_data_version = self.data_version_patcher.start()
+        self.mock_data_version.return_value = 1
+
         # Create the SubjectManager with mocked dependencies
         self.subject_manager = SubjectManager()
 
@@ -44,6 +51,8 @@ class TestSubjectManager(unittest.TestCase):
         self.load_all_subjects_patcher.stop()
         self.save_subject_patcher.stop()
         self.delete_subject_patcher.stop()
+        self.rename_subject_patcher.stop()
+        self.data_version_patcher.stop()
 
     def test_create_subject(self):
         """Test creating a new subject"""
@@ -155,6 +164,54 @@ class TestSubjectManager(unittest.TestCase):
         self.assertFalse(result)
         self.mock_save_subject.assert_not_called()
 
+    def test_rename_subject(self):
+        """Test renaming a subject"""
+        result = self.subject_manager.rename_subject("Study", "Studying")
+
+        self.assertTrue(result)
+        self.mock_rename_subject.assert_called_once_with("Study", "Studying")
+        self.assertIsNotNone(self.subject_manager.get_subject_by_name("Studying"))
+        self.assertIsNone(self.subject_manager.get_subject_by_name("Study"))
+
+    def test_rename_subject_to_existing_name(self):
+        """Test renaming a subject to a name that is already taken"""
+        with self.assertRaises(ValueError):
+            self.subject_manager.rename_subject("Study", "Guitar")
+
+        self.mock_rename_subject.assert_not_called()
+
+    def test_get_all_subjects_uses_registry(self):
+        """Test that unchanged data is served without reloading"""
+        self.subject_manager.get_all_subjects()
+        self.subject_manager.create_subject("Reading")
+        subjects = self.subject_manager.get_all_subjects()
+
+        self.assertEqual(self.mock_load_all_subjects.call_count, 1)
+        self.assertEqual(subjects[-1].name, "Reading")
+
+    def test_get_all_subjects_reloads_after_external_change(self):
+        """Test that a change by another connection triggers a reload"""
+        self.mock_load_all_subjects.return_value = [Subject("Drawing")]
+        self.mock_data_version.return_value = 2
+
+        subjects = self.subject_manager.get_all_subjects()
+
+        self.assertEqual([s.name for s in subjects], ["Drawing"])
+
+    def test_apply_subject_state(self):
+        """Test that fresh state is copied into the registered subject in place"""
+        study = self.subject_manager.get_subject_by_name("Study")
+        state = Subject("Study", "📚")
+        state.total_exp = 123456
+        state.current_streak = 4
+
+        self.subject_manager.apply_subject_state(state)
+
+        self.assertIs(self.subject_manager.get_subject_by_name("Study"), study)
+        self.assertEqual(study.total_exp, 123456)
+        self.assertEqual(study.current_streak, 4)
+        self.mock_load_all_subjects.assert_called_once()
+
     def test_refresh_subjects(self):
         """Test refreshing subjects from database"""
         # Create new subjects list that will be used when refresh_subjects is called
@@ -175,6 +232,18 @@ class TestSubjectManager(unittest.TestCase):
         self.assertEqual(len(subjects), len(new_mock_subjects))
         self.assertEqual(subjects[-1].name, "Reading")  # Check for the new subject
 
+    def test_deferred_load_and_adopt_subjects(self):
+        """A manager created with load=False stays empty until subjects are handed over"""
+        self.mock_load_all_subjects.reset_mock()
+        manager = SubjectManager(load=False)
+        self.assertEqual(manager.subjects, [])
+
+        manager.adopt_subjects(self.mock_subjects)
+
+        self.assertEqual([subject.name for subject in manager.get_all_subjects()], ["Study", "Guitar"])
+        # The handed-over subjects are current, so nothing is reloaded
+        self.mock_load_all_subjects.assert_not_called()
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -5,7 +5,10 @@ import os
 # Add the parent directory to the Python path so we can import our modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.time_helpers import seconds_to_human_readable, minutes_to_seconds
+from datetime import date, datetime
+from utils.time_helpers import (seconds_to_human_readable, minutes_to_seconds,
+                                 timestamp_to_local_day, local_day_to_date, local_day_and_offset,
+                                 local_day_start)
 
 
 class TestTimeHelpers(unittest.TestCase):
@@ -62,6 +65,31 @@ class TestTimeHelpers(unittest.TestCase):
         # 2-hour session (example from your docs)
         self.assertEqual(seconds_to_human_readable(120 * 60), "2h")
 
+    def test_local_day_round_trip(self):
+        # Day numbers follow the local calendar date
+        timestamp = datetime(2024, 3, 15, 23, 30).timestamp()
+        day = timestamp_to_local_day(timestamp)
+        self.assertEqual(local_day_to_date(day), date(2024, 3, 15))
+
+        # Consecutive dates have consecutive day numbers
+        next_morning = datetime(2024, 3, 16, 0, 30).timestamp()
+        self.assertEqual(timestamp_to_local_day(next_morning), day + 1)
+
+    def test_local_day_and_offset(self):
+        # The offset maps the epoch time onto the same local day
+        timestamp = datetime(2024, 7, 1, 8, 0).timestamp()
+        day, offset = local_day_and_offset(timestamp)
+        self.assertEqual(day, timestamp_to_local_day(timestamp))
+        self.assertEqual((int(timestamp) + offset) // 86400 + date(1970, 1, 1).toordinal(), day)
+
+    def test_local_day_start(self):
+        # The day starts at local midnight and the previous second is the day before
+        day = date(2024, 3, 15).toordinal()
+        start = local_day_start(day)
+        self.assertEqual(start, datetime(2024, 3, 15).timestamp())
+        self.assertEqual(timestamp_to_local_day(start), day)
+        self.assertEqual(timestamp_to_local_day(start - 1), day - 1)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,12 +1,30 @@
 # ui/app_logic.py
+from typing import TYPE_CHECKING
+
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 from core.subject_manager import SubjectManager
 from core.session_manager import SessionManager
+from core.database import (commit_session, save_subject, init_database, load_all_subjects,
+                           get_session_start_state)
+from data.models import Subject
+from ui.db_writer import DatabaseWriter
 from ui.views.subject_list_view import SubjectListView
 from ui.views.progression_view import ProgressionView
-from ui.views.statistics_view import StatisticsView
-from ui.views.add_subject_dialog import AddSubjectDialog
-from PyQt6.QtWidgets import QDialog
+
+if TYPE_CHECKING:
+    # Secondary views are imported by MainWindow after the first frame
+    from ui.views.statistics_view import StatisticsView
+    from ui.views.session_history_view import SessionHistoryView
+
+
+def _prepare_database():
+    """
+    Create or upgrade the database and read every subject; runs on the writer thread
+    :return: list: All subjects
+    """
+    init_database()
+    return load_all_subjects()
+
 
 class AppLogic(QObject):
     """
@@ -17,24 +35,41 @@ class AppLogic(QObject):
     # --- Custom Signals ---
     # Update subject with new subject data
     subjectUpdated = pyqtSignal(object)
+    # A background database command failed, with a message for the user
+    errorOccurred = pyqtSignal(str)
+    # The database is ready and the subjects are loaded
+    dataReady = pyqtSignal()
+    # A stopped session could not be saved and is kept for retry_unsaved_sessions
+    sessionSaveFailed = pyqtSignal(str)
 
     def __init__(self, subject_list_view: SubjectListView, progression_view: ProgressionView,
-                 statistics_view: StatisticsView):
+                 statistics_view: "StatisticsView" = None, history_view: "SessionHistoryView" = None):
         """
         :param subject_list_view: view for list of subjects
         :param progression_view: view for session progression
-        :param statistics_view: view for subject stats
+        :param statistics_view: optional view for subject stats, or attach it later
+        :param history_view: optional view for past sessions, or attach it later
         """
         super().__init__()
 
         # --- Backend Managers ---
-        self.subject_manager = SubjectManager()
+        # Subjects are loaded in the background by load_initial_data
+        self.subject_manager = SubjectManager(load=False)
         self.session_manager = SessionManager()
+        # All database writes run here, in order, off the GUI thread
+        self.db_writer = DatabaseWriter(self)
+        self.db_writer.start()
+        self.data_ready = False
+        # A start is waiting for its subject lookup on the writer
+        self.start_pending = False
+        # Stopped sessions whose save failed, oldest first
+        self.unsaved_sessions = []
 
         # --- UI Views ---
         self.subject_list_view = subject_list_view
         self.progression_view = progression_view
-        self.statistics_view = statistics_view
+        self.statistics_view = None
+        self.history_view = None
 
         # --- Timers ---
         self.session_timer = QTimer(self)
@@ -47,20 +82,50 @@ class AppLogic(QObject):
         self.progression_view.startClicked.connect(self._on_start_session)
         self.progression_view.stopClicked.connect(self._on_stop_session)
         self.subjectUpdated.connect(self.progression_view.update_view)
-        self.subjectUpdated.connect(self.statistics_view.update_view)
+        self.attach_views(statistics_view, history_view)
 
         # --- Initial Data Load ---
         self.load_initial_data()
 
+    def attach_views(self, statistics_view: "StatisticsView" = None, history_view: "SessionHistoryView" = None):
+        """
+        Connect views built after the controller, catching them up with the current state
+        :param statistics_view: view for subject stats
+        :param history_view: view for past sessions
+        :return:
+        """
+        if statistics_view is not None:
+            self.statistics_view = statistics_view
+            self.subjectUpdated.connect(statistics_view.update_view)
+            selected_subject_name = self.subject_list_view.current_subject_name()
+            if selected_subject_name:
+                statistics_view.update_view(self.subject_manager.get_subject_by_name(selected_subject_name))
+        if history_view is not None:
+            self.history_view = history_view
+            if self.data_ready:
+                history_view.populate_subjects([subject.name for subject in self.subject_manager.subjects])
+
     def load_initial_data(self):
         """
-        Loads initial data for application
+        Prepares the database and loads the subjects on the writer thread; dataReady follows
+        :return:
+        """
+        self.db_writer.submit(_prepare_database, on_done=self._on_initial_data_loaded,
+                              on_error=self._on_write_failed)
+
+    def _on_initial_data_loaded(self, subjects: list):
+        """
+        Handles the subjects once the background load is done
+        :param subjects: All subjects
         :return:
         """
-        # Get all subjects
-        subjects = self.subject_manager.get_all_subjects()
+        self.subject_manager.adopt_subjects(subjects)
         # Populate subject list view with retrieved subjects
-        self.subject_list_view.populate_subjects(subjects)
+        self.subject_list_view.populate_subjects(self.subject_manager.subjects)
+        if self.history_view is not None:
+            self.history_view.populate_subjects([subject.name for subject in subjects])
+        self.data_ready = True
+        self.dataReady.emit()
 
     def _on_subject_selected(self, subject_name: str):
         """
@@ -78,54 +143,167 @@ class AppLogic(QObject):
         handles signal for Add new subject button click
         :return:
         """
+        # Only needed once the user asks for it
+        from PyQt6.QtWidgets import QDialog
+        from ui.views.add_subject_dialog import AddSubjectDialog
+
         dialog = AddSubjectDialog()
         if dialog.exec() == QDialog.DialogCode.Accepted:
             name, icon = dialog.get_subject_data()
             if name:
-                try:
-                    self.subject_manager.create_subject(name, icon)
-                    self.load_initial_data()
-                except ValueError as e:
-                    print(f"Error creating subject: {e}")
+                if self.subject_manager.get_subject_by_name(name) is not None:
+                    self._on_write_failed(ValueError(f"Subject '{name}' already exists"))
+                    return
+                subject = Subject(name, icon)
+                self.db_writer.submit(save_subject, subject,
+                                      on_done=lambda _: self._on_subject_created(subject),
+                                      on_error=self._on_write_failed)
+
+    def _on_subject_created(self, subject: Subject):
+        """
+        Handles a new subject once it is saved
+        :param subject: The saved subject
+        :return:
+        """
+        subject = self.subject_manager.apply_subject_state(subject)
+        self.subject_list_view.add_subject(subject)
+        if self.history_view is not None:
+            self.history_view.add_subject(subject.name)
+
     def _on_start_session(self):
         """
         Handles the event when the start button is clicked
         :return:
         """
-        selected_item = self.subject_list_view.subjects_list.currentItem()
-        if selected_item:
-            # Get Subject name from item object
-            selected_subject_name = selected_item.text()
-            # Start new session
-            self.session_manager.start_session(selected_subject_name)
-            # Set session with "Active" status
-            self.progression_view.set_session_active(True)
-            # Start timer
-            self.session_timer.start()
+        selected_subject_name = self.subject_list_view.current_subject_name()
+        if not selected_subject_name or self.start_pending or self.session_manager.is_running:
+            return
+        # Look the subject up on the writer, so it sees any commit still in its queue;
+        # the session itself only ever changes on the GUI thread
+        self.start_pending = True
+        self.progression_view.start_stop_button.setEnabled(False)
+        self.db_writer.submit(get_session_start_state, selected_subject_name,
+                              on_done=lambda state: self._on_start_state_loaded(selected_subject_name, state),
+                              on_error=self._on_start_failed)
+
+    def _on_start_state_loaded(self, subject_name: str, state: dict):
+        """
+        Starts the session once the subject lookup is done
+        :param subject_name: Subject to start
+        :param state: Its get_session_start_state result
+        :return:
+        """
+        self.start_pending = False
+        self.progression_view.start_stop_button.setEnabled(True)
+        try:
+            self.session_manager.begin_session(subject_name, state)
+        except (ValueError, RuntimeError) as error:
+            self._on_write_failed(error)
+            return
+        # Set session with "Active" status
+        self.progression_view.set_session_active(True)
+        # Start timer
+        self.session_timer.start()
+
+    def _on_start_failed(self, error: Exception):
+        """
+        Handles a failed subject lookup for a start
+        :param error: The exception it raised
+        :return:
+        """
+        self.start_pending = False
+        self.progression_view.start_stop_button.setEnabled(True)
+        self._on_write_failed(error)
 
     def _on_stop_session(self):
         """
-        Handles the event when the start button is clicked
+        Handles the event when the stop button is clicked
         :return:
         """
-        # Stop current session
-        self.session_manager.stop_session()
+        # Stop current session and score it
+        results = self.session_manager.finish_session()
         # Set session with "Inactive" status
         self.progression_view.set_session_active(False)
         # Stop timer
         self.session_timer.stop()
-        # Hot reload subjects
-        self.subject_manager.refresh_subjects()
-        # Get current selected subject
-        selected_item = self.subject_list_view.subjects_list.currentItem()
-        if selected_item:
-            # Get Subject name from item object
-            selected_subject_name = selected_item.text()
-            # Retrieve subject
-            subject = self.subject_manager.get_subject_by_name(selected_subject_name)
+        # Save it in the background
+        self._save_session(results)
+
+    def _save_session(self, results: dict):
+        """
+        Saves a finished session on the writer, keeping it if the save fails
+        :param results: The scored session, from finish_session
+        :return:
+        """
+        self.db_writer.submit(commit_session, results,
+                              on_done=lambda subject_state: self._on_session_committed(subject_state, results),
+                              on_error=lambda error: self._on_session_save_failed(error, results))
+
+    def _on_session_save_failed(self, error: Exception, results: dict):
+        """
+        Keeps a session that could not be saved, so it can be retried
+        :param error: The exception commit_session raised
+        :param results: The scored session
+        :return:
+        """
+        print(f"Database error: {error}")
+        self.unsaved_sessions.append(results)
+        self.sessionSaveFailed.emit(f"The {results['subject']} session could not be saved: {error}")
+
+    def retry_unsaved_sessions(self):
+        """
+        Try again to save every session whose save failed
+        :return:
+        """
+        unsaved, self.unsaved_sessions = self.unsaved_sessions, []
+        for results in unsaved:
+            self._save_session(results)
+
+    def discard_unsaved_sessions(self):
+        """
+        Give up on the sessions whose save failed
+        :return:
+        """
+        self.unsaved_sessions = []
+
+    def _on_session_committed(self, subject_state: Subject, results: dict):
+        """
+        Handles a stopped session once it is saved
+        :param subject_state: The subject's totals after the session
+        :param results: The saved session
+        :return:
+        """
+        if self.statistics_view is not None:
+            self.statistics_view.record_session(subject_state.name, results['start_time'],
+                                                results['duration_seconds'])
+        # Apply the subject's new totals to the registry
+        subject = self.subject_manager.apply_subject_state(subject_state)
+        self.subject_list_view.update_subject(subject)
+        if self.history_view is not None:
+            self.history_view.refresh()
+        # Refresh the views if the subject is still selected
+        if self.subject_list_view.current_subject_name() == subject.name:
             # Emit subjectUpdated signal
             self.subjectUpdated.emit(subject)
 
+    def _on_write_failed(self, error: Exception):
+        """
+        Handles a failed database command
+        :param error: The exception it raised
+        :return:
+        """
+        print(f"Database error: {error}")
+        self.errorOccurred.emit(str(error))
+
+    def shutdown(self):
+        """
+        Wait for queued database writes and stop the writer thread
+        :return:
+        """
+        # One last try for sessions that could not be saved
+        self.retry_unsaved_sessions()
+        self.db_writer.stop()
+
     def _update_session_progress(self):
         """
         Update session in progression view
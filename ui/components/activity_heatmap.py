@@ -0,0 +1,210 @@
+# ui/components/activity_heatmap.py
+from array import array
+from bisect import bisect_right
+from datetime import date
+from typing import Optional
+
+from PyQt6.QtCore import QObject, QRect, QRunnable, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter
+from PyQt6.QtWidgets import QToolTip, QWidget
+
+from core.connection import get_connection_manager
+from core.database import get_daily_stats
+from ui.styles.steam_theme import COLORS
+from utils.time_helpers import local_day_to_date, seconds_to_human_readable
+
+# Days shown at least, so a short history still fills a year
+MIN_DAYS = 53 * 7
+
+
+def build_day_values(daily_stats, today: Optional[int] = None):
+    """
+    Turn get_daily_stats rows into one seconds value per day
+    :param daily_stats: (day, session_count, total_seconds, ...) rows, oldest first
+    :param today: Last day to cover (default: today)
+    :return: tuple: (start_day, values); start_day is a Monday and values an
+        array with the seconds of each day from start_day on
+    """
+    end_day = today if today is not None else date.today().toordinal()
+    start_day = end_day - MIN_DAYS + 1
+    if daily_stats:
+        start_day = min(start_day, daily_stats[0][0])
+        end_day = max(end_day, daily_stats[-1][0])
+    # Columns are weeks starting on Monday
+    start_day -= date.fromordinal(start_day).weekday()
+
+    values = array('I', bytes(4 * (end_day - start_day + 1)))
+    for row in daily_stats:
+        values[row[0] - start_day] = row[2]
+    return start_day, values
+
+
+class HeatmapLoader(QRunnable):
+    """
+    Reads the per-day totals for the heatmap on a QThreadPool thread.
+
+    Results come back through the signals object, which lives on the GUI
+    thread, so they are delivered on its event loop.
+    """
+
+    class Signals(QObject):
+        # Request id, start day and the per-day values
+        loaded = pyqtSignal(int, int, object)
+        # Request id and the exception raised
+        failed = pyqtSignal(int, object)
+
+    def __init__(self, request_id: int, subject_name: Optional[str] = None):
+        """
+        :param request_id: Id echoed back with the result, to spot stale loads
+        :param subject_name: Subject to load, or None for every subject
+        """
+        super().__init__()
+        self.request_id = request_id
+        self.subject_name = subject_name
+        self.signals = self.Signals()
+
+    def run(self):
+        try:
+            start_day, values = build_day_values(get_daily_stats(self.subject_name))
+        except Exception as error:
+            self.signals.failed.emit(self.request_id, error)
+        else:
+            self.signals.loaded.emit(self.request_id, start_day, values)
+        finally:
+            # Pool threads come and go; don't leave their connections behind
+            get_connection_manager().release()
+
+
+class ActivityHeatmap(QWidget):
+    """
+    Calendar heatmap of time spent per day, one column per week.
+
+    Cells are painted directly from an array of seconds per day, and only the
+    cells inside the exposed region are drawn. The colour of a cell depends
+    on fixed thresholds, so adding time to one day only repaints that cell.
+    """
+
+    # Cell size and spacing, in pixels
+    CELL_SIZE = 11
+    CELL_GAP = 2
+
+    # Seconds a day needs to reach colour levels 1 to 4
+    LEVEL_THRESHOLDS = (1, 30 * 60, 60 * 60, 2 * 60 * 60)
+    LEVEL_COLORS = (COLORS["progress_bar_empty"], "#1d4f73", "#1a76b8", COLORS["accent_blue"],
+                    COLORS["accent_blue_hover"])
+
+    def __init__(self, parent=None):
+        """
+        :param parent: Optional parent widget
+        """
+        super().__init__(parent)
+        self.start_day = date.today().toordinal()
+        self.values = array('I')
+        self._colors = [QColor(color) for color in self.LEVEL_COLORS]
+        self.setMouseTracking(True)
+
+    # --- Public Methods ---
+    def set_days(self, start_day: int, values):
+        """
+        Show new data and repaint everything
+        :param start_day: Day number of values[0]; should be a Monday
+        :param values: Seconds per day, from start_day on
+        :return: None
+        """
+        self.start_day = start_day
+        self.values = array('I', values)
+        self.updateGeometry()
+        self.update()
+
+    def add_seconds(self, day: int, seconds: int) -> bool:
+        """
+        Add time to one day, repainting only its cell if its colour changed
+        :param day: Day number
+        :param seconds: Seconds to add
+        :return: True if the day is shown
+        """
+        index = day - self.start_day
+        if not 0 <= index < len(self.values):
+            return False
+        old_level = self.level(self.values[index])
+        self.values[index] += seconds
+        if self.level(self.values[index]) != old_level:
+            self.update(self.cell_rect(day))
+        return True
+
+    def level(self, seconds: int) -> int:
+        """
+        :param seconds: Seconds spent on a day
+        :return: int: Colour level, 0 (none) to 4
+        """
+        return bisect_right(self.LEVEL_THRESHOLDS, seconds)
+
+    def cell_rect(self, day: int) -> QRect:
+        """
+        :param day: Day number
+        :return: QRect: Where the day's cell is painted
+        """
+        week, weekday = divmod(day - self.start_day, 7)
+        step = self.CELL_SIZE + self.CELL_GAP
+        return QRect(week * step, weekday * step, self.CELL_SIZE, self.CELL_SIZE)
+
+    def day_at(self, x: int, y: int) -> Optional[int]:
+        """
+        :param x: Widget x coordinate
+        :param y: Widget y coordinate
+        :return: Day number of the cell under the point, or None
+        """
+        step = self.CELL_SIZE + self.CELL_GAP
+        week, weekday = x // step, y // step
+        if x < 0 or y < 0 or weekday > 6 or x % step >= self.CELL_SIZE or y % step >= self.CELL_SIZE:
+            return None
+        index = week * 7 + weekday
+        return self.start_day + index if index < len(self.values) else None
+
+    # --- Qt Overrides ---
+    def sizeHint(self) -> QSize:
+        step = self.CELL_SIZE + self.CELL_GAP
+        weeks = (len(self.values) + 6) // 7
+        return QSize(max(weeks, 1) * step - self.CELL_GAP, 7 * step - self.CELL_GAP)
+
+    def minimumSizeHint(self) -> QSize:
+        return self.sizeHint()
+
+    def paintEvent(self, event):
+        step = self.CELL_SIZE + self.CELL_GAP
+        exposed = event.rect()
+        first_week = max(exposed.left() // step, 0)
+        last_week = min(exposed.right() // step, (len(self.values) - 1) // 7)
+
+        # One batch of rectangles per colour instead of one fill per cell
+        batches = [[] for _ in self._colors]
+        values = self.values
+        level = self.level
+        for week in range(first_week, last_week + 1):
+            x = week * step
+            for weekday in range(7):
+                index = week * 7 + weekday
+                if index >= len(values):
+                    break
+                batches[level(values[index])].append(
+                    QRect(x, weekday * step, self.CELL_SIZE, self.CELL_SIZE))
+
+        painter = QPainter(self)
+        painter.setPen(Qt.PenStyle.NoPen)
+        for color, rects in zip(self._colors, batches):
+            if rects:
+                painter.setBrush(color)
+                painter.drawRects(rects)
+        painter.end()
+
+    def mouseMoveEvent(self, event):
+        position = event.position().toPoint()
+        day = self.day_at(position.x(), position.y())
+        if day is None:
+            QToolTip.hideText()
+        else:
+            seconds = self.values[day - self.start_day]
+            text = local_day_to_date(day).strftime("%a %Y-%m-%d")
+            text += f": {seconds_to_human_readable(seconds)}" if seconds else ": no sessions"
+            QToolTip.showText(event.globalPosition().toPoint(), text, self)
+        super().mouseMoveEvent(event)
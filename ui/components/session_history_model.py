@@ -0,0 +1,187 @@
+# ui/components/session_history_model.py
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from core.database import count_sessions, get_session_page
+from utils.time_helpers import local_day_start, seconds_to_human_readable
+
+
+class SessionHistoryModel(QAbstractTableModel):
+    """
+    Table model over the session history, newest first.
+
+    Sessions are read from the database one page at a time as the view
+    scrolls (canFetchMore / fetchMore), using keyset cursors so every page
+    costs the same however deep it is. Only the most recently used pages are
+    kept in memory; an evicted page is read again from the cursor it started
+    at. Cells are formatted when the view asks for them, so only visible rows
+    are ever formatted.
+    """
+
+    # Column headers
+    COLUMNS = ("Date", "Subject", "Duration", "EXP", "Streak", "Notes")
+    DATE_COLUMN, SUBJECT_COLUMN, DURATION_COLUMN, EXP_COLUMN, STREAK_COLUMN, NOTES_COLUMN = range(6)
+
+    # Positions of the fields in a session row (see core.database.SESSION_COLUMNS)
+    _START_TIME, _SUBJECT_NAME, _DURATION, _TOTAL_EXP, _STREAK, _NOTES = 2, 1, 4, 7, 8, 9
+
+    # Rows read per database query
+    PAGE_SIZE = 200
+    # Pages kept in memory at once
+    MAX_CACHED_PAGES = 16
+
+    def __init__(self, parent=None, fetch_page=get_session_page, count=count_sessions):
+        """
+        :param parent: Optional QObject owner
+        :param fetch_page: Page query, called like core.database.get_session_page
+        :param count: Row count query, called like core.database.count_sessions
+        """
+        super().__init__(parent)
+        self._fetch_page = fetch_page
+        self._count = count
+
+        # Current filters
+        self.subject_name: Optional[str] = None
+        self.start_day: Optional[int] = None
+        self.end_day: Optional[int] = None
+
+        # Cursor each known page starts after; the first page starts at None
+        self._page_cursors: List[Optional[tuple]] = [None]
+        # Page number -> rows, in least recently used order
+        self._pages: "OrderedDict[int, list]" = OrderedDict()
+        # Number of rows the view has been told about so far
+        self._loaded = 0
+        # Whether the last page has been read
+        self._exhausted = False
+        # Number of sessions matching the filters, from the daily rollups
+        self._total = 0
+
+    # --- Qt Model Interface ---
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+        column = index.column()
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if column in (self.DURATION_COLUMN, self.EXP_COLUMN, self.STREAK_COLUMN):
+                return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+            return None
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        row = self.session_at(index.row())
+        if row is None:
+            return None
+        if column == self.DATE_COLUMN:
+            return datetime.fromtimestamp(row[self._START_TIME]).strftime("%Y-%m-%d %H:%M")
+        if column == self.SUBJECT_COLUMN:
+            return row[self._SUBJECT_NAME]
+        if column == self.DURATION_COLUMN:
+            return seconds_to_human_readable(row[self._DURATION])
+        if column == self.EXP_COLUMN:
+            return f"{row[self._TOTAL_EXP]:,}"
+        if column == self.STREAK_COLUMN:
+            return str(row[self._STREAK])
+        if column == self.NOTES_COLUMN:
+            return row[self._NOTES] or ""
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        page = len(self._page_cursors) - 1
+        rows = self._read_page(page)
+        if not rows:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + len(rows) - 1)
+        self._loaded += len(rows)
+        self.endInsertRows()
+
+    # --- Public Methods ---
+    def set_filter(self, subject_name: Optional[str] = None,
+                   start_day: Optional[int] = None, end_day: Optional[int] = None):
+        """
+        Show only the matching sessions, starting again from the newest
+        :param subject_name: Only this subject's sessions, or None for all
+        :param start_day: First local day number to show, or None
+        :param end_day: Last local day number to show, or None
+        :return: None
+        """
+        self.subject_name = subject_name
+        self.start_day = start_day
+        self.end_day = end_day
+        self.refresh()
+
+    def refresh(self):
+        """
+        Drop every loaded page and read the first one again
+        :return: None
+        """
+        self.beginResetModel()
+        self._page_cursors = [None]
+        self._pages.clear()
+        self._loaded = 0
+        self._exhausted = False
+        self._total = self._count(self.subject_name, self.start_day, self.end_day)
+        self.endResetModel()
+        self.fetchMore()
+
+    def total_count(self) -> int:
+        """
+        :return: int: Number of sessions matching the filters, including rows not fetched yet
+        """
+        return self._total
+
+    def session_at(self, row: int) -> Optional[tuple]:
+        """
+        :param row: Row number
+        :return: Raw session row (see core.database.SESSION_COLUMNS), or None
+        """
+        if not 0 <= row < self._loaded:
+            return None
+        page, offset = divmod(row, self.PAGE_SIZE)
+        rows = self._pages.get(page)
+        if rows is None:
+            rows = self._read_page(page)
+        else:
+            self._pages.move_to_end(page)
+        return rows[offset] if offset < len(rows) else None
+
+    # --- Private Methods ---
+    def _read_page(self, page: int) -> list:
+        """
+        Read one page from the database and cache it, evicting the least recently used page
+        :param page: Page number; its start cursor must already be known
+        :return: list: The page's rows
+        """
+        start_time = local_day_start(self.start_day) if self.start_day is not None else None
+        end_time = local_day_start(self.end_day + 1) if self.end_day is not None else None
+        rows, next_cursor = self._fetch_page(self.subject_name, self._page_cursors[page],
+                                             self.PAGE_SIZE, start_time, end_time)
+        if page == len(self._page_cursors) - 1:
+            if next_cursor is None:
+                self._exhausted = True
+            else:
+                self._page_cursors.append(next_cursor)
+
+        self._pages[page] = rows
+        self._pages.move_to_end(page)
+        while len(self._pages) > self.MAX_CACHED_PAGES:
+            self._pages.popitem(last=False)
+        return rows
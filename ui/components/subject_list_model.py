@@ -0,0 +1,145 @@
+# ui/components/subject_list_model.py
+from typing import Dict, List, Optional
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from data.models import Subject
+
+
+class SubjectListModel(QAbstractListModel):
+    """
+    List model over the subject registry.
+
+    Rows are handed to the view in batches as it scrolls (canFetchMore /
+    fetchMore), so showing thousands of subjects only builds the visible part.
+    Changes are applied incrementally with row insert/remove/update
+    notifications instead of rebuilding the list.
+    """
+
+    # Role returning the Subject object of a row
+    SubjectRole = Qt.ItemDataRole.UserRole + 1
+
+    # Rows handed to the view per fetchMore
+    FETCH_BATCH = 200
+
+    def __init__(self, parent=None):
+        """
+        :param parent: Optional QObject owner
+        """
+        super().__init__(parent)
+        self._subjects: List[Subject] = []
+        # Name -> row, for O(1) updates
+        self._rows: Dict[str, int] = {}
+        # Number of rows the view has been told about so far
+        self._loaded = 0
+
+    # --- Qt Model Interface ---
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+        subject = self._subjects[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return subject.name
+        if role == self.SubjectRole:
+            return subject
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._subjects)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH, len(self._subjects) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    # --- Public Methods ---
+    def set_subjects(self, subjects: List[Subject]):
+        """
+        Replace every row
+        :param subjects: Subjects in display order
+        :return: None
+        """
+        self.beginResetModel()
+        self._subjects = list(subjects)
+        self._rows = {subject.name: row for row, subject in enumerate(self._subjects)}
+        self._loaded = min(self.FETCH_BATCH, len(self._subjects))
+        self.endResetModel()
+
+    def add_subject(self, subject: Subject):
+        """
+        Append one subject; the view only hears about it once it has fetched that far
+        :param subject: New subject
+        :return: None
+        """
+        row = len(self._subjects)
+        fully_loaded = self._loaded == row
+        if fully_loaded:
+            self.beginInsertRows(QModelIndex(), row, row)
+        self._subjects.append(subject)
+        self._rows[subject.name] = row
+        if fully_loaded:
+            self._loaded += 1
+            self.endInsertRows()
+
+    def remove_subject(self, name: str) -> bool:
+        """
+        Remove the named subject
+        :param name: Subject name
+        :return: True if it was found
+        """
+        row = self._rows.get(name)
+        if row is None:
+            return False
+        visible = row < self._loaded
+        if visible:
+            self.beginRemoveRows(QModelIndex(), row, row)
+        del self._subjects[row]
+        del self._rows[name]
+        for later_row in range(row, len(self._subjects)):
+            self._rows[self._subjects[later_row].name] = later_row
+        if visible:
+            self._loaded -= 1
+            self.endRemoveRows()
+        return True
+
+    def update_subject(self, subject: Subject, old_name: Optional[str] = None) -> bool:
+        """
+        Refresh the row of a subject whose data (or name) changed
+        :param subject: Subject with its new data
+        :param old_name: Previous name, if the subject was renamed
+        :return: True if it was found
+        """
+        name = old_name or subject.name
+        row = self._rows.get(name)
+        if row is None:
+            return False
+        if name != subject.name:
+            del self._rows[name]
+            self._rows[subject.name] = row
+        self._subjects[row] = subject
+        if row < self._loaded:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+        return True
+
+    def row_of(self, name: str) -> int:
+        """
+        :param name: Subject name
+        :return: int: Row of the subject, or -1 if it is not in the model
+        """
+        return self._rows.get(name, -1)
+
+    def subject_at(self, row: int) -> Optional[Subject]:
+        """
+        :param row: Row number
+        :return: Subject at that row, or None
+        """
+        return self._subjects[row] if 0 <= row < len(self._subjects) else None
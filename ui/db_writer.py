@@ -0,0 +1,90 @@
+# ui/db_writer.py
+import itertools
+import queue
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from core.connection import get_connection_manager
+
+
+class DatabaseWriter(QThread):
+    """
+    Runs database writes one at a time on a dedicated thread.
+
+    Commands are queued with submit() and executed in order, so the GUI thread
+    never waits on a commit. The outcome comes back through Qt signals, which
+    are delivered on the GUI thread's event loop.
+    """
+
+    # --- Custom Signals ---
+    # Command id and the value the command returned
+    commandFinished = pyqtSignal(int, object)
+    # Command id and the exception it raised
+    commandFailed = pyqtSignal(int, object)
+
+    def __init__(self, parent=None):
+        """
+        :param parent: Optional QObject owner
+        """
+        super().__init__(parent)
+        self._queue = queue.Queue()
+        self._ids = itertools.count(1)
+        # Callbacks by command id; only touched on the thread that owns the writer
+        self._callbacks = {}
+
+        self.commandFinished.connect(self._on_command_finished)
+        self.commandFailed.connect(self._on_command_failed)
+
+    # --- Public Methods ---
+    def submit(self, function, *args, on_done=None, on_error=None, **kwargs) -> int:
+        """
+        Queue function(*args, **kwargs) to run on the writer thread
+        :param function: Callable doing the database work
+        :param on_done: Optional callback receiving the return value, called on the GUI thread
+        :param on_error: Optional callback receiving the exception, called on the GUI thread
+        :return: int: Command id, as carried by commandFinished and commandFailed
+        """
+        command_id = next(self._ids)
+        if on_done or on_error:
+            self._callbacks[command_id] = (on_done, on_error)
+        self._queue.put((command_id, function, args, kwargs))
+        return command_id
+
+    def stop(self):
+        """Finish the queued commands, then end the thread and wait for it"""
+        if self.isRunning():
+            self._queue.put(None)
+            self.wait()
+
+    def pending(self) -> int:
+        """Number of commands waiting to run"""
+        return self._queue.qsize()
+
+    # --- Thread Body ---
+    def run(self):
+        try:
+            while True:
+                command = self._queue.get()
+                if command is None:
+                    break
+                command_id, function, args, kwargs = command
+                try:
+                    result = function(*args, **kwargs)
+                except Exception as error:
+                    self.commandFailed.emit(command_id, error)
+                else:
+                    self.commandFinished.emit(command_id, result)
+        finally:
+            # Each thread has its own connection; close this one with the thread
+            get_connection_manager().release()
+
+    # --- Private Slots ---
+    def _on_command_finished(self, command_id, result):
+        on_done, _ = self._callbacks.pop(command_id, (None, None))
+        if on_done:
+            on_done(result)
+
+    def _on_command_failed(self, command_id, error):
+        _, on_error = self._callbacks.pop(command_id, (None, None))
+        if on_error:
+            on_error(error)
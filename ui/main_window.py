@@ -111,13 +111,12 @@
 #
 
 
-from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QSplitter)
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QSplitter, QMessageBox)
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 
-# Main UI components
+# Main UI components; the secondary views are imported in _build_secondary_views
 from .views.subject_list_view import SubjectListView
 from .views.progression_view import ProgressionView
-from .views.statistics_view import StatisticsView
 
 # Controller
 from .app_logic import AppLogic
@@ -129,6 +128,11 @@ class MainWindow(QMainWindow):
     Arrange view components
     Bridge between controller and UI
     """
+
+    # --- Custom Signal ---
+    # Statistics and history views are built and attached
+    secondaryViewsReady = pyqtSignal()
+
     def __init__(self):
         # Parent constructor
         super().__init__()
@@ -149,10 +153,16 @@ class MainWindow(QMainWindow):
         # --- Instantiate UI Views ---
         self.subject_list_view = SubjectListView()
         self.progression_view = ProgressionView()
-        self.statistics_view = StatisticsView()
+        # Built after the first frame is shown
+        self.statistics_view = None
+        self.history_view = None
+        self._secondary_views_scheduled = False
 
         # --- Instantiate the Controller ---
-        self.app_logic = AppLogic(self.subject_list_view, self.progression_view, self.statistics_view)
+        # Loads the database in the background; the window does not wait for it
+        self.app_logic = AppLogic(self.subject_list_view, self.progression_view)
+        self.app_logic.errorOccurred.connect(self._show_error)
+        self.app_logic.sessionSaveFailed.connect(self._offer_save_retry)
 
         # --- Assemble Layout ---
         # 1. Left pane
@@ -160,11 +170,11 @@ class MainWindow(QMainWindow):
         # 2. Right pane
         # Main container
         right_pane_container = QWidget()
-        right_layout = QVBoxLayout(right_pane_container)
+        self.right_layout = QVBoxLayout(right_pane_container)
 
-        # Add widgets to container
-        right_layout.addWidget(self.progression_view)
-        right_layout.addWidget(self.statistics_view)
+        # Add widgets to container; the rest follow in _build_secondary_views
+        self.right_layout.addWidget(self.progression_view)
+        self.right_layout.addStretch(1)
 
         # Add container to splitter
         splitter.addWidget(right_pane_container)
@@ -175,3 +185,65 @@ class MainWindow(QMainWindow):
 
         # Initial size ratio of splitter panes
         splitter.setSizes([250, 750])
+
+    def paintEvent(self, event):
+        """
+        Build the secondary views once the first frame has been painted
+        :param event: Paint event
+        :return: None
+        """
+        super().paintEvent(event)
+        if not self._secondary_views_scheduled:
+            self._secondary_views_scheduled = True
+            # The child widgets are painted in the same pass; build after it
+            QTimer.singleShot(0, self._build_secondary_views)
+
+    def _build_secondary_views(self):
+        """
+        Build the statistics and history views and hand them to the controller
+        :return: None
+        """
+        # Not needed for the first frame, so imported only now
+        from .views.statistics_view import StatisticsView
+        from .views.session_history_view import SessionHistoryView
+
+        self.statistics_view = StatisticsView()
+        self.history_view = SessionHistoryView()
+        # Replace the placeholder stretch
+        self.right_layout.takeAt(self.right_layout.count() - 1)
+        self.right_layout.addWidget(self.statistics_view)
+        self.right_layout.addWidget(self.history_view, 1)
+
+        self.app_logic.attach_views(self.statistics_view, self.history_view)
+        self.secondaryViewsReady.emit()
+
+    def _show_error(self, message: str):
+        """
+        Show an error reported by the controller
+        :param message: Error text
+        :return: None
+        """
+        QMessageBox.warning(self, "EXP FARM", message)
+
+    def _offer_save_retry(self, message: str):
+        """
+        Ask whether to retry saving the sessions that could not be saved
+        :param message: Error text
+        :return: None
+        """
+        answer = QMessageBox.warning(self, "EXP FARM", f"{message}\n\nTry saving it again?",
+                                     QMessageBox.StandardButton.Retry | QMessageBox.StandardButton.Discard,
+                                     QMessageBox.StandardButton.Retry)
+        if answer == QMessageBox.StandardButton.Retry:
+            self.app_logic.retry_unsaved_sessions()
+        else:
+            self.app_logic.discard_unsaved_sessions()
+
+    def closeEvent(self, event):
+        """
+        Let queued database writes finish before the window closes
+        :param event: Close event
+        :return: None
+        """
+        self.app_logic.shutdown()
+        super().closeEvent(event)
@@ -0,0 +1,148 @@
+# ui/views/session_history_view.py
+
+from typing import List, Optional
+
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
+                             QCheckBox, QDateEdit, QTableView, QHeaderView,
+                             QAbstractItemView)
+from PyQt6.QtCore import QDate
+
+from ui.components.session_history_model import SessionHistoryModel
+
+
+class SessionHistoryView(QWidget):
+    """
+    Bottom section
+    Browse past sessions, filtered by subject and date range
+    """
+
+    # Text of the subject filter entry that shows every subject
+    ALL_SUBJECTS = "All subjects"
+
+    def __init__(self, model: Optional[SessionHistoryModel] = None):
+        """
+        :param model: History model to show; a new one reading the database by default
+        """
+        # Parent constructor
+        super().__init__()
+
+        # --- Create Widgets ---
+        # Header
+        self.header_label = QLabel("HISTORY")
+        self.header_label.setStyleSheet("font-weight: bold; font-size: 16px;")
+        # Subject filter
+        self.subject_filter = QComboBox()
+        self.subject_filter.addItem(self.ALL_SUBJECTS)
+        # Date range filter, off until checked
+        self.date_filter = QCheckBox("From")
+        today = QDate.currentDate()
+        self.start_date_edit = QDateEdit(today.addMonths(-1))
+        self.start_date_edit.setCalendarPopup(True)
+        self.end_date_edit = QDateEdit(today)
+        self.end_date_edit.setCalendarPopup(True)
+        self._set_date_edits_enabled(False)
+        # Number of matching sessions
+        self.count_label = QLabel("")
+        self.count_label.setObjectName("StatLabel")
+        # Session table, backed by a paged model
+        self.history_model = model or SessionHistoryModel(self)
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)
+        self.history_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.history_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.history_table.setAlternatingRowColors(True)
+        # Fixed row heights and column widths, so the view never measures the rows
+        self.history_table.verticalHeader().setVisible(False)
+        self.history_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.history_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.history_table.horizontalHeader().setStretchLastSection(True)
+
+        # --- Set up Layout ---
+        # Filter row
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(self.subject_filter)
+        filter_layout.addWidget(self.date_filter)
+        filter_layout.addWidget(self.start_date_edit)
+        filter_layout.addWidget(QLabel("to"))
+        filter_layout.addWidget(self.end_date_edit)
+        filter_layout.addStretch()
+        filter_layout.addWidget(self.count_label)
+        # Vertical Layout
+        main_layout = QVBoxLayout()
+        main_layout.addWidget(self.header_label)
+        main_layout.addLayout(filter_layout)
+        main_layout.addWidget(self.history_table)
+        # Apply Layout
+        self.setLayout(main_layout)
+
+        # --- Configure Signals ---
+        self.subject_filter.currentIndexChanged.connect(self._apply_filters)
+        self.date_filter.toggled.connect(self._on_date_filter_toggled)
+        self.start_date_edit.dateChanged.connect(self._apply_filters)
+        self.end_date_edit.dateChanged.connect(self._apply_filters)
+        self.history_model.modelReset.connect(self._update_count)
+
+    # --- Private Slots ---
+    def _on_date_filter_toggled(self, checked: bool):
+        """
+        Turn the date range filter on or off
+        :param checked: Whether the filter is on
+        :return: None
+        """
+        self._set_date_edits_enabled(checked)
+        self._apply_filters()
+
+    def _apply_filters(self, *_):
+        """
+        Reload the table with the current filter values
+        :return: None
+        """
+        subject_name = self.subject_filter.currentText()
+        if subject_name == self.ALL_SUBJECTS:
+            subject_name = None
+        start_day = end_day = None
+        if self.date_filter.isChecked():
+            start_day = self.start_date_edit.date().toPyDate().toordinal()
+            end_day = self.end_date_edit.date().toPyDate().toordinal()
+        self.history_model.set_filter(subject_name, start_day, end_day)
+
+    def _update_count(self):
+        """
+        Show the number of matching sessions
+        :return: None
+        """
+        total = self.history_model.total_count()
+        self.count_label.setText(f"{total:,} session{'' if total == 1 else 's'}")
+
+    def _set_date_edits_enabled(self, enabled: bool):
+        self.start_date_edit.setEnabled(enabled)
+        self.end_date_edit.setEnabled(enabled)
+
+    # --- Public Methods for Controller ---
+    def populate_subjects(self, subject_names: List[str]):
+        """
+        Fill the subject filter and load the newest sessions
+        :param subject_names: Names of every subject
+        :return: None
+        """
+        self.subject_filter.blockSignals(True)
+        self.subject_filter.clear()
+        self.subject_filter.addItem(self.ALL_SUBJECTS)
+        self.subject_filter.addItems(subject_names)
+        self.subject_filter.blockSignals(False)
+        self._apply_filters()
+
+    def add_subject(self, subject_name: str):
+        """
+        Offer a new subject in the subject filter
+        :param subject_name: Subject name
+        :return: None
+        """
+        self.subject_filter.addItem(subject_name)
+
+    def refresh(self):
+        """
+        Reload the table, e.g. after a session was saved
+        :return: None
+        """
+        self.history_model.refresh()
@@ -1,8 +1,10 @@
 # ui/views/statistics_view.py
 
-from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QFrame
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel, QFrame, QCheckBox, QScrollArea
+from PyQt6.QtCore import Qt, QThreadPool
 from data.models import Subject # Import the Subject class for type hinting
+from ui.components.activity_heatmap import ActivityHeatmap, HeatmapLoader
+from utils.time_helpers import timestamp_to_local_day
 import datetime
 
 
@@ -32,22 +34,49 @@ class StatisticsView(QWidget):
         self.total_hours_label = QLabel("Total: 0.0 hours")
         self.total_hours_label.setObjectName("StatLabel")
 
+        # Activity heatmap, scrolled horizontally when the history is long
+        self.heatmap = ActivityHeatmap()
+        self.heatmap_scroll = QScrollArea()
+        self.heatmap_scroll.setWidget(self.heatmap)
+        self.heatmap_scroll.setWidgetResizable(False)
+        self.heatmap_scroll.setFrameShape(QFrame.Shape.NoFrame)
+        self.heatmap_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # Heatmap of every subject instead of the selected one
+        self.all_subjects_check = QCheckBox("All subjects")
+
         # --- Set Up Layout ---
         # Horizontal Box
-        main_layout = QHBoxLayout(self.main_frame)
-        main_layout.setSpacing(20)
-        main_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        labels_layout = QHBoxLayout()
+        labels_layout.setSpacing(20)
+        labels_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # Add labels
-        main_layout.addWidget(self.last_session_label)
-        main_layout.addWidget(self.streak_label)
-        main_layout.addWidget(self.total_hours_label)
+        labels_layout.addWidget(self.last_session_label)
+        labels_layout.addWidget(self.streak_label)
+        labels_layout.addWidget(self.total_hours_label)
+        labels_layout.addWidget(self.all_subjects_check)
+
+        # Labels above the heatmap
+        main_layout = QVBoxLayout(self.main_frame)
+        main_layout.addLayout(labels_layout)
+        main_layout.addWidget(self.heatmap_scroll)
 
         # Main frame layout
         self_layout = QHBoxLayout(self)
         self_layout.addWidget(self.main_frame)
         self.setLayout(self_layout)
 
+        # --- Heatmap Loading ---
+        # Loads run on the shared thread pool; only the latest request is shown
+        self._thread_pool = QThreadPool.globalInstance()
+        self._subject_name = None
+        self._heatmap_scope = False  # Sentinel: nothing shown yet
+        self._heatmap_request = 0
+        self._heatmap_loader = None
+
+        # --- Configure Signals ---
+        self.all_subjects_check.toggled.connect(self._refresh_heatmap)
+
     # --- Public Methods ---
     def update_view(self, subject: Subject):
         """
@@ -85,3 +114,80 @@ class StatisticsView(QWidget):
             self.streak_label.setText("Streak: 0 days 🔥")
             self.total_hours_label.setText("Total: 0.0 hours")
 
+        # Reload the heatmap only if it should now show another subject
+        self._subject_name = subject.name if subject else None
+        self._refresh_heatmap()
+
+    def record_session(self, subject_name: str, start_time: float, duration_seconds: int):
+        """
+        Add a saved session to the heatmap without reloading it
+        :param subject_name: Subject of the session
+        :param start_time: Session start, epoch seconds
+        :param duration_seconds: Session length
+        :return: None
+        """
+        if self._heatmap_scope not in (None, subject_name):
+            return
+        if self._heatmap_loader is not None:
+            # The running load may have read the rollups before this session was saved
+            self._load_heatmap(self._heatmap_scope)
+        else:
+            self.heatmap.add_seconds(timestamp_to_local_day(start_time), duration_seconds)
+
+    # --- Heatmap Loading ---
+    def _refresh_heatmap(self, *_):
+        """
+        Load the heatmap for the selected subject, or for all subjects, unless it already shows it
+        :return: None
+        """
+        scope = None if self.all_subjects_check.isChecked() else self._subject_name
+        if scope is None and not self.all_subjects_check.isChecked():
+            # No subject selected
+            return
+        if scope != self._heatmap_scope:
+            self._load_heatmap(scope)
+
+    def _load_heatmap(self, scope):
+        """
+        Start loading the heatmap on the thread pool
+        :param scope: Subject name, or None for all subjects
+        :return: None
+        """
+        self._heatmap_scope = scope
+        self._heatmap_request += 1
+        loader = HeatmapLoader(self._heatmap_request, scope)
+        loader.signals.loaded.connect(self._on_heatmap_loaded)
+        loader.signals.failed.connect(self._on_heatmap_failed)
+        # Keep the loader (and its signals object) alive until it reports back
+        self._heatmap_loader = loader
+        self._thread_pool.start(loader)
+
+    def _on_heatmap_loaded(self, request_id: int, start_day: int, values):
+        """
+        Show loaded heatmap data, unless a newer load has been started
+        :param request_id: Id of the load
+        :param start_day: Day number of the first value
+        :param values: Seconds per day
+        :return: None
+        """
+        if request_id != self._heatmap_request:
+            return
+        self._heatmap_loader = None
+        self.heatmap.set_days(start_day, values)
+        self.heatmap.adjustSize()
+        # Most recent weeks first in view
+        scroll_bar = self.heatmap_scroll.horizontalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+
+    def _on_heatmap_failed(self, request_id: int, error: Exception):
+        """
+        Report a failed heatmap load
+        :param request_id: Id of the load
+        :param error: The exception it raised
+        :return: None
+        """
+        if request_id != self._heatmap_request:
+            return
+        self._heatmap_loader = None
+        print(f"Heatmap error: {error}")
+
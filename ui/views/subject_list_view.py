@@ -1,8 +1,13 @@
 # ui/views/subject_list_view.py
 
+from typing import Optional
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel,
-                             QListWidget, QPushButton)
-from PyQt6.QtCore import pyqtSignal
+                             QListView, QPushButton)
+from PyQt6.QtCore import pyqtSignal, QModelIndex
+
+from data.models import Subject
+from ui.components.subject_list_model import SubjectListModel
 
 
 class SubjectListView(QWidget):
@@ -25,8 +30,12 @@ class SubjectListView(QWidget):
         # Left Pane Header
         self.header_label = QLabel("KNOWLEDGE")
         self.header_label.setStyleSheet("font-weight: bold; font-size: 16px;")
-        # Subject List
-        self.subjects_list = QListWidget()
+        # Subject List, backed by a lazily fetched model
+        self.subjects_model = SubjectListModel(self)
+        self.subjects_list = QListView()
+        self.subjects_list.setModel(self.subjects_model)
+        # Every row has the same height, so the view never measures them all
+        self.subjects_list.setUniformItemSizes(True)
         # Add Button
         self.add_subject_btn = QPushButton("Add New Subject")
         self.add_subject_btn.setObjectName("PrimaryButton")
@@ -41,29 +50,71 @@ class SubjectListView(QWidget):
         self.setLayout(main_layout)
 
         # --- Configure Signals ---
-        self.subjects_list.currentTextChanged.connect(self._on_subject_selected)
+        self.subjects_list.selectionModel().currentChanged.connect(self._on_current_changed)
         self.add_subject_btn.clicked.connect(self.addSubjectClicked.emit)
 
     # Receive signal from subjects_list
-    def _on_subject_selected(self, subject_name: str):
+    def _on_current_changed(self, current: QModelIndex, previous: QModelIndex):
         """
         Handles the event when a subject is selected in the list
-        :param subject_name: Name of selected subject
+        :param current: Index of the selected row
+        :param previous: Index of the previously selected row
         :return: None
         """
+        subject_name = current.data() if current.isValid() else None
         if subject_name:
             self.subjectSelected.emit(subject_name)
 
-    # Public method for controller
+    # Public methods for controller
     def populate_subjects(self, subjects: list):
         """
-        AppLogic controller will call to fill the list with subject names
+        AppLogic controller will call to fill the list with subjects
         :param subjects: Subject item list
         :return: None
         """
-        # Clear list before adding new items
-        self.subjects_list.clear()
-        # Extract subject names to list
-        subject_names = [subject.name for subject in subjects]
-        self.subjects_list.addItems(subject_names)
+        self.subjects_model.set_subjects(subjects)
+
+    def add_subject(self, subject: Subject):
+        """
+        Append a new subject to the list
+        :param subject: New subject
+        :return: None
+        """
+        self.subjects_model.add_subject(subject)
+
+    def remove_subject(self, name: str):
+        """
+        Remove a subject from the list
+        :param name: Subject name
+        :return: None
+        """
+        self.subjects_model.remove_subject(name)
 
+    def update_subject(self, subject: Subject, old_name: Optional[str] = None):
+        """
+        Refresh a subject's row after its data or name changed
+        :param subject: Subject with its new data
+        :param old_name: Previous name, if it was renamed
+        :return: None
+        """
+        self.subjects_model.update_subject(subject, old_name)
+
+    def current_subject_name(self) -> Optional[str]:
+        """
+        :return: Name of the selected subject, or None
+        """
+        index = self.subjects_list.currentIndex()
+        return index.data() if index.isValid() else None
+
+    def select_subject(self, name: str):
+        """
+        Select a subject by name, fetching rows until it is loaded
+        :param name: Subject name
+        :return: None
+        """
+        row = self.subjects_model.row_of(name)
+        if row < 0:
+            return
+        while row >= self.subjects_model.rowCount() and self.subjects_model.canFetchMore():
+            self.subjects_model.fetchMore()
+        self.subjects_list.setCurrentIndex(self.subjects_model.index(row))
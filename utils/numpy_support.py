@@ -0,0 +1,20 @@
+# utils/numpy_support.py
+"""
+numpy is optional: only the batch EXP and level functions use it. It is
+imported when one of them first runs rather than at module import, so the
+GUI and the CLI start without paying for it.
+"""
+
+
+def require_numpy(feature):
+    """
+    Return the numpy module, importing it on first use
+    :param feature: What needs numpy, for the error message
+    :return: The numpy module
+    :raises ImportError: If numpy is not installed
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(f"numpy is required for {feature}") from None
+    return numpy
@@ -1,4 +1,6 @@
 # utils/time_helpers.py
+from datetime import date, datetime
+
 def seconds_to_human_readable(seconds):
     """
     Convert seconds to human-readable format like 2h 15m 30s
@@ -29,3 +31,54 @@ def minutes_to_seconds(minutes):
     return minutes * 60
 
 
+def timestamp_to_local_day(timestamp):
+    """
+    Convert an epoch timestamp to a local day number
+    :param timestamp: seconds since the epoch
+    :return: int: Local calendar date as a proleptic Gregorian ordinal (date.toordinal)
+    """
+    return date.fromtimestamp(timestamp).toordinal()
+
+
+def local_day_and_offset(timestamp):
+    """
+    Convert an epoch timestamp to its local day number and the UTC offset in effect
+    :param timestamp: seconds since the epoch
+    :return: tuple: (day as in timestamp_to_local_day, UTC offset in seconds)
+    """
+    local = datetime.fromtimestamp(timestamp).astimezone()
+    return local.date().toordinal(), int(local.utcoffset().total_seconds())
+
+
+def local_day_to_date(day):
+    """
+    Convert a local day number back to a date
+    :param day: Day number as returned by timestamp_to_local_day
+    :return: datetime.date
+    """
+    return date.fromordinal(day)
+
+
+def local_day_start(day):
+    """
+    Epoch time of local midnight at the start of a day
+    :param day: Day number as returned by timestamp_to_local_day
+    :return: float seconds since the epoch
+    """
+    return datetime.combine(date.fromordinal(day), datetime.min.time()).timestamp()
+
+
+def parse_timestamp(value):
+    """
+    Convert epoch seconds or an ISO 8601 string to epoch seconds
+    :param value: number, numeric string or ISO 8601 string (None or "" allowed)
+    :return: float seconds since the epoch, or None for an empty value
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()